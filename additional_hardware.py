@@ -17,23 +17,26 @@ class PowerSupply(Component):
     @power.setter
     def power(self, hasPower: bool or int):
         self._power = intToBool(hasPower)
+        self.stimulate()
 
     def togglePower(self):
         self._power = not self._power
+        self.stimulate()
 
     def turnOn(self):
         self._power = True
+        self.stimulate()
 
     def turnOff(self):
         self._power = False
+        self.stimulate()
 
-    @property
-    def state(self) -> {str: any}:
-        state = Component.state.__get__(self)
+    def internalState(self) -> {str: any}:
+        state = Component.internalState(self)
         state["power"] = self._power
         return state
 
-    @state.setter
+    @Component.state.setter
     def state(self, state: {str: any}):
         prevState = self.state
         Component.state.__set__(self, state)
@@ -69,23 +72,26 @@ class Button(Component):
     @pressed.setter
     def pressed(self, isPressed: bool or int):
         self._pressed = intToBool(isPressed)
+        self.stimulate()
 
     def togglePress(self):
         self._pressed = not self._pressed
+        self.stimulate()
 
     def press(self):
         self._pressed = True
+        self.stimulate()
 
     def unpress(self):
         self._pressed = False
+        self.stimulate()
 
-    @property
-    def state(self) -> {str: any}:
-        state = Component.state.__get__(self)
+    def internalState(self) -> {str: any}:
+        state = Component.internalState(self)
         state["pressed"] = self._pressed
         return state
 
-    @state.setter
+    @Component.state.setter
     def state(self, state: {str: any}):
         prevState = self.state
         Component.state.__set__(self, state)
@@ -129,17 +135,18 @@ class Clock(Component):
     @output.setter
     def output(self, output: bool):
         self._output = intToBool(output)
+        self.stimulate()
 
     def step(self):
         self._output = not self._output
+        self.stimulate()
 
-    @property
-    def state(self) -> {str: any}:
-        state = Component.state.__get__(self)
+    def internalState(self) -> {str: any}:
+        state = Component.internalState(self)
         state["output"] = self._output
         return state
 
-    @state.setter
+    @Component.state.setter
     def state(self, state: {str: any}):
         prevState = self.state
         Component.state.__set__(self, state)
@@ -175,15 +182,14 @@ class QuadNANDGate(Component):
             ),
             pinValues, connections
         )
+        self._inputBusA = self.bus("A1..A4")
+        self._inputBusB = self.bus("B1..B4")
+        self._outputBus = self.bus("Y1..Y4")
 
     def response(self):
         high, low = self.getPinsStates(("VCC", "GND"))
         self.makePinsPassive(slice(None))
-        for gate in range(1, 5):
-            if self.getPin(f"A{gate}") and self.getPin(f"B{gate}"):
-                self.setPinState(f"Y{gate}", low)
-            else:
-                self.setPinState(f"Y{gate}", high)
+        self._outputBus.driveStates(~(self._inputBusA.read() & self._inputBusB.read()) & 0xF, high, low)
 
 class Resistor(Component):
     def __init__(self, pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple()):
@@ -1,9 +1,37 @@
 from instruction_set import InstructionSet, AddressingMode
+from linker import ObjectFile, Section
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import glob
+import os
+import re
+
+_batchAssembler = None
+
+def _initialiseBatchWorker(instructionSet: InstructionSet):
+    global _batchAssembler
+    _batchAssembler = Assembler(instructionSet)
+
+def _assembleBatchFile(fileName: str, outputFileName: str, startAddress: int, symbols: {str: str}, labels: {str: int}) -> str:
+    try:
+        with open(fileName, "r") as file:
+            assembly = file.read()
+        _batchAssembler.symbols = symbols
+        _batchAssembler.labels = labels
+        machineCode = _batchAssembler.assemble(assembly, startAddress)
+        with open(outputFileName, "wb") as file:
+            file.write(machineCode)
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
 
 class Assembler:
     class AssemblerError(Exception):
         pass
 
+    symbolPattern = re.compile(r"[$%]?[\w.]+")
+    formatVersion = 1
+
     def __init__(self, instructionSet: InstructionSet, symbols: {str: str} or [[str, str]] = None, labels: {str: int} or [[str, int]] = None):
         if not isinstance(instructionSet, InstructionSet):
             raise TypeError(f"An assembler must be associated with an instruction set ({instructionSet} is not valid)")
@@ -128,6 +156,16 @@ class Assembler:
             lines = tuple(assembly)
         instructionCalls = list()
         labelLines = dict()
+        symbols = self._symbols
+        resolved = dict()
+        def resolve(identifier: str, chain: [str,] = tuple()) -> str:
+            if identifier not in resolved:
+                if identifier in chain:
+                    raise Assembler.AssemblerError(f"Symbol {identifier} is defined in terms of itself")
+                meaning = symbols.get(identifier)
+                resolved[identifier] = identifier if meaning is None else Assembler.symbolPattern.sub(lambda match: resolve(match.group(), chain + (identifier,)), meaning)
+            return resolved[identifier]
+        substitute = lambda match: resolve(match.group())
         for line in lines:
             try:
                 line = line[:line.index(";")]
@@ -140,6 +178,7 @@ class Assembler:
                 elif "=" in line:
                     split = line.index("=")
                     self.addSymbol(line[:split], line[split + 1:])
+                    resolved.clear()
                 else:
                     try:
                         split = line.index(" ")
@@ -147,8 +186,8 @@ class Assembler:
                         split = len(line)
                     mnemonic = line[:split]
                     operands = line[split:].strip()
-                    for symbol in self.symbols:
-                        operands = operands.replace(symbol, self.symbols[symbol])
+                    if symbols and operands:
+                        operands = Assembler.symbolPattern.sub(substitute, operands)
                     instructionCalls.append((mnemonic, operands))
         return instructionCalls, labelLines
 
@@ -164,26 +203,124 @@ class Assembler:
                 pass
         raise Assembler.AssemblerError(f"Could not identify addressing mode: '{mnemonic} {operands}'")
 
+    def _assembleSource(self, assembly: str or [str,], externals: [str,] = tuple()) -> [bytearray, {str: int}, [[int, str, AddressingMode],]]:
+        machineCode = bytearray()
+        lines, labels = self._preprocessing(assembly)
+        offsets = dict()
+        labelUses = list()
+        labelIdentifiers = frozenset(self.labelIdentifiers + tuple(labels.values()) + tuple(externals))
+        for line in range(len(lines)):
+            if line in labels:
+                offsets[labels[line]] = len(machineCode)
+            addressingMode, lineMachineCode, lineLabelUses = self._assembleLine(lines[line], labelIdentifiers)
+            for byte, identifier in lineLabelUses:
+                labelUses.append((len(machineCode) + byte, identifier, addressingMode))
+            machineCode += lineMachineCode
+        if len(lines) in labels:
+            offsets[labels[len(lines)]] = len(machineCode)
+        return machineCode, offsets, labelUses
+
     def assemble(self, assembly: str or [str,], startAddress: int = 0) -> bytes:
         prevSymbols = self._symbols.copy()
         prevLabels = self._labels.copy()
         try:
-            machineCode = bytes()
-            lines, labels = self._preprocessing(assembly)
-            labelUses = list()
-            labelIdentifiers = self.labelIdentifiers + tuple(labels.values())
-            for line in range(len(lines)):
-                if line in labels:
-                    self.addLabel(labels[line], len(machineCode) + startAddress)
-                addressingMode, lineMachineCode, lineLabelUses = self._assembleLine(lines[line], labelIdentifiers)
-                for byte, identifier in lineLabelUses:
-                    labelUses.append((len(machineCode) + byte, identifier, addressingMode))
-                machineCode += lineMachineCode
+            machineCode, offsets, labelUses = self._assembleSource(assembly)
+            for label, offset in offsets.items():
+                self.addLabel(label, offset + startAddress)
             for address, label, addressingMode in labelUses:
                 assembledLabel = addressingMode.assembleLabel(self._labels[label], address + startAddress)
-                machineCode = machineCode[:address] + assembledLabel + machineCode[address + len(assembledLabel):]
-            return machineCode
+                machineCode[address:address + len(assembledLabel)] = assembledLabel
+            return bytes(machineCode)
         except Exception as error:
             self._symbols = prevSymbols
             self._labels = prevLabels
             raise error
+
+    def hashSource(self, assembly: str or [str,], section: str = "code", externals: [str,] = tuple()) -> str:
+        if not isinstance(assembly, str):
+            assembly = "\n".join(assembly)
+        key = (ObjectFile.formatVersion, self._instructionSet.signature, assembly, str(section), sorted(externals), sorted(self._symbols.items()))
+        return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+    def assembleObject(self, assembly: str or [str,], section: str = "code", externals: [str,] = tuple()) -> ObjectFile:
+        sourceHash = self.hashSource(assembly, section, externals)
+        prevSymbols = self._symbols.copy()
+        try:
+            machineCode, offsets, labelUses = self._assembleSource(assembly, externals)
+        finally:
+            self._symbols = prevSymbols
+        presetLabels = sorted(set(label for address, label, addressingMode in labelUses).difference(offsets, externals))
+        if presetLabels:
+            raise Assembler.AssemblerError(f"Relocatable objects cannot use the assembler's preset labels ({', '.join(presetLabels)}), declare them as externals instead")
+        relocations = tuple((address, label, addressingMode.identifier) for address, label, addressingMode in labelUses)
+        return ObjectFile((Section(section, machineCode, offsets, relocations),), sourceHash)
+
+    @staticmethod
+    def batchSources(sources: str or [str,]) -> [str,]:
+        if isinstance(sources, str):
+            sources = (sources,)
+        fileNames = list()
+        for source in sources:
+            if os.path.isdir(source):
+                source = os.path.join(source, "*.txt")
+            for fileName in sorted(glob.glob(source)):
+                if fileName not in fileNames:
+                    fileNames.append(fileName)
+        return fileNames
+
+    def assembleBatch(self, sources: str or [str,], outputDirectory: str = "saved_machine_code", startAddress: int = 0, workers: int = None, cacheFileName: str = ".assembly_cache.json") -> {str: [str,] or {str: str}}:
+        os.makedirs(outputDirectory, exist_ok=True)
+        cacheFileName = os.path.join(outputDirectory, cacheFileName)
+        try:
+            with open(cacheFileName, "r") as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            cache = dict()
+        results = {"assembled": list(), "cached": list(), "failed": dict()}
+        jobs = list()
+        hashes = dict()
+        signature = hashlib.sha256(json.dumps((Assembler.formatVersion, self._instructionSet.signature)).encode()).hexdigest()
+        for fileName in Assembler.batchSources(sources):
+            outputFileName = os.path.join(outputDirectory, os.path.splitext(os.path.basename(fileName))[0] + ".bin")
+            if outputFileName in hashes:
+                results["failed"][fileName] = f"AssemblerError: {outputFileName} is already the output of another source"
+                continue
+            with open(fileName, "rb") as file:
+                key = (signature, file.read().hex(), startAddress, sorted(self._symbols.items()), sorted(self._labels.items()))
+            hashes[outputFileName] = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+            if cache.get(outputFileName) == hashes[outputFileName] and os.path.exists(outputFileName):
+                results["cached"].append(fileName)
+            else:
+                jobs.append((fileName, outputFileName, startAddress, self._symbols.copy(), self._labels.copy()))
+        if len(jobs) > 1 and workers != 1:
+            with ProcessPoolExecutor(workers, initializer=_initialiseBatchWorker, initargs=(self._instructionSet,)) as executor:
+                errors = tuple(executor.map(_assembleBatchFile, *zip(*jobs)))
+        else:
+            _initialiseBatchWorker(self._instructionSet)
+            errors = tuple(_assembleBatchFile(*job) for job in jobs)
+        for (fileName, outputFileName, startAddress, symbols, labels), error in zip(jobs, errors):
+            if error is None:
+                results["assembled"].append(fileName)
+                cache[outputFileName] = hashes[outputFileName]
+            else:
+                results["failed"][fileName] = error
+                cache.pop(outputFileName, None)
+        with open(cacheFileName, "w") as file:
+            json.dump(cache, file, indent=2)
+        return results
+
+    def assembleFile(self, fileName: str, objectFileName: str = None, section: str = "code", externals: [str,] = tuple()) -> ObjectFile:
+        with open(fileName, "r") as file:
+            assembly = file.read()
+        if objectFileName is None:
+            objectFileName = os.path.splitext(fileName)[0] + ".o"
+        sourceHash = self.hashSource(assembly, section, externals)
+        try:
+            objectFile = ObjectFile.load(objectFileName)
+            if objectFile.sourceHash == sourceHash:
+                return objectFile
+        except (OSError, ObjectFile.ObjectFormatError):
+            pass
+        objectFile = self.assembleObject(assembly, section, externals)
+        objectFile.save(objectFileName)
+        return objectFile
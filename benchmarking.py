@@ -0,0 +1,132 @@
+from general import bytesToTuple, intToTuple, tupleToInt
+from component import Component, Pin, Wire
+from processor import FunctionalCore
+from memory import ReadOnlyMemory as ROM, RandomAccessMemory as RAM, MemoryMap
+from instruction_set import InstructionSet
+from instruction_set_65C02.instructions import instructions
+import random
+import timeit
+import sys
+
+# Reference implementations the lookup tables replaced
+
+def legacyBytesToTuple(value: bytes) -> [bool,]:
+    if not isinstance(value, bytes):
+        raise TypeError(f"bytesToTuple converts bytes objects not {type(value).__name__}")
+    output = list()
+    for byte in value:
+        for bit in range(7, -1, -1):
+            bitValue = 2 ** bit
+            output.append(bool(byte // bitValue))
+            byte %= bitValue
+    return tuple(output[::-1])
+
+def legacyTupleToInt(value: [bool,]) -> int:
+    output = 0
+    for bit in range(len(value)):
+        output += value[bit] * 2 ** bit
+    return output
+
+def compare(name: str, legacy: callable, current: callable, arguments: [any,], number: int = 100000):
+    for argument in arguments:
+        if legacy(argument) != current(argument):
+            raise AssertionError(f"{name}: results differ for {argument}")
+    legacyTime = timeit.timeit(lambda: [legacy(argument) for argument in arguments], number=number // len(arguments))
+    currentTime = timeit.timeit(lambda: [current(argument) for argument in arguments], number=number // len(arguments))
+    print(f"{name:<24}{legacyTime * 1e9 / number:>10.0f} ns{currentTime * 1e9 / number:>10.0f} ns{legacyTime / currentTime:>8.1f}x")
+
+def slotNames(cls: type) -> [str,]:
+    names = list()
+    for base in cls.__mro__:
+        for name in getattr(base, "__slots__", tuple()):
+            if name != "__weakref__":
+                names.append(name)
+    return tuple(names)
+
+def dictBackedSize(instance: object, legacyTypes: {type: type}) -> int:
+    # Size of the same object if its attributes lived in a per-instance __dict__
+    cls = type(instance)
+    if cls not in legacyTypes:
+        legacyTypes[cls] = type(f"Legacy{cls.__name__}", (cls,), {"__del__": lambda self: None})
+    legacyInstance = object.__new__(legacyTypes[cls])
+    for name in slotNames(cls):
+        legacyInstance.__dict__[name] = getattr(instance, name, None)
+    return sys.getsizeof(legacyInstance) + sys.getsizeof(legacyInstance.__dict__)
+
+def footprint(components: [Component,]):
+    nodes = dict()
+    for component in components:
+        for pin in component.pinsSelect(slice(None)):
+            net = pin.net
+            nodes.update(dict.fromkeys(net.pins + net.wires))
+    nodes = tuple(nodes)
+    connections = list()
+    for node in nodes:
+        if isinstance(node, Pin) and node.connection is not None:
+            connections.append(node.connection)
+        elif isinstance(node, Wire):
+            connections.extend(node.connections)
+    legacyTypes = dict()
+    print(f"{'objects':<24}{'count':>8}{'slots':>13}{'dicts':>13}{'saved':>8}")
+    totals = [0, 0]
+    for name, objects in (("Pin", [node for node in nodes if isinstance(node, Pin)]),
+                          ("Wire", [node for node in nodes if isinstance(node, Wire)]),
+                          ("Connection", connections)):
+        slotted = sum(sys.getsizeof(instance) for instance in objects)
+        legacy = sum(dictBackedSize(instance, legacyTypes) for instance in objects)
+        totals[0] += slotted
+        totals[1] += legacy
+        print(f"{name:<24}{len(objects):>8}{slotted:>11} B{legacy:>11} B{1 - slotted / max(legacy, 1):>8.0%}")
+    print(f"{'board total':<24}{len(nodes) + len(connections):>8}{totals[0]:>11} B{totals[1]:>11} B{1 - totals[0] / totals[1]:>8.0%}")
+
+def conversions():
+    random.seed(0)
+    bytesData = tuple(random.randbytes(1) for test in range(256))
+    wordData = tuple(random.randbytes(2) for test in range(256))
+    byteBits = tuple(legacyBytesToTuple(value) for value in bytesData)
+    addressBits = tuple(legacyBytesToTuple(value)[:15] for value in wordData)
+    print(f"{'function':<24}{'old':>13}{'new':>13}{'speedup':>9}")
+    compare("bytesToTuple (8 bit)", legacyBytesToTuple, bytesToTuple, bytesData)
+    compare("bytesToTuple (16 bit)", legacyBytesToTuple, bytesToTuple, wordData)
+    compare("tupleToInt (8 bit)", legacyTupleToInt, tupleToInt, byteBits)
+    compare("tupleToInt (15 bit)", legacyTupleToInt, tupleToInt, addressBits)
+    compare("intToTuple (16 bit)", lambda value: legacyBytesToTuple(value.to_bytes(2, "big")), lambda value: intToTuple(value, 16), tuple(range(0, 65536, 257)))
+
+def translation(instructionCount: int = 200000):
+    program = bytes((
+        0xA2, 0x00,         # LDX #$00
+        0xBD, 0x00, 0x81,   # LDA $8100,X
+        0x9D, 0x00, 0x03,   # STA $0300,X
+        0xE8,               # INX
+        0xD0, 0xF7,         # BNE -9
+        0xA0, 0x00,         # LDY #$00
+        0x88,               # DEY
+        0xD0, 0xFD,         # BNE -3
+        0x4C, 0x00, 0x80    # JMP $8000
+    ))
+    image = bytearray(32768)
+    image[:len(program)] = program
+    image[0x100:0x200] = bytes(range(256))
+    image[0x7FFC:0x7FFE] = (0x8000).to_bytes(2, "little")
+    results = list()
+    print(f"{'execution mode':<24}{'instructions/s':>16}")
+    for translate in False, True:
+        ram = RAM()
+        memoryMap = MemoryMap(((0x0000, 0x8000, ram, True), (0x8000, 0x10000, ROM(bytes(image)), False)))
+        core = FunctionalCore(InstructionSet(instructions), memoryMap, translate)
+        core.reset()
+        startTime = timeit.default_timer()
+        core.run(instructionCount)
+        elapsed = timeit.default_timer() - startTime
+        results.append(((core.PC, core.A, core.X, core.Y, core.P, core.S), bytes(ram.data)))
+        print(f"{'translated' if translate else 'interpreted':<24}{instructionCount / elapsed:>16.0f}")
+    if results[0] != results[1]:
+        raise AssertionError("Translated execution diverged from the interpreter")
+
+if __name__ == "__main__":
+    conversions()
+    print()
+    translation()
+    print()
+    import main
+    footprint(main.presetSimulator.componentDict.values())
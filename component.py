@@ -1,6 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from general import intToBool, bytesToTuple, sliceToTuple, BinaryElectric as BinElec
+import re
 
 class Component(ABC):
     class PinNotFoundError(KeyError):
@@ -19,6 +20,8 @@ class Component(ABC):
         def __init__(self, key: str, state: {str: any}):
             super().__init__(f"Insufficient data to load state ({state} has no '{key}' state)")
 
+    pinRangePattern = re.compile(r"\s*(\D*)(\d+)\s*\.\.\s*\1?(\d+)\s*")
+
     @staticmethod
     def isComponent(potentialComponent: Component) -> True:
         if potentialComponent is None:
@@ -28,6 +31,22 @@ class Component(ABC):
         else:
             return True
 
+    @staticmethod
+    def expandPinGroup(group: str or [int or str,]) -> [int or str,]:
+        if not isinstance(group, str):
+            return tuple(group)
+        pins = list()
+        for part in group.split(","):
+            match = Component.pinRangePattern.fullmatch(part)
+            if match is None:
+                pins.append(part.strip())
+            else:
+                prefix, first, last = match.group(1), int(match.group(2)), int(match.group(3))
+                step = 1 if first <= last else -1
+                for number in range(first, last + step, step):
+                    pins.append(f"{prefix}{number}")
+        return tuple(pins)
+
     @staticmethod
     def normalisePinValues(pinValues: [bool or int,] or bytes) -> [bool,]:
         if isinstance(pinValues, bytes):
@@ -39,6 +58,7 @@ class Component(ABC):
             return tuple(normalisedValues)
 
     def __init__(self, pins: int or [str,], pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple()):
+        self._stimulated = True
         self._pins = list()
         pinsIterable = pins
         if isinstance(pins, int):
@@ -46,6 +66,10 @@ class Component(ABC):
         for pin in pinsIterable:
             self._pins.append(Pin(str(pin), (False, False)))
         self._pins = tuple(self._pins)
+        self._pinIndexes = dict()
+        for index in range(len(self._pins)):
+            self._pinIndexes.setdefault(self._pins[index].identifier, index + 1)
+        self._pinGroups = dict()
         del self.state
         if pinValues:
             if len(pinValues) > 0:
@@ -89,11 +113,10 @@ class Component(ABC):
                 return pin
             raise Component.PinIndexError(pin, len(self._pins))
         else:
-            identifier = str(pin)
-            for index in range(len(self._pins)):
-                if identifier == self._pins[index].identifier:
-                    return index + 1
-            raise Component.PinNotFoundError(identifier)
+            try:
+                return self._pinIndexes[str(pin)]
+            except KeyError:
+                raise Component.PinNotFoundError(str(pin))
 
     def pinIdentifier(self, pin: int or str) -> str:
         return self._pins[self.pinIndex(pin)].identifier
@@ -123,6 +146,24 @@ class Component(ABC):
             pinsObjects.append(self._pins[index - 1])
         return tuple(pinsObjects)
 
+    def bus(self, group: str or [int or str,]) -> Bus:
+        key = group if isinstance(group, str) else tuple(group)
+        try:
+            return self._pinGroups[key]
+        except KeyError:
+            bus = Bus(self.pinsSelect(Component.expandPinGroup(group)))
+            self._pinGroups[key] = bus
+            return bus
+
+    def pinGroup(self, group: str or [int or str,]) -> [Pin,]:
+        return self.bus(group).pins
+
+    def getPinGroup(self, group: str or [int or str,]) -> int:
+        return self.bus(group).read()
+
+    def setPinGroup(self, group: str or [int or str,], value: int, activity: bool or int = True):
+        self.bus(group).drive(value, activity)
+
     def getPin(self, pin: int or str) -> bool:
         return self.pinSelect(pin).value
 
@@ -237,9 +278,36 @@ class Component(ABC):
             self.state = state
             raise error
 
+    @property
+    def packedPinStates(self) -> bytes:
+        return bytes(pin.packedState for pin in self._pins)
+
+    @packedPinStates.setter
+    def packedPinStates(self, states: bytes):
+        if len(states) != len(self._pins):
+            raise ValueError(f"{self} has {len(self._pins)} pins so cannot set {len(states)} packed states")
+        for index in range(len(self._pins)):
+            self._pins[index].packedState = states[index]
+        self.stimulate()
+
+    def snapshot(self) -> {str: any}:
+        state = {"pins": self.packedPinStates}
+        state.update(self.internalState())
+        return state
+
+    def restore(self, snapshot: {str: any}):
+        state = dict(snapshot)
+        state["pins"] = tuple(BinElec.unpack(packedState) for packedState in snapshot["pins"])
+        self.state = state
+
+    def internalState(self) -> {str: any}:
+        return dict()
+
     @property
     def state(self) -> {str: any}:
-        return {"pins": self.getPinsStates(slice(None))}
+        state = {"pins": self.getPinsStates(slice(None))}
+        state.update(self.internalState())
+        return state
 
     @state.setter
     def state(self, state: {str: any}):
@@ -253,11 +321,20 @@ class Component(ABC):
         except Exception as error:
             self.state = prevState
             raise error
+        self.stimulate()
 
     @state.deleter
     def state(self):
         for pin in self._pins:
             pin.state = (False, False)
+        self.stimulate()
+
+    @property
+    def stimulated(self) -> bool:
+        return self._stimulated
+
+    def stimulate(self):
+        self._stimulated = True
 
     def connectPin(self, pin: int or str, connectedComponent: Component, connectedPin: int or str):
         if Component.isComponent(connectedComponent):
@@ -308,8 +385,10 @@ class Component(ABC):
     def respond(self):
         self.retrievePinStates()
         self.response()
+        self._stimulated = False
 
 class Connection(ABC):
+    __slots__ = "_node", "_inverse"
     connectionTypes = dict()
 
     class ConnectionNotFoundError(ValueError):
@@ -378,6 +457,8 @@ class Connection(ABC):
         pass
 
 class Node(ABC):
+    __slots__ = "_net", "__weakref__"
+
     class ExcludedNodeError(Exception):
         pass
 
@@ -396,12 +477,31 @@ class Node(ABC):
         else:
             raise TypeError(f"Can only form connection using type Connection or Node not {type(connector).__name__} ({connector})")
 
+    @property
+    @abstractmethod
+    def neighbours(self) -> [Node,]:
+        pass
+
+    @abstractmethod
+    def forget(self, connection: Connection):
+        pass
+
+    @property
+    def net(self) -> Net:
+        if self._net is None or not self._net._valid:
+            return Net.compile(self)
+        return self._net
+
     @abstractmethod
     def retrieveState(self, exclude: [Node,]) -> [bool, bool]:
         pass
 
 class Pin(Node):
+    __slots__ = "_identifier", "_state", "_connection"
+
     class SpecificConnection(Connection):
+        __slots__ = ()
+
         def __init__(self, source: Node, target: Node, inverse: Connection = None):
             if not isinstance(target, Pin):
                 raise Connection.WrongConnectionTypeError(type(self), type(target))
@@ -419,7 +519,8 @@ class Pin(Node):
                 elif isinstance(identifier, Node):
                     if identifier != (~self)._node:
                         raise Connection.ConnectionNotFoundError(f"Pins is not connected to node {identifier}")
-            del self._node.connection
+            if self._node.connection is ~self:
+                del self._node.connection
 
         def retrieveState(self, exclude: [Node,]) -> [bool, bool]:
             if self._node in exclude:
@@ -428,7 +529,8 @@ class Pin(Node):
 
     def __init__(self, identifier: str, state: [bool or int, bool or int] = (False, False), connection: Connection or Node = None):
         self._identifier = str(identifier)
-        self._value, self._activity = BinElec.validateState(state)
+        self._net = None
+        self._state = BinElec.pack(state)
         self._connection = None
         if connection is not None:
             self.connection = connection
@@ -445,44 +547,54 @@ class Pin(Node):
 
     @property
     def value(self) -> bool:
-        return self._value
+        return self._state & 1 == 1
 
     @value.setter
     def value(self, value: bool or int):
-        self._value = intToBool(value)
+        self._updateState(self._state & 2 | intToBool(value))
 
     def set(self):
-        self._value = True
+        self._updateState(self._state | 1)
 
     def reset(self):
-        self._value = False
+        self._updateState(self._state & 2)
 
     @property
     def activity(self) -> bool:
-        return self._activity
+        return self._state > 1
 
     @activity.setter
     def activity(self, activity: bool or int):
-        self._activity = intToBool(activity)
+        self._updateState(self._state & 1 | intToBool(activity) << 1)
 
     def active(self):
-        self._activity = True
+        self._updateState(self._state | 2)
 
     def passive(self):
-        self._activity = False
+        self._updateState(self._state & 1)
 
     @property
     def state(self) -> [bool or int, bool or int]:
-        return self._value, self._activity
+        return BinElec.states[self._state]
 
     @state.setter
     def state(self, state: [bool or int, bool or int]):
-        prevValue, prevActivity = self._value, self._activity
-        try:
-            self._value, self._activity = BinElec.validateState(state)
-        except Exception as error:
-            self._value, self._activity = prevValue, prevActivity
-            raise error
+        self._updateState(BinElec.pack(state))
+
+    @property
+    def packedState(self) -> int:
+        return self._state
+
+    @packedState.setter
+    def packedState(self, state: int):
+        if state not in range(4):
+            raise ValueError(f"Packed binary electric states are 0 to 3 (not {state})")
+        self._updateState(state)
+
+    def _updateState(self, state: int):
+        if self._net is not None:
+            self._net.update(self._state, state)
+        self._state = state
 
     @property
     def connection(self) -> Connection:
@@ -494,25 +606,45 @@ class Pin(Node):
         if newConnection != self._connection:
             del self.connection
             self._connection = newConnection
+            Net.topologyChanged(self)
 
     @connection.deleter
     def connection(self):
         if self._connection is not None:
             connection = self._connection
             self._connection = None
+            connection.node.forget(~connection)
+            Net.topologyChanged(self)
             del connection
 
+    def forget(self, connection: Connection):
+        if self._connection is connection:
+            self._connection = None
+            Net.topologyChanged(self)
+
+    @property
+    def neighbours(self) -> [Node,]:
+        if self._connection is None:
+            return tuple()
+        return self._connection.node,
+
     def retrieveState(self, exclude: [Node,] = tuple()) -> [bool, bool]:
         if self in exclude:
             raise Node.ExcludedNodeError(f"{self} is already excluded in {exclude}")
         if self._connection is None:
-            self._value = self._activity = False
+            self._updateState(BinElec.passiveLow)
+        elif exclude:
+            self._updateState(BinElec.pack(self._connection.retrieveState(tuple(list(exclude) + [self]))))
         else:
-            self._value, self._activity = BinElec.validateState(self._connection.retrieveState(tuple(list(exclude) + [self])))
-        return self.state
+            self._updateState(self.net.state(self._state))
+        return BinElec.states[self._state]
 
 class Wire(Node):
+    __slots__ = "_connections",
+
     class SpecificConnection(Connection):
+        __slots__ = ()
+
         def __init__(self, source: Node, target: Node, inverse: Connection = None):
             if not isinstance(target, Wire):
                 raise Connection.WrongConnectionTypeError(type(self), type(target))
@@ -529,6 +661,7 @@ class Wire(Node):
             return self._node.retrieveState(exclude)
 
     def __init__(self, connections: [Connection or Node,] = tuple()):
+        self._net = None
         self._connections = list()
         self.connections = connections
 
@@ -562,16 +695,25 @@ class Wire(Node):
     def connections(self):
         connections = self._connections
         self._connections = list()
+        Net.topologyChanged(self)
         for connection in connections:
             connection.disconnect(self)
 
+    @property
+    def neighbours(self) -> [Node,]:
+        neighbours = list()
+        for connection in self._connections:
+            neighbours.append(connection.node)
+        return tuple(neighbours)
+
     def getConnection(self, identifier: Connection or Node or int) -> Connection:
         if isinstance(identifier, Connection):
             connection = identifier
             if connection.node == self:
                 connection = ~connection
-            if connection in self._connections:
-                return connection
+            for existingConnection in self._connections:
+                if existingConnection is connection:
+                    return connection
             raise Connection.ConnectionNotFoundError(f"{connection} not in {self._connections}")
         elif isinstance(identifier, Node):
             node = identifier
@@ -587,24 +729,35 @@ class Wire(Node):
         connection = self.formConnection(connector)
         if not connection in self._connections:
             self._connections.append(connection)
+            Net.topologyChanged(self)
 
     def disconnect(self, identifier: Connection or Node or int):
         connection = self.getConnection(identifier)
-        self._connections.remove(connection)
+        self.forget(connection)
+        connection.node.forget(~connection)
         del connection
 
+    def forget(self, connection: Connection):
+        for index in range(len(self._connections)):
+            if self._connections[index] is connection:
+                del self._connections[index]
+                Net.topologyChanged(self)
+                return
+
     def retrieveState(self, exclude: [Node,] = tuple()) -> [bool, bool]:
         if self in exclude:
             raise Node.ExcludedNodeError(f"{self} is already excluded in {exclude}")
+        if not exclude:
+            return BinElec.states[self.net.state()]
         exclude = list(exclude)
         exclude.append(self)
-        state = (False, False)
+        state = BinElec.passiveLow
         for connection in self._connections:
             if connection.node not in exclude:
-                state = BinElec.combine(state, connection.retrieveState(exclude))
-            if state == (True, True):
-                return True, True
-        return state
+                state = max(state, BinElec.pack(connection.retrieveState(exclude)))
+            if state == BinElec.activeHigh:
+                break
+        return BinElec.states[state]
 
     def __getitem__(self, identifier: Connection or Node or int) -> Connection:
         return self.getConnection(identifier)
@@ -612,4 +765,142 @@ class Wire(Node):
     def __delitem__(self, identifier: Connection or Node or int):
         self.disconnect(identifier)
 
+class Bus:
+    __slots__ = "_pins", "_mask", "_read", "_drive"
+    compiledWidths = dict()
+
+    @staticmethod
+    def compile(width: int) -> callable:
+        try:
+            return Bus.compiledWidths[width]
+        except KeyError:
+            pass
+        pins = tuple(f"p{bit}" for bit in range(width))
+        source = [f"def make({', '.join(pins)}):", "    def read():"]
+        source.append("        return " + (" | ".join(f"({pin}._state & 1) << {bit}" for bit, pin in enumerate(pins)) or "0"))
+        source.append("    def drive(value, high, low):")
+        for bit, pin in enumerate(pins):
+            source.append(f"        state = high if value & {1 << bit} else low")
+            source.append(f"        if {pin}._state != state:")
+            source.append(f"            {pin}._updateState(state)")
+        source.append("        return")
+        source.append("    return read, drive")
+        namespace = dict()
+        exec(compile("\n".join(source), f"<bus {width}>", "exec"), namespace)
+        Bus.compiledWidths[width] = namespace["make"]
+        return namespace["make"]
+
+    def __init__(self, pins: [Pin,]):
+        for pin in pins:
+            if not isinstance(pin, Pin):
+                raise TypeError(f"A bus is formed from Pin objects not {type(pin).__name__} ({pin})")
+        self._pins = tuple(pins)
+        self._mask = (1 << len(self._pins)) - 1
+        self._read, self._drive = Bus.compile(len(self._pins))(*self._pins)
+
+    def __len__(self) -> int:
+        return len(self._pins)
+
+    @property
+    def pins(self) -> [Pin,]:
+        return self._pins
+
+    def read(self) -> int:
+        return self._read()
+
+    def drive(self, value: int, active: bool or int = True):
+        activity = intToBool(active) << 1
+        self.drivePacked(value, BinElec.passiveHigh | activity, activity)
+
+    def driveStates(self, value: int, high: [bool or int, bool or int], low: [bool or int, bool or int]):
+        self.drivePacked(value, BinElec.pack(high), BinElec.pack(low))
+
+    def drivePacked(self, value: int, high: int, low: int):
+        if not 0 <= value <= self._mask:
+            raise ValueError(f"{value} does not fit on a {len(self._pins)}-bit bus")
+        self._drive(value, high, low)
+
+    def release(self):
+        for pin in self._pins:
+            if pin._state > BinElec.passiveHigh:
+                pin._updateState(pin._state & 1)
+
+class Net:
+    __slots__ = "_valid", "_pins", "_wires", "_counts"
+    precedence = BinElec.activeHigh, BinElec.activeLow, BinElec.passiveHigh, BinElec.passiveLow
+
+    @staticmethod
+    def topologyChanged(node: Node):
+        if node._net is not None:
+            node._net._valid = False
+
+    @staticmethod
+    def compile(origin: Node) -> Net:
+        visited = {origin}
+        nodes = [origin]
+        for node in nodes:
+            for neighbour in node.neighbours:
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    nodes.append(neighbour)
+        net = Net(nodes)
+        for node in nodes:
+            node._net = net
+        return net
+
+    def __init__(self, nodes: [Node,]):
+        self._valid = True
+        self._pins = list()
+        self._wires = list()
+        self._counts = [0] * len(Net.precedence)
+        for node in nodes:
+            if isinstance(node, Pin):
+                self._pins.append(node)
+                self._counts[node.packedState] += 1
+            else:
+                self._wires.append(node)
+        self._pins = tuple(self._pins)
+        self._wires = tuple(self._wires)
+
+    def __len__(self) -> int:
+        return len(self._pins)
+
+    @property
+    def valid(self) -> bool:
+        return self._valid
+
+    @property
+    def pins(self) -> [Pin,]:
+        return self._pins
+
+    @property
+    def wires(self) -> [Wire,]:
+        return self._wires
+
+    @property
+    def signature(self) -> [int, int]:
+        top = None
+        for state in Net.precedence:
+            count = self._counts[state]
+            if count > 0:
+                if top is not None:
+                    return top, state
+                top = state
+                if count > 1:
+                    return top, top
+        return top, None
+
+    def update(self, prevState: int, state: int):
+        self._counts[prevState] -= 1
+        self._counts[state] += 1
+
+    def state(self, exclude: int = None) -> int:
+        for state in Net.precedence:
+            count = self._counts[state]
+            if state == exclude:
+                count -= 1
+            if count > 0:
+                return state
+        return BinElec.passiveLow
+
 Connection.connectionTypes = {Pin: Pin.SpecificConnection, Wire: Wire.SpecificConnection}
@@ -0,0 +1,103 @@
+from __future__ import annotations
+from instruction_set import InstructionSet
+from memory import SpecificMemory, MemoryMap
+
+class Disassembler:
+    def __init__(self, instructionSet: InstructionSet, source: SpecificMemory or MemoryMap or bytes, origin: int = 0):
+        if not isinstance(instructionSet, InstructionSet):
+            raise TypeError(f"A disassembler must be associated with an instruction set ({instructionSet} is not valid)")
+        self._instructionSet = instructionSet
+        self._source = source
+        self._origin = int(origin)
+        if isinstance(source, MemoryMap):
+            self._length = len(source)
+        elif isinstance(source, SpecificMemory):
+            self._length = len(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self._source = bytes(source)
+            self._length = len(source)
+        else:
+            raise TypeError(f"Can only disassemble memory, a memory map or bytes (not {type(source).__name__})")
+        self._cache = dict()
+
+    @property
+    def instructionSet(self) -> InstructionSet:
+        return self._instructionSet
+
+    @property
+    def source(self) -> SpecificMemory or MemoryMap or bytes:
+        return self._source
+
+    def read(self, address: int) -> int:
+        if isinstance(self._source, MemoryMap):
+            return self._source.read(address % self._length)
+        elif isinstance(self._source, SpecificMemory):
+            return self._source.data[(address - self._origin) % self._length]
+        return self._source[(address - self._origin) % self._length]
+
+    def pageVersion(self, address: int) -> int:
+        if isinstance(self._source, MemoryMap):
+            return self._source.pageVersion((address % self._length) // MemoryMap.pageSize)
+        elif isinstance(self._source, SpecificMemory):
+            return self._source.pageVersion(((address - self._origin) % self._length) // SpecificMemory.pageSize)
+        return 0
+
+    def versions(self, address: int, length: int) -> tuple:
+        mapVersion = self._source.version if isinstance(self._source, MemoryMap) else 0
+        if (address & 0xFF) + length <= 0x100:
+            return mapVersion, self.pageVersion(address)
+        return mapVersion, self.pageVersion(address), self.pageVersion(address + length - 1)
+
+    def decode(self, address: int) -> [int, bytes, str, str]:
+        cached = self._cache.get(address)
+        if cached is not None:
+            instruction, versions = cached
+            if versions == self.versions(address, len(instruction[1])):
+                return instruction
+        opcode = self.read(address)
+        length, cycles, addressingMode = self._instructionSet.getMetadata(opcode)
+        data = bytes(self.read(address + byte) for byte in range(length))
+        if addressingMode is None:
+            instruction = (address, data, ".byte", f"${opcode:02X}")
+        else:
+            operation = self._instructionSet.getInstruction(opcode)[0]
+            instruction = (address, data, operation.mnemonic, addressingMode.disassemble(int.from_bytes(data[1:], "little"), address))
+        self._cache[address] = instruction, self.versions(address, length)
+        return instruction
+
+    def disassemble(self, start: int, stop: int) -> [[int, bytes, str, str],]:
+        instructions = list()
+        address = start
+        while address < stop:
+            instruction = self.decode(address)
+            instructions.append(instruction)
+            address += len(instruction[1])
+        return instructions
+
+    def window(self, address: int, before: int = 4, after: int = 8) -> [[int, bytes, str, str],]:
+        for start in range(max(self._origin, address - 3 * before), address + 1):
+            instructions = self.disassemble(start, address)
+            if not instructions or instructions[-1][0] + len(instructions[-1][1]) == address:
+                break
+        instructions = instructions[-before:] if before else list()
+        current = address
+        for line in range(after):
+            instruction = self.decode(current)
+            instructions.append(instruction)
+            current += len(instruction[1])
+        return instructions
+
+    def invalidate(self, start: int = None, stop: int = None):
+        if start is None:
+            self._cache.clear()
+        else:
+            for address in range(start - 2, start + 1 if stop is None else stop):
+                self._cache.pop(address, None)
+
+    @staticmethod
+    def format(instruction: [int, bytes, str, str]) -> str:
+        address, data, mnemonic, operands = instruction
+        return f"{address:04X}  {data.hex(' ').upper():<8}  {mnemonic} {operands}".rstrip()
+
+    def listing(self, start: int, stop: int) -> str:
+        return "\n".join(Disassembler.format(instruction) for instruction in self.disassemble(start, stop))
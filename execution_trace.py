@@ -0,0 +1,186 @@
+from __future__ import annotations
+from threading import Thread
+from queue import Queue
+import argparse
+import struct
+
+class TraceRecorder:
+    class TraceFileError(Exception):
+        pass
+
+    magic = b"CSSTRACE"
+    version = 1
+    headerFormat = struct.Struct("<8sHH")
+    recordFormat = struct.Struct("<QHBBBBBBHBB")
+    fields = ("cycle", "PC", "IR", "A", "X", "Y", "S", "P", "address", "data", "RWB")
+
+    def __init__(self, capacity: int = 65536, fileName: str = None, chunkRecords: int = 4096):
+        if capacity <= 0:
+            raise ValueError(f"Trace buffers must hold at least one record ({capacity} is not valid)")
+        self._capacity = int(capacity)
+        self._buffer = bytearray(self._capacity * TraceRecorder.recordFormat.size)
+        self._view = memoryview(self._buffer)
+        self._pack = TraceRecorder.recordFormat.pack_into
+        self._count = 0
+        self._cycle = 0
+        self._written = 0
+        self._chunkRecords = max(1, min(int(chunkRecords), self._capacity))
+        self._file = None
+        self._queue = None
+        self._writer = None
+        if fileName is not None:
+            self.open(fileName)
+
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def cycle(self) -> int:
+        return self._cycle
+
+    @property
+    def streaming(self) -> bool:
+        return self._file is not None
+
+    def open(self, fileName: str):
+        if self._file is not None:
+            raise TraceRecorder.TraceFileError("Trace is already being written to a file")
+        self._file = open(fileName, "wb")
+        self._file.write(TraceRecorder.headerFormat.pack(TraceRecorder.magic, TraceRecorder.version, TraceRecorder.recordFormat.size))
+        self._written = self._count
+        self._queue = Queue(16)
+        self._writer = Thread(target=TraceRecorder._write, args=(self._file, self._queue), daemon=True)
+        self._writer.start()
+
+    @staticmethod
+    def _write(file, queue: Queue):
+        while True:
+            chunk = queue.get()
+            if chunk is None:
+                break
+            file.write(chunk)
+
+    def flush(self):
+        if self._file is None:
+            return
+        if self._count - self._written > self._capacity:
+            self._written = self._count - self._capacity
+        while self._written < self._count:
+            start = self._written % self._capacity
+            stop = min(start + self._count - self._written, self._capacity)
+            size = TraceRecorder.recordFormat.size
+            self._queue.put(bytes(self._view[start * size : stop * size]))
+            self._written += stop - start
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+        self._file.close()
+        self._file = self._queue = self._writer = None
+
+    def __enter__(self) -> TraceRecorder:
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def record(self, PC: int, IR: int, A: int, X: int, Y: int, S: int, P: int, address: int, data: int, RWB: bool):
+        self._pack(self._buffer, (self._count % self._capacity) * TraceRecorder.recordFormat.size, self._cycle, PC, IR, A, X, Y, S, P, address, data, RWB)
+        self._count += 1
+        self._cycle += 1
+        if self._file is not None and self._count - self._written >= self._chunkRecords:
+            self.flush()
+
+    def records(self) -> [[int,],]:
+        size = TraceRecorder.recordFormat.size
+        for count in range(max(0, self._count - self._capacity), self._count):
+            offset = (count % self._capacity) * size
+            yield TraceRecorder.recordFormat.unpack_from(self._buffer, offset)
+
+    def clear(self):
+        self.flush()
+        self._count = self._written = 0
+
+    @staticmethod
+    def format(record: [int,]) -> str:
+        cycle, PC, IR, A, X, Y, S, P, address, data, RWB = record
+        return f"{cycle:>10}  PC={PC:04X} IR={IR:02X} A={A:02X} X={X:02X} Y={Y:02X} S={S:02X} P={P:02X}  {address:04X} {'R' if RWB else 'W'} {data:02X}"
+
+class TraceReader:
+    def __init__(self, fileName: str, chunkRecords: int = 4096):
+        self._fileName = fileName
+        self._chunkRecords = max(1, int(chunkRecords))
+        with open(fileName, "rb") as file:
+            header = file.read(TraceRecorder.headerFormat.size)
+        if len(header) != TraceRecorder.headerFormat.size:
+            raise TraceRecorder.TraceFileError(f"{fileName} is too short to be a trace file")
+        magic, version, recordSize = TraceRecorder.headerFormat.unpack(header)
+        if magic != TraceRecorder.magic or version != TraceRecorder.version or recordSize != TraceRecorder.recordFormat.size:
+            raise TraceRecorder.TraceFileError(f"{fileName} is not a version {TraceRecorder.version} trace file")
+
+    def __iter__(self):
+        size = TraceRecorder.recordFormat.size
+        with open(self._fileName, "rb") as file:
+            file.seek(TraceRecorder.headerFormat.size)
+            while True:
+                chunk = file.read(size * self._chunkRecords)
+                if len(chunk) < size:
+                    break
+                yield from TraceRecorder.recordFormat.iter_unpack(chunk[:len(chunk) - len(chunk) % size])
+
+    def filter(self, predicate: callable = None, **ranges: {str: int or [int, int]}) -> [[int,],]:
+        conditions = list()
+        for field, value in ranges.items():
+            if field not in TraceRecorder.fields:
+                raise ValueError(f"Trace records have no field {field}")
+            if isinstance(value, int):
+                value = (value, value + 1)
+            conditions.append((TraceRecorder.fields.index(field), value[0], value[1]))
+        for record in self:
+            for index, start, stop in conditions:
+                if not start <= record[index] < stop:
+                    break
+            else:
+                if predicate is None or predicate(record):
+                    yield record
+
+def parseRange(value: str) -> [int, int]:
+    if ".." in value:
+        start, stop = value.split("..", 1)
+        return int(start, 0), int(stop, 0) + 1
+    return int(value, 0), int(value, 0) + 1
+
+def commandLine(arguments: [str,] = None):
+    parser = argparse.ArgumentParser(prog="python -m execution_trace", description="Decode and filter an execution trace file")
+    parser.add_argument("trace", help="binary trace file written by a TraceRecorder")
+    for field in TraceRecorder.fields:
+        parser.add_argument(f"--{field}", type=parseRange, help=f"only show records whose {field} is a value or inclusive range, e.g. 0x8000..0x80FF")
+    parser.add_argument("--limit", type=int, help="maximum number of records to show")
+    arguments = parser.parse_args(arguments)
+    ranges = {field: getattr(arguments, field) for field in TraceRecorder.fields if getattr(arguments, field) is not None}
+    try:
+        reader = TraceReader(arguments.trace)
+    except (OSError, TraceRecorder.TraceFileError) as error:
+        parser.error(str(error))
+    shown = 0
+    for record in reader.filter(**ranges):
+        if arguments.limit is not None and shown >= arguments.limit:
+            break
+        print(TraceRecorder.format(record))
+        shown += 1
+    return 0
+
+if __name__ == "__main__":
+    import execution_trace
+    raise SystemExit(execution_trace.commandLine())
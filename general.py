@@ -11,16 +11,42 @@ def intToBool(value: int or bool) -> bool:
     else:
         raise TypeError(f"intToBool only converts integers to boolean not {type(value)} ({value})")
 
+byteBits = tuple(tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256))
+wordBits = tuple(low + high for high in byteBits for low in byteBits)
+bitsByte = {bits[:length]: byte for length in range(1, 9) for byte, bits in enumerate(byteBits) if byte < 2 ** length}
+
 def bytesToTuple(value: bytes) -> [bool,]:
-    if not isinstance(value, bytes):
+    if not isinstance(value, (bytes, bytearray, memoryview)):
         raise TypeError(f"bytesToTuple converts bytes objects not {type(value).__name__}")
-    output = list()
-    for byte in value:
-        for bit in range(7, -1, -1):
-            bitValue = 2 ** bit
-            output.append(bool(byte // bitValue))
-            byte %= bitValue
-    return tuple(output[::-1])
+    if len(value) == 1:
+        return byteBits[value[0]]
+    elif len(value) == 2:
+        return wordBits[value[0] << 8 | value[1]]
+    output = tuple()
+    for byte in reversed(value):
+        output += byteBits[byte]
+    return output
+
+def intToTuple(value: int, bits: int = 8) -> [bool,]:
+    if bits == 8:
+        return byteBits[value]
+    elif bits == 16:
+        return wordBits[value]
+    output = tuple()
+    for shift in range(0, bits, 8):
+        output += byteBits[value >> shift & 0xFF]
+    return output[:bits]
+
+def tupleToInt(value: [bool or int,]) -> int:
+    value = tuple(value)
+    if len(value) <= 8:
+        return bitsByte[value] if value else 0
+    elif len(value) <= 16:
+        return bitsByte[value[:8]] | bitsByte[value[8:]] << 8
+    output = 0
+    for shift in range(0, len(value), 8):
+        output |= bitsByte[value[shift : shift + 8]] << shift
+    return output
 
 def sliceToTuple(value: slice, maximum: int = None, minimum: int = 0) -> [int,]:
     start, stop, step = value.start, value.stop, value.step
@@ -60,6 +86,10 @@ def strToDict(string: str):
     return dictionary
 
 class BinaryElectric:
+    # Packed states are value | activity << 1, which orders them by combine precedence
+    passiveLow, passiveHigh, activeLow, activeHigh = range(4)
+    states = (False, False), (True, False), (False, True), (True, True)
+
     @staticmethod
     def validateState(state: [bool or int, bool or int]) -> [bool, bool]:
         if len(state) != 2:
@@ -74,16 +104,15 @@ class BinaryElectric:
         BinaryElectric.validateState(state)
         return True
 
+    @staticmethod
+    def pack(state: [bool or int, bool or int]) -> int:
+        value, activity = BinaryElectric.validateState(state)
+        return value | activity << 1
+
+    @staticmethod
+    def unpack(state: int) -> [bool, bool]:
+        return BinaryElectric.states[state]
+
     @staticmethod
     def combine(A: [bool or int, bool or int], B: [bool or int, bool or int]) -> [bool, bool]:
-        A, B = BinaryElectric.validateState(A), BinaryElectric.validateState(B)
-        if A == B:
-            return A
-        elif A == (True, True) or B == (True, True):
-            return True, True
-        elif A[1] or B[1]:
-            return False, True
-        elif A[0] or B[0]:
-            return True, False
-        else:
-            return False, False
+        return BinaryElectric.states[max(BinaryElectric.pack(A), BinaryElectric.pack(B))]
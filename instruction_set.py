@@ -12,6 +12,13 @@ class AddressingMode(ABC):
     class LabelAddressError(ValueError):
         pass
 
+    class NoEffectiveAddressError(Exception):
+        pass
+
+    identifier = str()
+    operandLength = 0
+    operandFormat = "{}"
+
     @staticmethod
     @abstractmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
@@ -25,20 +32,51 @@ class AddressingMode(ABC):
     def fetchOperands(processor: Component) -> [bool, bytes]:
         return True, bytes()
 
+    @classmethod
+    def disassemble(cls, operand: int, address: int) -> str:
+        if cls.operandLength == 0:
+            return str()
+        return cls.operandFormat.format(f"${operand:0{cls.operandLength * 2}X}")
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        raise AddressingMode.NoEffectiveAddressError("Addressing mode does not address memory")
+
+    @classmethod
+    def readOperand(cls, core: FunctionalCore, operand: int) -> int:
+        return core.read(cls.effectiveAddress(core, operand))
+
+    @classmethod
+    def writeOperand(cls, core: FunctionalCore, operand: int, value: int):
+        core.write(cls.effectiveAddress(core, operand), value)
+
 class Operation(ABC):
+    class UnsupportedOperationError(Exception):
+        pass
+
     mnemonic = str()
+    transfersControl = False
 
     @staticmethod
     @abstractmethod
     def execute(processor: Component, addressingMode: AddressingMode):
         pass
 
+    @staticmethod
+    def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+        raise Operation.UnsupportedOperationError("Operation cannot be performed as a whole instruction")
+
 class DynamicAddressingMode(AddressingMode):
-    def __init__(self, assemble: callable, assembleLabel: callable = AddressingMode.assembleLabel, fetchOperand: callable = AddressingMode.fetchOperands):
+    def __init__(self, identifier: str, assemble: callable, assembleLabel: callable = AddressingMode.assembleLabel, fetchOperand: callable = AddressingMode.fetchOperands):
+        self._identifier = str(identifier)
         self._assemble = assemble
         self._fetchOperand = fetchOperand
         self._assembleLabel = assembleLabel
 
+    @property
+    def identifier(self) -> str:
+        return self._identifier
+
     def assemble(self, operandString, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
         return self._assemble(operandString, labels)
 
@@ -49,9 +87,11 @@ class DynamicAddressingMode(AddressingMode):
         return self._fetchOperand(processor)
 
 class DynamicOperation(Operation):
-    def __init__(self, mnemonic: str, execute: callable):
+    def __init__(self, mnemonic: str, execute: callable, perform: callable = Operation.perform, transfersControl: bool = False):
         self._mnemonic = str(mnemonic)
         self._execute = execute
+        self._perform = perform
+        self.transfersControl = bool(transfersControl)
 
     @property
     def mnemonic(self) -> str:
@@ -60,12 +100,19 @@ class DynamicOperation(Operation):
     def execute(self, processor: Component, addressingMode: AddressingMode):
         self._execute(processor, addressingMode)
 
+    def perform(self, core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+        self._perform(core, addressingMode, operand)
+
 class InstructionSet:
+    class UndefinedOpcodeError(ValueError):
+        pass
+
     @staticmethod
     def validateInstruction(instruction: [Operation, AddressingMode]) -> [Operation, AddressingMode]:
         if len(instruction) != 2:
             raise ValueError(f"Instructions must be of the form (Operation, AddressingMode) not {instruction}")
-        if not (issubclass(instruction[0], Operation) and issubclass(instruction[1], AddressingMode)):
+        isKind = lambda value, kind: isinstance(value, kind) or isinstance(value, type) and issubclass(value, kind)
+        if not (isKind(instruction[0], Operation) and isKind(instruction[1], AddressingMode)):
             raise TypeError(f"Invalid instruction types {type(instruction[0]).__name__, type(instruction[1]).__name__} must be (Operation, AddressingMode)")
         return tuple(instruction)
 
@@ -117,8 +164,58 @@ class InstructionSet:
                     instructions[opcode] = InstructionSet.validateInstruction((operation, addressingMode))
         return InstructionSet.instructionsFromOpcodeDict(instructions)
 
-    def __init__(self, instructions: [[Operation, AddressingMode],]):
+    @staticmethod
+    def bindInstruction(operation: Operation, addressingMode: AddressingMode) -> callable:
+        execute = operation.execute
+        def instruction(processor: Component):
+            execute(processor, addressingMode)
+        return instruction
+
+    @staticmethod
+    def bindUndefined(opcode: int) -> callable:
+        def instruction(processor: Component):
+            raise InstructionSet.UndefinedOpcodeError(f"Opcode {opcode:02X} is not defined in the instruction set")
+        return instruction
+
+    def __init__(self, instructions: [[Operation, AddressingMode],], cycles: [int,] = tuple()):
         self._instructions = InstructionSet.validateInstructions(instructions)
+        self._cycles = cycles = tuple(cycles)
+        dispatch = list()
+        metadata = list()
+        for opcode in range(max(256, len(self._instructions))):
+            operation, addressingMode = self._instructions[opcode] if opcode < len(self._instructions) else (None, None)
+            count = int(cycles[opcode]) if opcode < len(cycles) else None
+            if operation is None:
+                dispatch.append(InstructionSet.bindUndefined(opcode))
+                metadata.append((1, count, None))
+            else:
+                dispatch.append(InstructionSet.bindInstruction(operation, addressingMode))
+                metadata.append((1 + addressingMode.operandLength, count, addressingMode))
+        self._dispatch = tuple(dispatch)
+        self._metadata = tuple(metadata)
+        self._mnemonics = dict()
+        self._opcodeIndex = dict()
+        self._operationAddressingModes = dict()
+        for opcode, (operation, addressingMode) in enumerate(self._instructions):
+            if operation is not None:
+                self._mnemonics.setdefault(operation.mnemonic.lower(), operation)
+                self._opcodeIndex.setdefault((operation, addressingMode), opcode)
+                self._operationAddressingModes.setdefault(operation, list()).append(addressingMode)
+
+    def __reduce__(self) -> [type, tuple]:
+        return type(self), (self._instructions, self._cycles)
+
+    @property
+    def dispatch(self) -> [callable,]:
+        return self._dispatch
+
+    @property
+    def metadata(self) -> [[int, int, AddressingMode],]:
+        return self._metadata
+
+    @property
+    def signature(self) -> [[str, str, int, int] or None,]:
+        return tuple(None if addressingMode is None else (self._instructions[opcode][0].mnemonic, addressingMode.identifier, length, count) for opcode, (length, count, addressingMode) in enumerate(self._metadata))
 
     @property
     def instructions(self) -> [[Operation, AddressingMode]]:
@@ -140,7 +237,7 @@ class InstructionSet:
     @property
     def addressingModes(self) -> [AddressingMode,]:
         addressingModes = list()
-        for addressingMode, addressingMode in self._instructions:
+        for operation, addressingMode in self._instructions:
             if addressingMode is not None:
                 if addressingMode not in addressingModes:
                     addressingModes.append(addressingMode)
@@ -156,10 +253,10 @@ class InstructionSet:
         return tuple(opcodes)
 
     def getOperationByMnemonic(self, mnemonic: str) -> Operation:
-        for operation, addressingMode in self._instructions:
-            if operation is not None:
-                if mnemonic.lower() == operation.mnemonic.lower():
-                    return operation
+        try:
+            return self._mnemonics[mnemonic.lower()]
+        except KeyError:
+            pass
         raise ValueError(f"No operation in instruction set, {self}, with mnemonic, {mnemonic}")
 
     def getInstruction(self, opcode: int or bytes) -> [Operation, AddressingMode]:
@@ -167,19 +264,30 @@ class InstructionSet:
             opcode = int.from_bytes(opcode, "little")
         return self._instructions[opcode]
 
+    def getMetadata(self, opcode: int or bytes) -> [int, int, AddressingMode]:
+        if isinstance(opcode, bytes):
+            opcode = int.from_bytes(opcode, "little")
+        return self._metadata[opcode]
+
+    def getLength(self, opcode: int or bytes) -> int:
+        return self.getMetadata(opcode)[0]
+
+    def getCycles(self, opcode: int or bytes) -> int:
+        return self.getMetadata(opcode)[1]
+
     def getOpcode(self, operation: Operation or str, addressingMode: AddressingMode) -> int:
         if isinstance(operation, str):
             operation = self.getOperationByMnemonic(operation)
-        return self._instructions.index((operation, addressingMode))
+        try:
+            return self._opcodeIndex[(operation, addressingMode)]
+        except KeyError:
+            pass
+        raise ValueError(f"No opcode in instruction set, {self}, for instruction {(operation, addressingMode)}")
 
     def operationAddressingModes(self, operation: Operation or str) -> [AddressingMode]:
         if isinstance(operation, str):
             operation = self.getOperationByMnemonic(operation)
-        addressingModes = list()
-        for instruction in self._instructions:
-            if operation == instruction[0]:
-                addressingModes.append(instruction[1])
-        return addressingModes
+        return list(self._operationAddressingModes.get(operation, tuple()))
 
     def addressingModeOperations(self, addressingMode: AddressingMode) -> [Operation]:
         operations = list()
@@ -189,8 +297,9 @@ class InstructionSet:
         return operations
 
     def execute(self, processor: Component, opcode: int or bytes):
-        operation, addressingMode = self.getInstruction(opcode)
-        operation.execute(processor, addressingMode)
+        if isinstance(opcode, bytes):
+            opcode = int.from_bytes(opcode, "little")
+        self._dispatch[opcode](processor)
 
     @staticmethod
     def initialiseFromOpcodeDict(opcodeDict: {int: [Operation, AddressingMode]}) -> InstructionSet:
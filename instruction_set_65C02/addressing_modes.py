@@ -1,7 +1,6 @@
 from __future__ import annotations
-from processor import Processor
+from processor import Processor, FunctionalCore
 from instruction_set import AddressingMode
-from general import bytesToTuple
 
 class LabelModes:
     @staticmethod
@@ -10,9 +9,25 @@ class LabelModes:
 
     @staticmethod
     def relativeLabel(labelAddress: int, instructionAddress: int) -> bytes:
-        return bytes([labelAddress - instructionAddress])
+        offset = labelAddress - instructionAddress - 1
+        if not -0x80 <= offset <= 0x7F:
+            raise AddressingMode.LabelAddressError(f"Label at {labelAddress:04X} is out of branch range of {instructionAddress:04X}")
+        return bytes((offset & 0xFF,))
 
 class AssembleMethods:
+    @staticmethod
+    def number(operandString: str) -> int:
+        operandString = operandString.strip()
+        try:
+            if operandString[:1] == "$":
+                return int(operandString[1:], 16)
+            if operandString[:1] == "%":
+                return int(operandString[1:], 2)
+            return int(operandString, 10)
+        except ValueError:
+            pass
+        raise AddressingMode.AddressingModeAssembleError(f"Operand is not a number: '{operandString}'")
+
     @staticmethod
     def noOperands(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
         if operandString == str():
@@ -22,98 +37,188 @@ class AssembleMethods:
     
     @staticmethod
     def absolute(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        pass
+        operandString = operandString.strip()
+        if operandString in labels:
+            return bytes(2), ((1, operandString),)
+        address = AssembleMethods.number(operandString)
+        if not 0 <= address <= 0xFFFF:
+            raise AddressingMode.AddressingModeAssembleError(f"Absolute addresses must be 16 bit: '{operandString}'")
+        return address.to_bytes(2, "little"), tuple()
 
     @staticmethod
     def zeroPage(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        pass
+        address = AssembleMethods.number(operandString)
+        if not 0 <= address <= 0xFF:
+            raise AddressingMode.AddressingModeAssembleError(f"Zero page addresses must be 8 bit: '{operandString}'")
+        return bytes((address,)), tuple()
 
     @staticmethod
-    def extractIndexedAddress(operandString: str) -> str:
+    def extractIndexedAddress(operandString: str, register: str) -> str:
         operandString = operandString.strip()
-        if operandString[-1].lower() != "x" and operandString[-1].lower() != "y":
-            raise AddressingMode.AddressingModeAssembleError("Indexed addressed operands must end with the index register used (x or y)")
+        if operandString[-1:].lower() != register:
+            raise AddressingMode.AddressingModeAssembleError(f"Indexed addressed operands must end with the index register used ({register})")
         operandString = operandString[:-1].strip()
-        if operandString[-1] != ",":
+        if operandString[-1:] != ",":
             raise AddressingMode.AddressingModeAssembleError("Indexed registers must be seperated from the address with a comma")
         return operandString[:-1].strip()
 
     @staticmethod
     def extractIndirectAddress(operandString: str) -> str:
         operandString = operandString.strip()
-        if operandString[0] != "(" or operandString[-1] != ")":
+        if operandString[:1] != "(" or operandString[-1:] != ")":
             raise AddressingMode.AddressingModeAssembleError("Indirect address must be contained within brackets")
         return operandString[1 : -1].strip()
 
 class FetchMethods:
     @staticmethod
     def readMemory1(processor: Processor, address: bytes):
-        address = bytesToTuple(address)
-        for bit in range(16):
-            processor.setPinState(f"A{bit}", (address, True))
+        processor.addressBus.drive(int.from_bytes(address, "big"))
         processor.setPinState("RWB", (True, True))
 
     @staticmethod
     def readMemory2(processor: Processor) -> bytes:
-        data = 0
-        for bit in range(8):
-            data += processor.getRegister(f"D{bit}") * 2 ** bit
-        return bytes((data,))
+        return bytes((processor.dataBus.read(),))
 
     @staticmethod
     def writeMemory(processor: Processor, address: bytes, data: bytes):
-        address = bytesToTuple(address)
-        data = bytesToTuple(data)
-        for bit in range(16):
-            processor.setPinState(f"A{bit}", (address[bit], True))
-            if bit < 8:
-                processor.setPinState(f"D{bit}", (data[bit], True))
+        processor.addressBus.drive(int.from_bytes(address, "big"))
+        processor.dataBus.drive(data[0])
         processor.setPinState("RWB", (False, True))
 
 class Absolute(AddressingMode): # a
+    identifier = "Absolute"
     assemble = AssembleMethods.absolute
+    assembleLabel = LabelModes.immediateLabel
+    operandLength = 2
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return operand
 
 class AbsoluteIndexedIndirect(AddressingMode): # (a,x)
+    identifier = "AbsoluteIndexedIndirect"
+    assembleLabel = LabelModes.immediateLabel
+    operandFormat = "({},x)"
+    operandLength = 2
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        return AssembleMethods.absolute(AssembleMethods.extractIndexedAddress(AssembleMethods.extractIndirectAddress(operandString)), labels)
+        return AssembleMethods.absolute(AssembleMethods.extractIndexedAddress(AssembleMethods.extractIndirectAddress(operandString), "x"), labels)
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return core.readWord((operand + core.X) & 0xFFFF)
 
 class XIndexedAbsolute(AddressingMode): # a,x
+    identifier = "XIndexedAbsolute"
+    assembleLabel = LabelModes.immediateLabel
+    operandFormat = "{},x"
+    operandLength = 2
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        return AssembleMethods.absolute(AssembleMethods.extractIndexedAddress(operandString), labels)
+        return AssembleMethods.absolute(AssembleMethods.extractIndexedAddress(operandString, "x"), labels)
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return (operand + core.X) & 0xFFFF
 
 class YIndexedAbsolute(AddressingMode): # a,y
+    identifier = "YIndexedAbsolute"
+    assembleLabel = LabelModes.immediateLabel
+    operandFormat = "{},y"
+    operandLength = 2
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        return AssembleMethods.absolute(AssembleMethods.extractIndexedAddress(operandString), labels)
+        return AssembleMethods.absolute(AssembleMethods.extractIndexedAddress(operandString, "y"), labels)
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return (operand + core.Y) & 0xFFFF
 
 class AbsoluteIndirect(AddressingMode): # (a)
+    identifier = "AbsoluteIndirect"
+    assembleLabel = LabelModes.immediateLabel
+    operandFormat = "({})"
+    operandLength = 2
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
         return AssembleMethods.absolute(AssembleMethods.extractIndirectAddress(operandString), labels)
 
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return core.readWord(operand)
+
 class Accumulator(AddressingMode): # A
+    identifier = "Accumulator"
     assemble = AssembleMethods.noOperands
 
     @staticmethod
     def fetchOperands(processor: Processor) -> [bool, bytes]:
         return True, processor.getRegister("A")
 
+    @staticmethod
+    def readOperand(core: FunctionalCore, operand: int) -> int:
+        return core.A
+
+    @staticmethod
+    def writeOperand(core: FunctionalCore, operand: int, value: int):
+        core.A = value
+
 class Immediate(AddressingMode): # #
+    identifier = "Immediate"
+    operandLength = 1
+    operandFormat = "#{}"
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        pass
+        operandString = operandString.strip()
+        if operandString[:1] != "#":
+            raise AddressingMode.AddressingModeAssembleError("Immediate operands must begin with #")
+        value = AssembleMethods.number(operandString[1:])
+        if not -0x80 <= value <= 0xFF:
+            raise AddressingMode.AddressingModeAssembleError(f"Immediate operands must be 8 bit: '{operandString}'")
+        return bytes((value & 0xFF,)), tuple()
+
+    @staticmethod
+    def readOperand(core: FunctionalCore, operand: int) -> int:
+        return operand
 
 class Implied(AddressingMode): # i
+    identifier = "Implied"
     assemble = AssembleMethods.noOperands
 
 class Relative(AddressingMode): # r
+    identifier = "Relative"
+    assembleLabel = LabelModes.relativeLabel
+    operandLength = 1
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        pass
+        operandString = operandString.strip()
+        if operandString in labels:
+            return bytes(1), ((1, operandString),)
+        offset = AssembleMethods.number(operandString)
+        if not -0x80 <= offset <= 0x7F:
+            raise AddressingMode.AddressingModeAssembleError(f"Relative offsets must be between -128 and 127: '{operandString}'")
+        return bytes((offset & 0xFF,)), tuple()
+
+    @staticmethod
+    def disassemble(operand: int, address: int) -> str:
+        if operand > 0x7F:
+            operand -= 0x100
+        return f"${(address + 2 + operand) & 0xFFFF:04X}"
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        if operand > 0x7F:
+            operand -= 0x100
+        return (core.PC + operand) & 0xFFFF
 
 class Stack(AddressingMode): # s
+    identifier = "Stack"
     assemble = AssembleMethods.noOperands
 
     @staticmethod
@@ -121,34 +226,96 @@ class Stack(AddressingMode): # s
         return True, processor.getRegister("S")
 
 class ZeroPage(AddressingMode): # zp
+    identifier = "ZeroPage"
     assemble = AssembleMethods.zeroPage
+    operandLength = 1
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return operand
 
 class ZeroPageIndexedIndirect(AddressingMode): # (zp,x)
+    identifier = "ZeroPageIndexedIndirect"
+    operandFormat = "({},x)"
+    operandLength = 1
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        return AssembleMethods.zeroPage(AssembleMethods.extractIndexedAddress(AssembleMethods.extractIndirectAddress(operandString)), labels)
+        return AssembleMethods.zeroPage(AssembleMethods.extractIndexedAddress(AssembleMethods.extractIndirectAddress(operandString), "x"), labels)
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return core.readZeroPageWord((operand + core.X) & 0xFF)
 
 class XIndexedZeroPage(AddressingMode): # zp,x
+    identifier = "XIndexedZeroPage"
+    operandFormat = "{},x"
+    operandLength = 1
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        return AssembleMethods.zeroPage(AssembleMethods.extractIndexedAddress(operandString), labels)
+        return AssembleMethods.zeroPage(AssembleMethods.extractIndexedAddress(operandString, "x"), labels)
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return (operand + core.X) & 0xFF
 
 class YIndexedZeroPage(AddressingMode): # zp,y
+    identifier = "YIndexedZeroPage"
+    operandFormat = "{},y"
+    operandLength = 1
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        return AssembleMethods.zeroPage(AssembleMethods.extractIndexedAddress(operandString), labels)
+        return AssembleMethods.zeroPage(AssembleMethods.extractIndexedAddress(operandString, "y"), labels)
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return (operand + core.Y) & 0xFF
 
 class ZeroPageIndirect(AddressingMode): # (zp)
+    identifier = "ZeroPageIndirect"
+    operandFormat = "({})"
+    operandLength = 1
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
         return AssembleMethods.zeroPage(AssembleMethods.extractIndirectAddress(operandString), labels)
 
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return core.readZeroPageWord(operand)
+
 class ZeroPageIndirectIndexed(AddressingMode): # (zp),y
+    identifier = "ZeroPageIndirectIndexed"
+    operandFormat = "({}),y"
+    operandLength = 1
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
-        return AssembleMethods.zeroPage(AssembleMethods.extractIndirectAddress(AssembleMethods.extractIndexedAddress(operandString)), labels)
+        return AssembleMethods.zeroPage(AssembleMethods.extractIndirectAddress(AssembleMethods.extractIndexedAddress(operandString, "y")), labels)
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return (core.readZeroPageWord(operand) + core.Y) & 0xFFFF
 
 class BranchBit(AddressingMode): # zp,r
+    identifier = "BranchBit"
+    assembleLabel = LabelModes.relativeLabel
+    operandLength = 2
+
+    @staticmethod
+    def effectiveAddress(core: FunctionalCore, operand: int) -> int:
+        return operand & 0xFF
+
+    @staticmethod
+    def branchAddress(core: FunctionalCore, operand: int) -> int:
+        return Relative.effectiveAddress(core, operand >> 8)
+
+    @staticmethod
+    def disassemble(operand: int, address: int) -> str:
+        return f"${operand & 0xFF:02X},{Relative.disassemble(operand >> 8, address + 1)}"
+
     @staticmethod
     def assemble(operandString: str, labels: [str,] = tuple()) -> [bytes, [[int, str],]]:
         try:
@@ -157,7 +324,7 @@ class BranchBit(AddressingMode): # zp,r
             raise AddressingMode.AddressingModeAssembleError("Branch bit instructions must be formed of a zero page address and a relative address seperated by a comma")
         byte1, labelUses1 = AssembleMethods.zeroPage(zeroPage)
         byte2, labelUses2 = Relative.assemble(relative, labels)
-        return byte1 + byte2, labelUses1 + labelUses2
+        return byte1 + byte2, tuple(labelUses1) + tuple((byte + 1, identifier) for byte, identifier in labelUses2)
 
 class AddressingModes:
     Absolute = Absolute
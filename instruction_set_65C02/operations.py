@@ -1,5 +1,6 @@
-from processor import Processor
+from processor import Processor, FunctionalCore, StatusFlags as Flags
 from instruction_set import Operation, AddressingMode
+from instruction_set_65C02.addressing_modes import AddressingModes
 
 def RMB(bit: int, processor: Processor, addressingMode: AddressingMode):
     pass
@@ -13,78 +14,209 @@ def BBR(bit: int, processor: Processor, addressingMode: AddressingMode):
 def BBS(bit: int, processor: Processor, addressingMode: AddressingMode):
     pass
 
+class PerformMethods:
+    @staticmethod
+    def branch(core: FunctionalCore, addressingMode: AddressingMode, operand: int, condition: bool):
+        if condition:
+            core.PC = addressingMode.effectiveAddress(core, operand)
+
+    @staticmethod
+    def branchBit(core: FunctionalCore, addressingMode: AddressingMode, operand: int, bit: int, condition: bool):
+        if bool(core.read(addressingMode.effectiveAddress(core, operand)) & (1 << bit)) == condition:
+            core.PC = addressingMode.branchAddress(core, operand)
+
+    @staticmethod
+    def resetMemoryBit(core: FunctionalCore, addressingMode: AddressingMode, operand: int, bit: int):
+        address = addressingMode.effectiveAddress(core, operand)
+        core.write(address, core.read(address) & ~(1 << bit) & 0xFF)
+
+    @staticmethod
+    def setMemoryBit(core: FunctionalCore, addressingMode: AddressingMode, operand: int, bit: int):
+        address = addressingMode.effectiveAddress(core, operand)
+        core.write(address, core.read(address) | (1 << bit))
+
+    @staticmethod
+    def compare(core: FunctionalCore, register: int, value: int):
+        core.setFlag(Flags.carry, register >= value)
+        core.setNZ((register - value) & 0xFF)
+
+    @staticmethod
+    def addWithCarry(core: FunctionalCore, value: int):
+        carry = core.P & Flags.carry
+        if core.P & Flags.decimal:
+            low = (core.A & 0x0F) + (value & 0x0F) + carry
+            if low > 0x09:
+                low += 0x06
+            high = (core.A >> 4) + (value >> 4) + (low > 0x0F)
+            core.setFlag(Flags.overflow, ~(core.A ^ value) & (core.A ^ (high << 4)) & 0x80)
+            if high > 0x09:
+                high += 0x06
+            core.setFlag(Flags.carry, high > 0x0F)
+            core.A = ((high << 4) | (low & 0x0F)) & 0xFF
+        else:
+            result = core.A + value + carry
+            core.setFlag(Flags.overflow, ~(core.A ^ value) & (core.A ^ result) & 0x80)
+            core.setFlag(Flags.carry, result > 0xFF)
+            core.A = result & 0xFF
+        core.setNZ(core.A)
+
+    @staticmethod
+    def subtractWithCarry(core: FunctionalCore, value: int):
+        if core.P & Flags.decimal:
+            borrow = 1 - (core.P & Flags.carry)
+            result = core.A - value - borrow
+            low = (core.A & 0x0F) - (value & 0x0F) - borrow
+            high = (core.A >> 4) - (value >> 4)
+            if low < 0:
+                low -= 0x06
+                high -= 1
+            if high < 0:
+                high -= 0x06
+            core.setFlag(Flags.overflow, (core.A ^ value) & (core.A ^ result) & 0x80)
+            core.setFlag(Flags.carry, result >= 0)
+            core.A = ((high << 4) | (low & 0x0F)) & 0xFF
+            core.setNZ(core.A)
+        else:
+            PerformMethods.addWithCarry(core, value ^ 0xFF)
+
+    @staticmethod
+    def pushWord(core: FunctionalCore, value: int):
+        core.push(value >> 8)
+        core.push(value & 0xFF)
+
+    @staticmethod
+    def pullWord(core: FunctionalCore) -> int:
+        low = core.pull()
+        return low | core.pull() << 8
+
 class Operations: # TODO
 
     class BRK(Operation):
         mnemonic = "BRK"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.PC = (core.PC + 1) & 0xFFFF
+            PerformMethods.pushWord(core, core.PC)
+            core.push(core.P | Flags.breakCommand | Flags.unused)
+            core.P = (core.P | Flags.interruptDisable) & ~Flags.decimal & 0xFF
+            core.PC = core.readWord(0xFFFE)
+
     class BPL(Operation):
         mnemonic = "BPL"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branch(core, addressingMode, operand, not core.P & Flags.negative)
+
     class JSR(Operation):
         mnemonic = "JSR"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.pushWord(core, (core.PC - 1) & 0xFFFF)
+            core.PC = addressingMode.effectiveAddress(core, operand)
+
     class BMI(Operation):
         mnemonic = "BMI"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branch(core, addressingMode, operand, core.P & Flags.negative)
+
     class RTI(Operation):
         mnemonic = "RTI"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.P = (core.pull() | Flags.unused) & ~Flags.breakCommand & 0xFF
+            core.PC = PerformMethods.pullWord(core)
+
     class BVC(Operation):
         mnemonic = "BVC"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branch(core, addressingMode, operand, not core.P & Flags.overflow)
+
     class RTS(Operation):
         mnemonic = "RTS"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.PC = (PerformMethods.pullWord(core) + 1) & 0xFFFF
+
     class BVS(Operation):
         mnemonic = "BVS"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branch(core, addressingMode, operand, core.P & Flags.overflow)
+
     class BRA(Operation):
         mnemonic = "BRA"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branch(core, addressingMode, operand, True)
+
     class BCC(Operation):
         mnemonic = "BCC"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branch(core, addressingMode, operand, not core.P & Flags.carry)
+
     class LDY(Operation):
         mnemonic = "LDY"
 
@@ -92,13 +224,23 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.Y = addressingMode.readOperand(core, operand)
+            core.setNZ(core.Y)
+
     class BCS(Operation):
         mnemonic = "BCS"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branch(core, addressingMode, operand, core.P & Flags.carry)
+
     class CPY(Operation):
         mnemonic = "CPY"
 
@@ -106,13 +248,22 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.compare(core, core.Y, addressingMode.readOperand(core, operand))
+
     class BNE(Operation):
         mnemonic = "BNE"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branch(core, addressingMode, operand, not core.P & Flags.zero)
+
     class CPX(Operation):
         mnemonic = "CPX"
 
@@ -120,13 +271,22 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.compare(core, core.X, addressingMode.readOperand(core, operand))
+
     class BEQ(Operation):
         mnemonic = "BEQ"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branch(core, addressingMode, operand, core.P & Flags.zero)
+
     class ORA(Operation):
         mnemonic = "ORA"
 
@@ -134,6 +294,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.A |= addressingMode.readOperand(core, operand)
+            core.setNZ(core.A)
+
     class AND(Operation):
         mnemonic = "AND"
 
@@ -141,6 +306,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.A &= addressingMode.readOperand(core, operand)
+            core.setNZ(core.A)
+
     class EOR(Operation):
         mnemonic = "EOR"
 
@@ -148,6 +318,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.A ^= addressingMode.readOperand(core, operand)
+            core.setNZ(core.A)
+
     class ADC(Operation):
         mnemonic = "ADC"
 
@@ -155,6 +330,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.addWithCarry(core, addressingMode.readOperand(core, operand))
+
     class STA(Operation):
         mnemonic = "STA"
 
@@ -162,6 +341,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            addressingMode.writeOperand(core, operand, core.A)
+
     class LDA(Operation):
         mnemonic = "LDA"
 
@@ -169,6 +352,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.A = addressingMode.readOperand(core, operand)
+            core.setNZ(core.A)
+
     class CMP(Operation):
         mnemonic = "CMP"
 
@@ -176,6 +364,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.compare(core, core.A, addressingMode.readOperand(core, operand))
+
     class SBC(Operation):
         mnemonic = "SBC"
 
@@ -183,6 +375,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.subtractWithCarry(core, addressingMode.readOperand(core, operand))
+
     class LDX(Operation):
         mnemonic = "LDX"
 
@@ -190,6 +386,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.X = addressingMode.readOperand(core, operand)
+            core.setNZ(core.X)
+
     class TSB(Operation):
         mnemonic = "TSB"
 
@@ -197,6 +398,12 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            value = addressingMode.readOperand(core, operand)
+            core.setFlag(Flags.zero, not value & core.A)
+            addressingMode.writeOperand(core, operand, value | core.A)
+
     class TRB(Operation):
         mnemonic = "TRB"
 
@@ -204,6 +411,12 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            value = addressingMode.readOperand(core, operand)
+            core.setFlag(Flags.zero, not value & core.A)
+            addressingMode.writeOperand(core, operand, value & ~core.A & 0xFF)
+
     class BIT(Operation):
         mnemonic = "BIT"
 
@@ -211,6 +424,13 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            value = addressingMode.readOperand(core, operand)
+            core.setFlag(Flags.zero, not value & core.A)
+            if addressingMode is not AddressingModes.Immediate:
+                core.P = (core.P & 0x3F) | (value & 0xC0)
+
     class STZ(Operation):
         mnemonic = "STZ"
 
@@ -218,6 +438,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            addressingMode.writeOperand(core, operand, 0)
+
     class STY(Operation):
         mnemonic = "STY"
 
@@ -225,6 +449,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            addressingMode.writeOperand(core, operand, core.Y)
+
     class ASL(Operation):
         mnemonic = "ASL"
 
@@ -232,6 +460,14 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            value = addressingMode.readOperand(core, operand) << 1
+            core.setFlag(Flags.carry, value > 0xFF)
+            value &= 0xFF
+            core.setNZ(value)
+            addressingMode.writeOperand(core, operand, value)
+
     class ROL(Operation):
         mnemonic = "ROL"
 
@@ -239,6 +475,14 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            value = addressingMode.readOperand(core, operand) << 1 | (core.P & Flags.carry)
+            core.setFlag(Flags.carry, value > 0xFF)
+            value &= 0xFF
+            core.setNZ(value)
+            addressingMode.writeOperand(core, operand, value)
+
     class LSR(Operation):
         mnemonic = "LSR"
 
@@ -246,6 +490,14 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            value = addressingMode.readOperand(core, operand)
+            core.setFlag(Flags.carry, value & 0x01)
+            value >>= 1
+            core.setNZ(value)
+            addressingMode.writeOperand(core, operand, value)
+
     class ROR(Operation):
         mnemonic = "ROR"
 
@@ -253,6 +505,15 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            value = addressingMode.readOperand(core, operand)
+            carry = core.P & Flags.carry
+            core.setFlag(Flags.carry, value & 0x01)
+            value = value >> 1 | carry << 7
+            core.setNZ(value)
+            addressingMode.writeOperand(core, operand, value)
+
     class STX(Operation):
         mnemonic = "STX"
 
@@ -260,6 +521,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            addressingMode.writeOperand(core, operand, core.X)
+
     class DEC(Operation):
         mnemonic = "DEC"
 
@@ -267,6 +532,12 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            value = (addressingMode.readOperand(core, operand) - 1) & 0xFF
+            core.setNZ(value)
+            addressingMode.writeOperand(core, operand, value)
+
     class INC(Operation):
         mnemonic = "INC"
 
@@ -274,6 +545,12 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            value = (addressingMode.readOperand(core, operand) + 1) & 0xFF
+            core.setNZ(value)
+            addressingMode.writeOperand(core, operand, value)
+
     class RMB0(Operation):
         mnemonic = "RMB0"
 
@@ -281,6 +558,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             RMB(0, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.resetMemoryBit(core, addressingMode, operand, 0)
+
     class RMB1(Operation):
         mnemonic = "RMB1"
 
@@ -288,6 +569,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             RMB(1, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.resetMemoryBit(core, addressingMode, operand, 1)
+
     class RMB2(Operation):
         mnemonic = "RMB2"
 
@@ -295,6 +580,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             RMB(2, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.resetMemoryBit(core, addressingMode, operand, 2)
+
     class RMB3(Operation):
         mnemonic = "RMB3"
 
@@ -302,6 +591,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             RMB(3, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.resetMemoryBit(core, addressingMode, operand, 3)
+
     class RMB4(Operation):
         mnemonic = "RMB4"
 
@@ -309,6 +602,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             RMB(4, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.resetMemoryBit(core, addressingMode, operand, 4)
+
     class RMB5(Operation):
         mnemonic = "RMB5"
 
@@ -316,6 +613,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             RMB(5, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.resetMemoryBit(core, addressingMode, operand, 5)
+
     class RMB6(Operation):
         mnemonic = "RMB6"
 
@@ -323,6 +624,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             RMB(6, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.resetMemoryBit(core, addressingMode, operand, 6)
+
     class RMB7(Operation):
         mnemonic = "RMB7"
 
@@ -330,6 +635,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             RMB(7, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.resetMemoryBit(core, addressingMode, operand, 7)
+
     class SMB0(Operation):
         mnemonic = "SMB0"
 
@@ -337,6 +646,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             SMB(0, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.setMemoryBit(core, addressingMode, operand, 0)
+
     class SMB1(Operation):
         mnemonic = "SMB1"
 
@@ -344,6 +657,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             SMB(1, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.setMemoryBit(core, addressingMode, operand, 1)
+
     class SMB2(Operation):
         mnemonic = "SMB2"
 
@@ -351,6 +668,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             SMB(2, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.setMemoryBit(core, addressingMode, operand, 2)
+
     class SMB3(Operation):
         mnemonic = "SMB3"
 
@@ -358,6 +679,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             SMB(3, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.setMemoryBit(core, addressingMode, operand, 3)
+
     class SMB4(Operation):
         mnemonic = "SMB4"
 
@@ -365,6 +690,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             SMB(4, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.setMemoryBit(core, addressingMode, operand, 4)
+
     class SMB5(Operation):
         mnemonic = "SMB5"
 
@@ -372,6 +701,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             SMB(5, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.setMemoryBit(core, addressingMode, operand, 5)
+
     class SMB6(Operation):
         mnemonic = "SMB6"
 
@@ -379,6 +712,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             SMB(6, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.setMemoryBit(core, addressingMode, operand, 6)
+
     class SMB7(Operation):
         mnemonic = "SMB7"
 
@@ -386,6 +723,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             SMB(7, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.setMemoryBit(core, addressingMode, operand, 7)
+
     class PHP(Operation):
         mnemonic = "PHP"
 
@@ -393,6 +734,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.push(core.P | Flags.breakCommand | Flags.unused)
+
     class CLC(Operation):
         mnemonic = "CLC"
 
@@ -400,6 +745,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.P &= ~Flags.carry & 0xFF
+
     class PLP(Operation):
         mnemonic = "PLP"
 
@@ -407,6 +756,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.P = (core.pull() | Flags.unused) & ~Flags.breakCommand & 0xFF
+
     class SEC(Operation):
         mnemonic = "SEC"
 
@@ -414,6 +767,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.P |= Flags.carry
+
     class PHA(Operation):
         mnemonic = "PHA"
 
@@ -421,6 +778,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.push(core.A)
+
     class CLI(Operation):
         mnemonic = "CLI"
 
@@ -428,6 +789,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.P &= ~Flags.interruptDisable & 0xFF
+
     class PLA(Operation):
         mnemonic = "PLA"
 
@@ -435,6 +800,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.A = core.pull()
+            core.setNZ(core.A)
+
     class SEI(Operation):
         mnemonic = "SEI"
 
@@ -442,6 +812,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.P |= Flags.interruptDisable
+
     class DEY(Operation):
         mnemonic = "DEY"
 
@@ -449,6 +823,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.Y = (core.Y - 1) & 0xFF
+            core.setNZ(core.Y)
+
     class TYA(Operation):
         mnemonic = "TYA"
 
@@ -456,6 +835,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.A = core.Y
+            core.setNZ(core.A)
+
     class TAY(Operation):
         mnemonic = "TAY"
 
@@ -463,6 +847,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.Y = core.A
+            core.setNZ(core.Y)
+
     class CLV(Operation):
         mnemonic = "CLV"
 
@@ -470,6 +859,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.P &= ~Flags.overflow & 0xFF
+
     class INY(Operation):
         mnemonic = "INY"
 
@@ -477,6 +870,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.Y = (core.Y + 1) & 0xFF
+            core.setNZ(core.Y)
+
     class CLD(Operation):
         mnemonic = "CLD"
 
@@ -484,6 +882,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.P &= ~Flags.decimal & 0xFF
+
     class INX(Operation):
         mnemonic = "INX"
 
@@ -491,6 +893,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.X = (core.X + 1) & 0xFF
+            core.setNZ(core.X)
+
     class SED(Operation):
         mnemonic = "SED"
 
@@ -498,6 +905,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.P |= Flags.decimal
+
     class PHY(Operation):
         mnemonic = "PHY"
 
@@ -505,6 +916,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.push(core.Y)
+
     class PLY(Operation):
         mnemonic = "PLY"
 
@@ -512,6 +927,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.Y = core.pull()
+            core.setNZ(core.Y)
+
     class TXA(Operation):
         mnemonic = "TXA"
 
@@ -519,6 +939,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.A = core.X
+            core.setNZ(core.A)
+
     class TXS(Operation):
         mnemonic = "TXS"
 
@@ -526,6 +951,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.S = core.X
+
     class TAX(Operation):
         mnemonic = "TAX"
 
@@ -533,6 +962,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.X = core.A
+            core.setNZ(core.X)
+
     class TSX(Operation):
         mnemonic = "TSX"
 
@@ -540,6 +974,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.X = core.S
+            core.setNZ(core.X)
+
     class DEX(Operation):
         mnemonic = "DEX"
 
@@ -547,6 +986,11 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.X = (core.X - 1) & 0xFF
+            core.setNZ(core.X)
+
     class PHX(Operation):
         mnemonic = "PHX"
 
@@ -554,6 +998,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.push(core.X)
+
     class NOP(Operation):
         mnemonic = "NOP"
 
@@ -561,6 +1009,10 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             processor.setRegister("TCU", bytes(1))
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            pass
+
     class PLX(Operation):
         mnemonic = "PLX"
 
@@ -568,135 +1020,235 @@ class Operations: # TODO
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.X = core.pull()
+            core.setNZ(core.X)
+
     class WAI(Operation):
         mnemonic = "WAI"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.waiting = True
+
     class STP(Operation):
         mnemonic = "STP"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.stopped = True
+
     class JMP(Operation):
         mnemonic = "JMP"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             pass
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            core.PC = addressingMode.effectiveAddress(core, operand)
+
     class BBR0(Operation):
         mnemonic = "BBR0"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBR(0, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 0, False)
+
     class BBR1(Operation):
         mnemonic = "BBR1"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBR(1, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 1, False)
+
     class BBR2(Operation):
         mnemonic = "BBR2"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBR(2, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 2, False)
+
     class BBR3(Operation):
         mnemonic = "BBR3"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBR(3, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 3, False)
+
     class BBR4(Operation):
         mnemonic = "BBR4"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBR(4, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 4, False)
+
     class BBR5(Operation):
         mnemonic = "BBR5"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBR(5, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 5, False)
+
     class BBR6(Operation):
         mnemonic = "BBR6"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBR(6, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 6, False)
+
     class BBR7(Operation):
         mnemonic = "BBR7"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBR(7, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 7, False)
+
     class BBS0(Operation):
         mnemonic = "BBS0"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBS(0, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 0, True)
+
     class BBS1(Operation):
         mnemonic = "BBS1"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBS(1, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 1, True)
+
     class BBS2(Operation):
         mnemonic = "BBS2"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBS(2, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 2, True)
+
     class BBS3(Operation):
         mnemonic = "BBS3"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBS(3, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 3, True)
+
     class BBS4(Operation):
         mnemonic = "BBS4"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBS(4, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 4, True)
+
     class BBS5(Operation):
         mnemonic = "BBS5"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBS(5, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 5, True)
+
     class BBS6(Operation):
         mnemonic = "BBS6"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBS(6, processor, addressingMode)
 
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 6, True)
+
     class BBS7(Operation):
         mnemonic = "BBS7"
+        transfersControl = True
 
         @staticmethod
         def execute(processor: Processor, addressingMode: AddressingMode):
             BBS(7, processor, addressingMode)
+
+        @staticmethod
+        def perform(core: FunctionalCore, addressingMode: AddressingMode, operand: int):
+            PerformMethods.branchBit(core, addressingMode, operand, 7, True)
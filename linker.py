@@ -0,0 +1,181 @@
+from __future__ import annotations
+from instruction_set import InstructionSet, AddressingMode
+from memory import MemoryMap
+import json
+
+class Section:
+    def __init__(self, name: str, data: bytes = bytes(), exports: {str: int} = None, relocations: [[int, str, str],] = tuple()):
+        self._name = str(name)
+        self._data = bytes(data)
+        self._exports = dict(exports) if exports else dict()
+        self._relocations = tuple((int(offset), str(label), str(addressingMode)) for offset, label, addressingMode in relocations)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def data(self) -> bytes:
+        return self._data
+
+    @property
+    def exports(self) -> {str: int}:
+        return self._exports.copy()
+
+    @property
+    def relocations(self) -> [[int, str, str],]:
+        return self._relocations
+
+class ObjectFile:
+    class ObjectFormatError(ValueError):
+        pass
+
+    formatVersion = 1
+
+    def __init__(self, sections: [Section,] = tuple(), sourceHash: str = str()):
+        self._sections = dict()
+        for section in sections:
+            self.addSection(section)
+        self._sourceHash = str(sourceHash)
+
+    @property
+    def sections(self) -> {str: Section}:
+        return self._sections.copy()
+
+    @property
+    def sourceHash(self) -> str:
+        return self._sourceHash
+
+    def addSection(self, section: Section):
+        if not isinstance(section, Section):
+            raise TypeError(f"Object files contain sections (not {type(section).__name__})")
+        if section.name in self._sections:
+            raise ObjectFile.ObjectFormatError(f"Object file already has a section named {section.name}")
+        self._sections[section.name] = section
+
+    def toBytes(self) -> bytes:
+        return json.dumps({
+            "format": ObjectFile.formatVersion,
+            "source": self._sourceHash,
+            "sections": [
+                {
+                    "name": section.name,
+                    "data": section.data.hex(),
+                    "exports": section.exports,
+                    "relocations": section.relocations
+                }
+                for section in self._sections.values()
+            ]
+        }).encode()
+
+    @staticmethod
+    def fromBytes(data: bytes) -> ObjectFile:
+        try:
+            contents = json.loads(data)
+            if contents["format"] != ObjectFile.formatVersion:
+                raise ObjectFile.ObjectFormatError(f"Unsupported object format version {contents['format']}")
+            sections = tuple(
+                Section(section["name"], bytes.fromhex(section["data"]), section["exports"], section["relocations"])
+                for section in contents["sections"]
+            )
+            return ObjectFile(sections, contents["source"])
+        except (KeyError, TypeError, ValueError) as error:
+            if isinstance(error, ObjectFile.ObjectFormatError):
+                raise error
+            raise ObjectFile.ObjectFormatError(f"Invalid object file ({error})")
+
+    def save(self, fileName: str):
+        with open(fileName, "wb") as file:
+            file.write(self.toBytes())
+
+    @staticmethod
+    def load(fileName: str) -> ObjectFile:
+        with open(fileName, "rb") as file:
+            return ObjectFile.fromBytes(file.read())
+
+class Linker:
+    class LinkerError(Exception):
+        pass
+
+    class UnknownSectionError(LinkerError):
+        pass
+
+    class RegionOverflowError(LinkerError):
+        pass
+
+    class DuplicateSymbolError(LinkerError):
+        pass
+
+    class UnresolvedSymbolError(LinkerError):
+        pass
+
+    def __init__(self, instructionSet: InstructionSet, regions: {str: [int, int]}):
+        if not isinstance(instructionSet, InstructionSet):
+            raise TypeError(f"A linker must be associated with an instruction set ({instructionSet} is not valid)")
+        self._instructionSet = instructionSet
+        self._addressingModes = {addressingMode.identifier: addressingMode for addressingMode in instructionSet.addressingModes}
+        self._regions = dict()
+        for name, (start, stop) in dict(regions).items():
+            if not 0 <= start <= stop:
+                raise ValueError(f"Invalid region for section {name} ({start} to {stop})")
+            self._regions[str(name)] = (int(start), int(stop))
+
+    @property
+    def instructionSet(self) -> InstructionSet:
+        return self._instructionSet
+
+    @property
+    def regions(self) -> {str: [int, int]}:
+        return self._regions.copy()
+
+    def place(self, objects: [ObjectFile,]) -> [[[Section, int],], {str: int}]:
+        placements = list()
+        symbols = dict()
+        addresses = {name: start for name, (start, stop) in self._regions.items()}
+        for objectFile in objects:
+            for section in objectFile.sections.values():
+                if section.name not in self._regions:
+                    raise Linker.UnknownSectionError(f"No region is defined for section {section.name}")
+                address = addresses[section.name]
+                if address + len(section) > self._regions[section.name][1]:
+                    raise Linker.RegionOverflowError(f"Section {section.name} overflows its region at {address + len(section):04X}")
+                addresses[section.name] = address + len(section)
+                placements.append((section, address))
+                for label, offset in section.exports.items():
+                    if label in symbols:
+                        raise Linker.DuplicateSymbolError(f"Label {label} is exported more than once")
+                    symbols[label] = address + offset
+        return placements, symbols
+
+    def link(self, objects: [ObjectFile,], symbols: {str: int} = None) -> {str: [int, bytes]}:
+        placements, exports = self.place(objects)
+        symbols = {**(symbols or dict()), **exports}
+        images = {name: bytearray() for name in self._regions}
+        for section, address in placements:
+            data = bytearray(section.data)
+            for offset, label, addressingMode in section.relocations:
+                if label not in symbols:
+                    raise Linker.UnresolvedSymbolError(f"Label {label} used in section {section.name} is not defined")
+                try:
+                    assembledLabel = self._addressingModes[addressingMode].assembleLabel(symbols[label], address + offset)
+                except KeyError:
+                    raise Linker.LinkerError(f"Addressing mode {addressingMode} is not in the instruction set")
+                data[offset:offset + len(assembledLabel)] = assembledLabel
+            images[section.name] += data
+        return {name: (self._regions[name][0], bytes(image)) for name, image in images.items() if image}
+
+    @staticmethod
+    def load(images: {str: [int, bytes]}, memoryMap: MemoryMap):
+        for start, image in images.values():
+            while image:
+                location = memoryMap.locate(start) if start < len(memoryMap) else None
+                if location is None:
+                    raise Linker.LinkerError(f"No memory is mapped at {start:04X}")
+                memory, offset = location
+                length = min(len(image), MemoryMap.pageSize - start % MemoryMap.pageSize, len(memory) - offset)
+                memory.writeAddresses(slice(offset, offset + length), image[:length])
+                image = image[length:]
+                start += length
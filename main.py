@@ -1,12 +1,13 @@
 from simulator import Simulator
 from processor import Processor
-from memory import ReadOnlyMemory as ROM, RandomAccessMemory as RAM
+from memory import ReadOnlyMemory as ROM, RandomAccessMemory as RAM, MemoryMap
 from additional_hardware import PowerSupply, Button, Clock, QuadNANDGate as NAND, Resistor
 from assembler import Assembler
+from linker import Linker
 from instruction_set import InstructionSet
-from instruction_set_65C02.instructions import instructions
+from instruction_set_65C02.instructions import instructions, cycles
 
-instructionSet = InstructionSet(instructions)
+instructionSet = InstructionSet(instructions, cycles)
 
 powerSupply = PowerSupply()
 
@@ -160,18 +161,24 @@ r2 = Resistor(
     )
 )
 
+memoryMap = MemoryMap(
+    (
+        (0x0000, 0x8000, ram, True),
+        (0x8000, 0x10000, rom, False)
+    )
+)
+
+linker = Linker(
+    instructionSet,
+    {
+        "code": (0x8000, 0x10000),
+        "data": (0x0200, 0x8000)
+    }
+)
+
 def step(components):
     components["System clock"].step()
-    for component in ("Resistor R1",
-                      "Resistor R2",
-                      "RESET button",
-                      "System clock",
-                      "65C02 microprocessor",
-                      "NAND gates",
-                      "AT28C256 ROM",
-                      "HM62256B RAM"):
-        components["Power supply"].response()
-        components[component].respond()
+    presetSimulator.settle()
 
 presetSimulator = Simulator(
     components = {
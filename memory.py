@@ -1,6 +1,9 @@
-from component import Component
+from component import Component, Bus
 from abc import abstractmethod
-from general import bytesToTuple, sliceToTuple
+from general import sliceToTuple
+from collections import defaultdict
+import mmap
+import os
 
 class Memory(Component):
     class InvalidMemoryAddressError(IndexError):
@@ -8,7 +11,6 @@ class Memory(Component):
 
     @abstractmethod
     def __init__(self, pins: [str,] or int, data: [bytes,] or bytes or str = bytes(), pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple()):
-        self._data = bytes()
         super().__init__(pins, pinValues, connections)
         if data:
             if isinstance(data, str):
@@ -30,6 +32,19 @@ class Memory(Component):
         else:
             raise ValueError(f"Address {address} is out of range")
 
+    def validateSlice(self, addresses: slice) -> slice:
+        start, stop, step = addresses.start, addresses.stop, addresses.step
+        if start is None:
+            start = 0
+        if stop is None:
+            stop = len(self)
+        if step is None:
+            step = 1
+        if start < stop:
+            self.validateAddress(start)
+            self.validateAddress(stop - 1)
+        return slice(start, stop, step)
+
     def validateAddresses(self, addresses: [int or bytes,] or slice) -> [int,]:
         if isinstance(addresses, slice):
             addresses = sliceToTuple(addresses, len(self))
@@ -54,6 +69,9 @@ class Memory(Component):
     def writeAddresses(self, addresses: [int or bytes,] or slice, values: [bytes,] or bytes):
         pass
 
+    def store(self, address: int, value: int):
+        self.write(address, bytes((value,)))
+
     def __getitem__(self, addresses: int or bytes or [int or bytes,] or slice) -> bytes or [bytes,]:
         if isinstance(addresses, int) or isinstance(addresses, bytes):
             return self.read(addresses)
@@ -86,13 +104,12 @@ class Memory(Component):
         with open(fileName, "rb") as file:
             self.data = file.read(len(self))
 
-    @property
-    def state(self) -> {str: any}:
-        state = Component.state.__get__(self)
-        state["data"] = self.data
+    def internalState(self) -> {str: any}:
+        state = Component.internalState(self)
+        state["data"] = bytes(self.data)
         return state
 
-    @state.setter
+    @Component.state.setter
     def state(self, state: {str: any}):
         prevState = self.state
         Component.state.__set__(self, state)
@@ -112,105 +129,658 @@ class Memory(Component):
         del self.data
 
 class SpecificMemory(Memory):
-    def __init__(self, pins: [str,] or int, data: [bytes,] or bytes or str = bytes(), pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple()):
-        self._data = bytes()
+    pageSize = 256
+    mapAccess = mmap.ACCESS_WRITE
+    pinout = tuple()
+    addressPins = tuple()
+    dataPins = "I/O0..7"
+    controlPins = ("VCC", "GND", "CEB", "OEB", "WEB")
+    layouts = dict()
+
+    @staticmethod
+    def layout(pins: [str,] or int, addressPins: str or [int or str,], dataPins: str or [int or str,], controlPins: [int or str,]) -> [int, [int,], [int,], [int,], [int,]]:
+        key = tuple(pins) if not isinstance(pins, int) else pins, *(group if isinstance(group, str) else tuple(group) for group in (addressPins, dataPins, controlPins))
+        try:
+            return SpecificMemory.layouts[key]
+        except KeyError:
+            pass
+        names = tuple(str(pin) for pin in (range(1, pins + 1) if isinstance(pins, int) else pins))
+        indexes = dict()
+        for index in range(len(names)):
+            indexes.setdefault(names[index], index)
+        groups = list()
+        for group in (addressPins, dataPins, controlPins):
+            try:
+                groups.append(tuple(indexes[str(pin)] if not isinstance(pin, int) else pin - 1 for pin in Component.expandPinGroup(group)))
+            except KeyError as error:
+                raise Component.PinNotFoundError(error.args[0])
+        address, data, control = groups
+        if not all(0 <= index < len(names) for group in groups for index in group):
+            raise ValueError(f"Memory pin descriptions must only use the {len(names)} pins of the pinout")
+        if len(data) != 8:
+            raise ValueError(f"Memory chips store one byte per address so need 8 data pins (not {len(data)})")
+        if len(address) < 8:
+            raise ValueError(f"Memory chips need at least 8 address pins to fill a {SpecificMemory.pageSize}-byte page (not {len(address)})")
+        if len(control) != 5:
+            raise ValueError(f"Memory chips need power, ground, chip enable, output enable and write enable pins (not {len(control)} control pins)")
+        inputs = tuple(index for index in range(len(names)) if index not in data)
+        SpecificMemory.layouts[key] = layout = (1 << len(address), address, data, control, inputs)
+        return layout
+
+    @staticmethod
+    def createChip(name: str, pinout: [str,], addressPins: str or [int or str,], dataPins: str or [int or str,] = "I/O0..7", controlPins: [int or str,] = ("VCC", "GND", "CEB", "OEB", "WEB"), volatile: bool = False, sparse: bool = False) -> type:
+        SpecificMemory.layout(pinout, addressPins, dataPins, controlPins)
+        bases = (RandomAccessMemory if volatile else ReadOnlyMemory,)
+        if sparse:
+            bases = (PagedMemory,) + bases
+        return type(str(name), bases, {
+            "pinout": tuple(pinout),
+            "addressPins": addressPins if isinstance(addressPins, str) else tuple(addressPins),
+            "dataPins": dataPins if isinstance(dataPins, str) else tuple(dataPins),
+            "controlPins": tuple(controlPins)
+        })
+
+    def __init__(self, pins: [str,] or int, data: [bytes,] or bytes or str = bytes(), pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple(), mapFile: str = None):
+        if mapFile is not None and data:
+            raise ValueError("A memory mapped onto an image file cannot also be given initial data")
+        self._size, addressIndexes, dataIndexes, controlIndexes, inputIndexes = SpecificMemory.layout(pins, self.addressPins, self.dataPins, self.controlPins)
+        self._mapFile = None
+        if mapFile is None:
+            self.allocate()
+        else:
+            image = self.mapImage(mapFile)
+            self._data = self._view = bytearray()
+            self.allocatePages()
         super().__init__(pins, data, pinValues, connections)
+        if mapFile is not None:
+            self._data = image
+            self._view = memoryview(self._data).toreadonly()
+            self._mapFile = mapFile
+            self.markDirty()
+        pins = self._pins
+        self._addressBus = Bus(tuple(pins[index] for index in addressIndexes))
+        self._dataBus = Bus(tuple(pins[index] for index in dataIndexes))
+        self._controlPins = tuple(pins[index] for index in controlIndexes)
+        self._inputPins = Bus(tuple(pins[index] for index in inputIndexes))
 
     def __len__(self) -> int:
-        return 32768 # == 2 ** 15
+        return self._size
+
+    def allocate(self):
+        self._data = bytearray(self._size)
+        self._view = memoryview(self._data).toreadonly()
+        self.allocatePages()
+
+    def allocatePages(self):
+        self._pages = [bytes(SpecificMemory.pageSize)] * (self._size // SpecificMemory.pageSize)
+        self._pageSnapshot = tuple(self._pages)
+        self._dirtyPages = set()
+        self._pageVersions = [0] * len(self._pages)
+
+    def mapImage(self, fileName: str) -> mmap.mmap:
+        if self.mapAccess == mmap.ACCESS_WRITE and not os.path.exists(fileName):
+            with open(fileName, "wb") as file:
+                file.truncate(len(self))
+        with open(fileName, "r+b" if self.mapAccess == mmap.ACCESS_WRITE else "rb") as file:
+            if os.fstat(file.fileno()).st_size != len(self):
+                raise ValueError(f"{fileName} is not a {len(self)}-byte memory image")
+            return mmap.mmap(file.fileno(), len(self), access=self.mapAccess)
 
-    def read(self, address: int or bytes) -> bytes:
+    @property
+    def mapFile(self) -> str:
+        return self._mapFile
+
+    def flush(self):
+        if self._mapFile is not None and self.mapAccess == mmap.ACCESS_WRITE:
+            self._data.flush()
+
+    def read(self, address: int or bytes) -> memoryview:
         address = self.validateAddress(address)
-        return self._data[address : address + 1]
+        return self._view[address : address + 1]
 
     def write(self, address: int or bytes, value: bytes):
-        if not isinstance(value, bytes):
+        if not isinstance(value, (bytes, bytearray, memoryview)):
             raise TypeError(f"Can only write bytes type data to memory not {type(value).__name__} ({value})")
         if len(value) != 1:
             raise ValueError(f"Memory addresses of {type(self).__name__} only store one byte")
         address = self.validateAddress(address)
-        self._data = self._data[:address] + value + self._data[address + 1:]
-
-    def readAddresses(self, addresses: [int or bytes,] or slice) -> [bytes,]:
+        self._data[address] = value[0]
+        page = address // SpecificMemory.pageSize
+        self._dirtyPages.add(page)
+        self._pageVersions[page] += 1
+        self.stimulate()
+
+    def store(self, address: int, value: int):
+        self._data[address] = value
+        page = address // SpecificMemory.pageSize
+        self._dirtyPages.add(page)
+        self._pageVersions[page] += 1
+
+    def readAddresses(self, addresses: [int or bytes,] or slice) -> memoryview or [memoryview,]:
+        if isinstance(addresses, slice):
+            return self._view[self.validateSlice(addresses)]
         addresses = self.validateAddresses(addresses)
         data = list()
         for address in addresses:
-            data.append(self.read(address))
+            data.append(self._view[address : address + 1])
         return tuple(data)
 
+    def writeAddresses(self, addresses: [int or bytes,] or slice, values: [bytes,] or bytes):
+        if isinstance(addresses, slice) and isinstance(values, (bytes, bytearray, memoryview)):
+            addresses = self.validateSlice(addresses)
+            length = len(range(addresses.start, addresses.stop, addresses.step))
+            if len(values) < length:
+                raise ValueError(f"Cannot write {len(values)} values to {length} addresses")
+            self._data[addresses] = values[:length]
+            if length:
+                self.markDirty(addresses.start, addresses.stop)
+            self.stimulate()
+        else:
+            addresses = self.validateAddresses(addresses)
+            for index in range(len(addresses)):
+                self.write(addresses[index], values[index : index + 1])
+
+    @property
+    def data(self) -> memoryview:
+        return self._view
+
+    @data.setter
+    def data(self, data: bytes or [bytes,]):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            if len(data) != len(self._data):
+                raise ValueError(f"Data is incorrect length (cannot set as {data})")
+            self._data[:] = data
+            self.markDirty()
+            self.stimulate()
+        else:
+            self.data = bytes().join(data)
+
+    @data.deleter
+    def data(self):
+        self._data[:] = bytes(len(self._data))
+        self.markDirty()
+        self.stimulate()
+
+    def load(self, fileName: str):
+        with open(fileName, "rb") as file:
+            if file.readinto(memoryview(self._data)) != len(self._data):
+                raise ValueError(f"{fileName} is not a {len(self._data)}-byte memory image")
+        self.markDirty()
+        self.stimulate()
+
+    def markDirty(self, start: int = 0, stop: int = None):
+        if stop is None:
+            stop = len(self)
+        pages = range(start // SpecificMemory.pageSize, (stop - 1) // SpecificMemory.pageSize + 1)
+        self._dirtyPages.update(pages)
+        for page in pages:
+            self._pageVersions[page] += 1
+
+    def pageVersion(self, page: int) -> int:
+        return self._pageVersions[page]
+
+    def pageSnapshot(self) -> [bytes,]:
+        if self._dirtyPages:
+            pageSize = SpecificMemory.pageSize
+            for page in self._dirtyPages:
+                self._pages[page] = bytes(self._view[page * pageSize : (page + 1) * pageSize])
+            self._dirtyPages.clear()
+            self._pageSnapshot = tuple(self._pages)
+        return self._pageSnapshot
+
+    def restorePages(self, pages: [bytes,]):
+        if len(pages) != len(self._pages):
+            raise ValueError(f"{type(self).__name__} has {len(self._pages)} pages so cannot restore {len(pages)}")
+        pageSize = SpecificMemory.pageSize
+        for page in range(len(pages)):
+            if pages[page] is not self._pages[page] or page in self._dirtyPages:
+                if len(pages[page]) != pageSize:
+                    raise ValueError(f"Memory pages are {pageSize} bytes (not {len(pages[page])})")
+                self._data[page * pageSize : (page + 1) * pageSize] = pages[page]
+                self._pageVersions[page] += 1
+        self._pages = list(pages)
+        self._pageSnapshot = tuple(pages)
+        self._dirtyPages.clear()
+        self.stimulate()
+
+    def snapshot(self) -> {str: any}:
+        return {"pins": self.packedPinStates, "pages": self.pageSnapshot()}
+
+    def restore(self, snapshot: {str: any}):
+        self.packedPinStates = snapshot["pins"]
+        self.restorePages(snapshot["pages"])
+
+    def response(self):
+        power, ground, chipEnable, outputEnable, writeEnable = self._controlPins
+        high, low = power.packedState, ground.packedState
+        self._inputPins.release()
+        if chipEnable.value == high & 1:
+            mode = outputEnable.value, writeEnable.value
+            if mode == (low & 1, high & 1):
+                self._dataBus.drivePacked(self._data[self._addressBus.read()], high, low)
+                return
+            self._dataBus.release()
+            if mode == (high & 1, low & 1):
+                self.write(self._addressBus.read(), bytes((self._dataBus.read(),)))
+            return
+        self._dataBus.release()
+
+class PageTable:
+    def __init__(self, size: int, pageSize: int = 256):
+        if pageSize <= 0 or pageSize & (pageSize - 1):
+            raise ValueError(f"Page size must be a power of two ({pageSize} is not)")
+        if size < 0 or size % pageSize != 0:
+            raise ValueError(f"Size must be a whole number of {pageSize}-byte pages ({size} is not)")
+        self._size = size
+        self._pageSize = pageSize
+        self._shift = pageSize.bit_length() - 1
+        self._mask = pageSize - 1
+        self._pages = dict()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def pageSize(self) -> int:
+        return self._pageSize
+
+    @property
+    def allocated(self) -> [int,]:
+        return self._pages.keys()
+
+    def page(self, page: int) -> bytearray or None:
+        return self._pages.get(page)
+
+    def clear(self):
+        self._pages.clear()
+
+    def validateIndex(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"Index {index} is out of range for a {self._size}-byte page table")
+        return index
+
+    def __getitem__(self, index: int or slice) -> int or bytes:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step != 1:
+                return bytes(self[address] for address in range(start, stop, step))
+            data = bytearray(max(0, stop - start))
+            for page in range(start >> self._shift, ((stop - 1) >> self._shift) + 1 if stop > start else 0):
+                contents = self._pages.get(page)
+                if contents is not None:
+                    pageStart = page << self._shift
+                    first, last = max(start, pageStart), min(stop, pageStart + self._pageSize)
+                    data[first - start : last - start] = contents[first - pageStart : last - pageStart]
+            return bytes(data)
+        index = self.validateIndex(index)
+        contents = self._pages.get(index >> self._shift)
+        return 0 if contents is None else contents[index & self._mask]
+
+    def __setitem__(self, index: int or slice, value: int or bytes):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            addresses = range(start, stop, step)
+            if len(value) != len(addresses):
+                raise ValueError(f"Cannot assign {len(value)} bytes to {len(addresses)} addresses of a page table")
+            if step != 1:
+                for offset in range(len(addresses)):
+                    self[addresses[offset]] = value[offset]
+                return
+            value = bytes(value)
+            for page in range(start >> self._shift, ((stop - 1) >> self._shift) + 1 if stop > start else 0):
+                pageStart = page << self._shift
+                first, last = max(start, pageStart), min(stop, pageStart + self._pageSize)
+                chunk = value[first - start : last - start]
+                empty = chunk.count(0) == len(chunk)
+                contents = self._pages.get(page)
+                if contents is None:
+                    if empty:
+                        continue
+                    contents = self._pages[page] = bytearray(self._pageSize)
+                elif empty and len(chunk) == self._pageSize:
+                    del self._pages[page]
+                    continue
+                contents[first - pageStart : last - pageStart] = chunk
+            return
+        index = self.validateIndex(index)
+        contents = self._pages.get(index >> self._shift)
+        if contents is None:
+            if not value:
+                return
+            contents = self._pages[index >> self._shift] = bytearray(self._pageSize)
+        contents[index & self._mask] = value
+
+class PagedMemory(SpecificMemory):
+    def allocate(self):
+        self._data = self._view = PageTable(self._size, SpecificMemory.pageSize)
+        self.allocatePages()
+
+    def allocatePages(self):
+        self._pages = dict()
+        self._pageSnapshot = dict()
+        self._dirtyPages = set()
+        self._pageVersions = defaultdict(int)
+
+    def mapImage(self, fileName: str):
+        raise ValueError(f"{type(self).__name__} allocates pages on demand so cannot be mapped onto an image file")
+
+    @property
+    def allocatedPages(self) -> [int,]:
+        return tuple(sorted(self._data.allocated))
+
+    @property
+    def data(self) -> PageTable:
+        return self._data
+
+    @data.setter
+    def data(self, data: bytes or [bytes,] or {int: bytes}):
+        if isinstance(data, dict):
+            self.restorePages(data)
+        else:
+            SpecificMemory.data.__set__(self, data)
+
+    @data.deleter
+    def data(self):
+        self.markDirty()
+        self._data.clear()
+        self.stimulate()
+
+    def internalState(self) -> {str: any}:
+        state = Component.internalState(self)
+        state["data"] = dict(self.pageSnapshot())
+        return state
+
+    def save(self, fileName: str):
+        pageSize = SpecificMemory.pageSize
+        with open(fileName, "wb") as file:
+            for page in self.allocatedPages:
+                file.seek(page * pageSize)
+                file.write(self._data.page(page))
+            file.truncate(len(self))
+
+    def load(self, fileName: str):
+        pageSize = SpecificMemory.pageSize
+        with open(fileName, "rb") as file:
+            if os.fstat(file.fileno()).st_size != len(self):
+                raise ValueError(f"{fileName} is not a {len(self)}-byte memory image")
+            del self.data
+            for start in range(0, len(self), pageSize):
+                self._data[start : start + pageSize] = file.read(pageSize)
+        self.markDirty()
+        self.stimulate()
+
+    def markDirty(self, start: int = 0, stop: int = None):
+        if stop is None:
+            stop = len(self)
+        first, last = start // SpecificMemory.pageSize, (stop - 1) // SpecificMemory.pageSize + 1
+        if last - first <= len(self._pageVersions):
+            pages = range(first, last)
+        else:
+            pages = tuple(page for page in set(self._data.allocated).union(self._pageVersions) if first <= page < last)
+        self._dirtyPages.update(pages)
+        for page in pages:
+            self._pageVersions[page] += 1
+
+    def pageVersion(self, page: int) -> int:
+        return self._pageVersions.get(page, 0)
+
+    def pageSnapshot(self) -> {int: bytes}:
+        if self._dirtyPages:
+            for page in self._dirtyPages:
+                contents = self._data.page(page)
+                if contents is None:
+                    self._pages.pop(page, None)
+                else:
+                    self._pages[page] = bytes(contents)
+            self._dirtyPages.clear()
+            self._pageSnapshot = dict(self._pages)
+        return self._pageSnapshot
+
+    def restorePages(self, pages: {int: bytes}):
+        pageSize = SpecificMemory.pageSize
+        for page, contents in pages.items():
+            if not 0 <= page < len(self) // pageSize:
+                raise ValueError(f"{type(self).__name__} has no page {page}")
+            if len(contents) != pageSize:
+                raise ValueError(f"Memory pages are {pageSize} bytes (not {len(contents)})")
+        for page in set(self._data.allocated).union(pages):
+            contents = pages.get(page)
+            if contents is not self._pages.get(page) or page in self._dirtyPages:
+                self._data[page * pageSize : (page + 1) * pageSize] = bytes(pageSize) if contents is None else contents
+                self._pageVersions[page] += 1
+        self._pages = dict(pages)
+        self._pageSnapshot = dict(pages)
+        self._dirtyPages.clear()
+        self.stimulate()
+
+class MemoryMap:
+    class MemoryMapError(ValueError):
+        pass
+
+    pageSize = 256
+
+    def __init__(self, regions: [[int, int, Memory, bool],] = tuple(), addressSpace: int = 65536):
+        if addressSpace % MemoryMap.pageSize != 0:
+            raise MemoryMap.MemoryMapError(f"Address space must be a whole number of {MemoryMap.pageSize}-byte pages ({addressSpace} is not)")
+        self._addressSpace = addressSpace
+        self._pages = [None] * (addressSpace // MemoryMap.pageSize)
+        self._version = 0
+        for region in regions:
+            self.map(*region)
+
+    def __len__(self) -> int:
+        return self._addressSpace
+
+    @property
+    def regions(self) -> [[int, int, Memory, bool],]:
+        regions = list()
+        previous = None
+        for page in range(len(self._pages)):
+            entry = self._pages[page]
+            if entry is None:
+                previous = None
+                continue
+            address = page * MemoryMap.pageSize
+            if previous is not None and entry[0] is previous[0] and entry[2:] == previous[2:]:
+                regions[-1] = regions[-1][0], address + MemoryMap.pageSize, entry[0], entry[4]
+            else:
+                regions.append((address, address + MemoryMap.pageSize, entry[0], entry[4]))
+            previous = entry
+        return tuple(regions)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def map(self, start: int, stop: int, memory: Memory, writable: bool = True):
+        self.mapPages(start, stop, memory, writable)
+
+    def mapPages(self, start: int, stop: int, memory: Memory, writable: bool = True, offset: int = 0):
+        if not isinstance(memory, Memory):
+            raise TypeError(f"Only memory components can be mapped into an address space (not {type(memory).__name__})")
+        if start % MemoryMap.pageSize != 0 or stop % MemoryMap.pageSize != 0:
+            raise MemoryMap.MemoryMapError(f"Regions must start and stop on {MemoryMap.pageSize}-byte page boundaries ({start} to {stop} does not)")
+        if not 0 <= start < stop <= self._addressSpace:
+            raise MemoryMap.MemoryMapError(f"Region {start} to {stop} is not within the address space")
+        for page in range(start // MemoryMap.pageSize, stop // MemoryMap.pageSize):
+            self._pages[page] = (memory, memory.data, start - offset, len(memory), writable)
+        self._version += 1
+
+    def locate(self, address: int) -> [Memory, int] or None:
+        page = self._pages[address >> 8]
+        if page is None:
+            return None
+        memory, data, start, length, writable = page
+        return memory, (address - start) % length
+
+    def pageVersion(self, page: int) -> int:
+        entry = self._pages[page]
+        if entry is None or not isinstance(entry[0], SpecificMemory):
+            return 0
+        memory, data, start, length, writable = entry
+        return memory.pageVersion(((page * MemoryMap.pageSize - start) % length) // SpecificMemory.pageSize)
+
+    def read(self, address: int) -> int:
+        page = self._pages[address >> 8]
+        if page is None:
+            return 0
+        memory, data, start, length, writable = page
+        return data[(address - start) % length]
+
+    def write(self, address: int, value: int):
+        page = self._pages[address >> 8]
+        if page is not None:
+            memory, data, start, length, writable = page
+            if writable:
+                memory.write((address - start) % length, bytes((value,)))
+
+    def store(self, address: int, value: int):
+        page = self._pages[address >> 8]
+        if page is not None:
+            memory, data, start, length, writable = page
+            if writable:
+                memory.store((address - start) % length, value)
+
+    def stimulate(self):
+        for start, stop, memory, writable in self.regions:
+            memory.stimulate()
+
+class MemoryManagementUnit(Memory):
+    def __init__(self, windows: [[int, int, Memory, bool],], registerAddress: int, addressSpace: int = 65536, pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple()):
+        if not windows:
+            raise MemoryMap.MemoryMapError("A memory management unit needs at least one banked window")
+        self._memoryMap = MemoryMap(addressSpace = addressSpace)
+        self._windows = tuple((int(start), int(stop), memory, bool(writable)) for start, stop, memory, writable in windows)
+        for start, stop, memory, writable in self._windows:
+            self._memoryMap.map(start, stop, memory, writable)
+        self._registers = bytearray(len(self._windows))
+        self._view = memoryview(self._registers).toreadonly()
+        addressWidth = (addressSpace - 1).bit_length()
+        super().__init__(("VCC", "GND", "PHI2", "RWB") + tuple(f"A{bit}" for bit in range(addressWidth)) + tuple(f"D{bit}" for bit in range(8)), bytes(), pinValues, connections)
+        self._memoryMap.map(registerAddress, registerAddress + MemoryMap.pageSize, self, True)
+        self._registerAddress = registerAddress
+        self._controlPins = self.pinsSelect(("VCC", "GND", "PHI2", "RWB"))
+        self._addressBus = self.bus(f"A0..{addressWidth - 1}")
+        self._dataBus = self.bus("D0..7")
+        self._inputPins = Bus(self._controlPins + self._addressBus.pins)
+
+    def __len__(self) -> int:
+        return len(self._registers)
+
+    @property
+    def memoryMap(self) -> MemoryMap:
+        return self._memoryMap
+
+    @property
+    def windows(self) -> [[int, int, Memory, bool],]:
+        return self._windows
+
+    @property
+    def registerAddress(self) -> int:
+        return self._registerAddress
+
+    @property
+    def banks(self) -> [int,]:
+        return tuple(self._registers)
+
+    def mapBank(self, window: int):
+        start, stop, memory, writable = self._windows[window]
+        self._memoryMap.mapPages(start, stop, memory, writable, self._registers[window] * (stop - start) % len(memory))
+
+    def read(self, address: int or bytes) -> memoryview:
+        address = self.validateAddress(address)
+        return self._view[address : address + 1]
+
+    def write(self, address: int or bytes, value: bytes):
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            raise TypeError(f"Can only write bytes type data to memory not {type(value).__name__} ({value})")
+        if len(value) != 1:
+            raise ValueError(f"Bank registers of {type(self).__name__} only store one byte")
+        address = self.validateAddress(address)
+        self._registers[address] = value[0]
+        self.mapBank(address)
+        self.stimulate()
+
+    def store(self, address: int, value: int):
+        self._registers[address] = value
+        self.mapBank(address)
+
+    def readAddresses(self, addresses: [int or bytes,] or slice) -> memoryview or [memoryview,]:
+        if isinstance(addresses, slice):
+            return self._view[self.validateSlice(addresses)]
+        return tuple(self.read(address) for address in self.validateAddresses(addresses))
+
     def writeAddresses(self, addresses: [int or bytes,] or slice, values: [bytes,] or bytes):
         addresses = self.validateAddresses(addresses)
+        if len(values) < len(addresses):
+            raise ValueError(f"Cannot write {len(values)} values to {len(addresses)} addresses")
         for index in range(len(addresses)):
             self.write(addresses[index], values[index : index + 1])
 
     @property
-    def data(self) -> bytes:
-        return self._data
+    def data(self) -> memoryview:
+        return self._view
 
     @data.setter
     def data(self, data: bytes or [bytes,]):
-        if isinstance(data, bytes):
-            if len(data) != len(self._data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            if len(data) != len(self._registers):
                 raise ValueError(f"Data is incorrect length (cannot set as {data})")
-            self._data = data
+            self.writeAddresses(slice(None), data)
         else:
-            unaddressedData = bytes()
-            for address in data:
-                unaddressedData += address
-            self.data = unaddressedData
+            self.data = bytes().join(data)
 
     @data.deleter
     def data(self):
-        self._data = bytes(2 ** 15)
+        self.writeAddresses(slice(None), bytes(len(self._registers)))
 
     def response(self):
-        high, low = self.getPinsStates((28, 14))
-        self.makePinsPassive(slice(None))
-        if self.getPin(20) == high[0]:
-            addressPins = 10, 9, 8, 7, 6, 5, 4, 3, 25, 24, 21, 23, 2, 26, 1
-            dataPins = 11, 12, 13, 15, 16, 17, 18, 19
-            address = 0
-            for bit in range(15):
-                address += self.getPin(addressPins[bit]) * (2 ** bit)
-            modePins = self.getPins((22, 27))
-            if modePins == (high[0], low[0]):
-                data = 0
-                for bit in range(8):
-                    data += self.getPin(dataPins[bit] * (2 ** bit))
-                self.write(address, bytes([data]))
-            elif modePins == (low[0], high[0]):
-                data = bytesToTuple(self.read(address))[::-1]
-                for bit in range(8):
-                    if data[bit]:
-                        self.setPinState(dataPins[bit], high)
-                    else:
-                        self.setPinState(dataPins[bit], low)
+        power, ground, clock, readWrite = self._controlPins
+        high, low = power.packedState, ground.packedState
+        self._inputPins.release()
+        if clock.value == high & 1:
+            address = self._addressBus.read()
+            if readWrite.value == low & 1:
+                self._dataBus.release()
+                self._memoryMap.write(address, self._dataBus.read())
+                return
+            if self._memoryMap.locate(address) is not None:
+                self._dataBus.drivePacked(self._memoryMap.read(address), high, low)
+                return
+        self._dataBus.release()
 
 class ReadOnlyMemory(SpecificMemory):
-    def __init__(self, data: [bytes,] or bytes or str = bytes(), pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple()):
-        super().__init__(
-            (
-                "A14",  "A12",  "A7",   "A6",   "A5",   "A4",   "A3",
-                "A2",   "A1",   "A0",   "I/O0", "I/O1", "I/O2", "GND",
-                "I/O3", "I/O4", "I/O5", "I/O6", "I/O7", "CEB",  "A10",
-                "OEB",  "A11",  "A9",   "A8",   "A13",  "WEB",  "VCC"
-            ),
-            data, pinValues, connections)
+    mapAccess = mmap.ACCESS_COPY
+    pinout = (
+        "A14",  "A12",  "A7",   "A6",   "A5",   "A4",   "A3",
+        "A2",   "A1",   "A0",   "I/O0", "I/O1", "I/O2", "GND",
+        "I/O3", "I/O4", "I/O5", "I/O6", "I/O7", "CEB",  "A10",
+        "OEB",  "A11",  "A9",   "A8",   "A13",  "WEB",  "VCC"
+    )
+    addressPins = "A0..14"
+
+    def __init__(self, data: [bytes,] or bytes or str = bytes(), pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple(), mapFile: str = None):
+        super().__init__(self.pinout, data, pinValues, connections, mapFile)
 
 class RandomAccessMemory(SpecificMemory):
-    def __init__(self, data: [bytes,] or bytes or str = bytes(), pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple()):
-        super().__init__(
-            (
-                "A14",  "A12",  "A7",   "A6",   "A5",   "A4",   "A3",
-                "A2",   "A1",   "A0",   "I/O0", "I/O1", "I/O2", "Vss",
-                "I/O3", "I/O4", "I/O5", "I/O6", "I/O7", "CSB",  "A10",
-                "OEB",  "A11",  "A9",   "A8",   "A13",  "WEB",  "Vcc"
-            ),
-            data, pinValues, connections)
+    pinout = (
+        "A14",  "A12",  "A7",   "A6",   "A5",   "A4",   "A3",
+        "A2",   "A1",   "A0",   "I/O0", "I/O1", "I/O2", "Vss",
+        "I/O3", "I/O4", "I/O5", "I/O6", "I/O7", "CSB",  "A10",
+        "OEB",  "A11",  "A9",   "A8",   "A13",  "WEB",  "Vcc"
+    )
+    addressPins = "A0..14"
+    controlPins = ("Vcc", "Vss", "CSB", "OEB", "WEB")
+
+    def __init__(self, data: [bytes,] or bytes or str = bytes(), pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple(), mapFile: str = None):
+        super().__init__(self.pinout, data, pinValues, connections, mapFile)
 
     def response(self):
-        if not self.getPin(28):
-            del self.data
+        if not self._controlPins[0].value:
+            if self._mapFile is None:
+                del self.data
             self.makePinsPassive(slice(None))
         else:
             super().response()
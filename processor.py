@@ -1,15 +1,243 @@
+from __future__ import annotations
 from instruction_set import InstructionSet
-from component import Component
-from general import intToBool, bytesToTuple, sliceToTuple
+from component import Component, Bus
+from memory import MemoryMap
+from execution_trace import TraceRecorder
+from general import intToBool, sliceToTuple
+
+class StatusFlags:
+    carry = 0x01
+    zero = 0x02
+    interruptDisable = 0x04
+    decimal = 0x08
+    breakCommand = 0x10
+    unused = 0x20
+    overflow = 0x40
+    negative = 0x80
+
+class FunctionalCore:
+    registerNames = "PC", "IR", "P", "S", "A", "X", "Y"
+    maxBlockLength = 64
+
+    def __init__(self, instructionSet: InstructionSet, memoryMap: MemoryMap, translate: bool = False):
+        if not isinstance(instructionSet, InstructionSet):
+            raise TypeError(f"A functional core's instruction set must inherit from InstructionSet ({instructionSet} does not)")
+        if not isinstance(memoryMap, MemoryMap):
+            raise TypeError(f"A functional core accesses memory through a MemoryMap (not {type(memoryMap).__name__})")
+        self._instructionSet = instructionSet
+        self._memoryMap = memoryMap
+        self.read = memoryMap.read # bound directly so operand reads skip a method call
+        self._store = memoryMap.store
+        self._instructions = tuple(instructionSet.getInstruction(opcode) if instructionSet.getMetadata(opcode)[2] is not None else (None, None) for opcode in range(256))
+        self.PC = self.IR = self.P = self.A = self.X = self.Y = 0
+        self.S = 0xFF
+        self.instructions = 0
+        self.waiting = False
+        self.stopped = False
+        self._translate = bool(translate)
+        self._blocks = dict()
+        self._blockPages = dict()
+        self._pageVersions = dict()
+        self._mapVersion = memoryMap.version
+
+    @property
+    def instructionSet(self) -> InstructionSet:
+        return self._instructionSet
+
+    @property
+    def translate(self) -> bool:
+        return self._translate
+
+    @translate.setter
+    def translate(self, translate: bool):
+        self._translate = bool(translate)
+        if not self._translate:
+            self.flushTranslations()
+
+    @property
+    def blocks(self) -> {int: [callable, int]}:
+        return self._blocks.copy()
+
+    @property
+    def memoryMap(self) -> MemoryMap:
+        return self._memoryMap
+
+    def loadRegisters(self, processor: Processor):
+        for register in FunctionalCore.registerNames:
+            setattr(self, register, int.from_bytes(processor.getRegister(register), "big"))
+
+    def storeRegisters(self, processor: Processor):
+        for register in FunctionalCore.registerNames:
+            processor.setRegister(register, getattr(self, register).to_bytes(len(processor.getRegister(register)), "big"))
+
+    def write(self, address: int, value: int):
+        self._store(address, value)
+        if address >> 8 in self._blockPages:
+            self.invalidatePage(address >> 8)
+        if self._memoryMap.version != self._mapVersion:
+            self._mapVersion = self._memoryMap.version
+            self.flushTranslations()
+
+    def readWord(self, address: int) -> int:
+        return self._memoryMap.read(address) | self._memoryMap.read((address + 1) & 0xFFFF) << 8
+
+    def readZeroPageWord(self, address: int) -> int:
+        return self._memoryMap.read(address) | self._memoryMap.read((address + 1) & 0xFF) << 8
+
+    def push(self, value: int):
+        self._store(0x100 | self.S, value)
+        if 0x01 in self._blockPages:
+            self.invalidatePage(0x01)
+        self.S = (self.S - 1) & 0xFF
+
+    def pull(self) -> int:
+        self.S = (self.S + 1) & 0xFF
+        return self._memoryMap.read(0x100 | self.S)
+
+    def setNZ(self, value: int):
+        self.P = (self.P & 0x7D) | (value & 0x80) | ((value == 0) << 1)
+
+    def setFlag(self, flag: int, condition: bool):
+        if condition:
+            self.P |= flag
+        else:
+            self.P &= ~flag & 0xFF
+
+    def reset(self):
+        self.S = 0xFF
+        self.P = (self.P | StatusFlags.interruptDisable | StatusFlags.unused) & ~StatusFlags.decimal & 0xFF
+        self.PC = self.readWord(0xFFFC)
+        self.waiting = self.stopped = False
+
+    def step(self):
+        PC = self.PC
+        read = self._memoryMap.read
+        opcode = read(PC)
+        operation, addressingMode = self._instructions[opcode]
+        if operation is None:
+            self.PC = (PC + 1) & 0xFFFF
+        else:
+            length = addressingMode.operandLength
+            if length == 0:
+                operand = 0
+            elif length == 1:
+                operand = read((PC + 1) & 0xFFFF)
+            else:
+                operand = read((PC + 1) & 0xFFFF) | read((PC + 2) & 0xFFFF) << 8
+            self.PC = (PC + 1 + length) & 0xFFFF
+            self.IR = opcode
+            operation.perform(self, addressingMode, operand)
+        self.instructions += 1
+
+    def translateBlock(self, PC: int) -> [callable, int]:
+        read = self._memoryMap.read
+        namespace = {"blocks": self._blocks}
+        source = ["def block(core):"]
+        pages = set()
+        address = PC
+        lastOpcode = None
+        length = 0
+        while length < FunctionalCore.maxBlockLength:
+            opcode = read(address)
+            operation, addressingMode = self._instructions[opcode]
+            operandLength = 0 if operation is None else addressingMode.operandLength
+            operand = 0
+            for byte in range(operandLength, 0, -1):
+                operand = operand << 8 | read((address + byte) & 0xFFFF)
+            for byte in range(operandLength + 1):
+                pages.add(((address + byte) & 0xFFFF) >> 8)
+            address = (address + 1 + operandLength) & 0xFFFF
+            length += 1
+            if operation is not None:
+                lastOpcode = opcode
+                namespace[f"perform{length}"] = operation.perform
+                namespace[f"mode{length}"] = addressingMode
+                if operation.transfersControl:
+                    source.append(f"    core.PC = {address}")
+                    source.append(f"    core.IR = {opcode}")
+                    source.append(f"    perform{length}(core, mode{length}, {operand})")
+                    break
+                source.append(f"    perform{length}(core, mode{length}, {operand})")
+                source.append(f"    if {PC} not in blocks:")
+                source.append(f"        core.PC = {address}")
+                source.append(f"        core.IR = {opcode}")
+                source.append(f"        core.instructions += {length}")
+                source.append(f"        return {length}")
+        else:
+            source.append(f"    core.PC = {address}")
+            if lastOpcode is not None:
+                source.append(f"    core.IR = {lastOpcode}")
+        source.append(f"    core.instructions += {length}")
+        source.append(f"    return {length}")
+        exec(compile("\n".join(source), f"<block {PC:04X}>", "exec"), namespace)
+        block = namespace["block"], length
+        for page in pages:
+            version = self._memoryMap.pageVersion(page)
+            if self._pageVersions.get(page, version) != version:
+                self.invalidatePage(page)
+            self._pageVersions[page] = version
+            self._blockPages.setdefault(page, set()).add(PC)
+        self._blocks[PC] = block
+        return block
+
+    def invalidatePage(self, page: int):
+        self._pageVersions.pop(page, None)
+        for PC in self._blockPages.pop(page, tuple()):
+            self._blocks.pop(PC, None)
+
+    def validateTranslations(self):
+        memoryMap = self._memoryMap
+        if memoryMap.version != self._mapVersion:
+            self._mapVersion = memoryMap.version
+            self.flushTranslations()
+            return
+        for page, version in tuple(self._pageVersions.items()):
+            if memoryMap.pageVersion(page) != version:
+                self.invalidatePage(page)
+
+    def flushTranslations(self):
+        self._blocks.clear()
+        self._blockPages.clear()
+        self._pageVersions.clear()
+
+    def run(self, instructions: int) -> int:
+        if self._translate:
+            return self.runTranslated(instructions)
+        executed = 0
+        step = self.step
+        while executed < instructions and not (self.stopped or self.waiting):
+            step()
+            executed += 1
+        return executed
+
+    def runTranslated(self, instructions: int) -> int:
+        self.validateTranslations()
+        executed = 0
+        blocks = self._blocks
+        while executed < instructions and not (self.stopped or self.waiting):
+            block = blocks.get(self.PC)
+            if block is None:
+                block = self.translateBlock(self.PC)
+            function, length = block
+            if executed + length > instructions:
+                self.step()
+                executed += 1
+            else:
+                executed += function(self)
+        return executed
 
 class Processor(Component):
     class InvalidRegisterError(Exception):
         pass
 
+    class ExecutionModeError(Exception):
+        pass
+
     def __init__(self, instructionSet: InstructionSet, registerValues: [bytes,] or bytes = tuple(), currentClock: bool = False, pinValues: [bool or int,] or bytes = bytes(), connections: [[Component, [[int or str, int or str],]],] = tuple()):
         if not isinstance(instructionSet, InstructionSet):
             raise TypeError(f"A processor's instruction set must inherit from InstructionSet ({instructionSet} does not)")
         self._instructionSet = instructionSet
+        self._dispatch = instructionSet.dispatch
         self._registers = {
             "PC"  : bytes(2),
             "IR"  : bytes(1),
@@ -21,6 +249,8 @@ class Processor(Component):
             "Y"   : bytes(1)
         }
         self._currentClock = False
+        self._functionalCore = None
+        self._tracer = None
         super().__init__(
             (
                 "VPB",  "RDY",  "PHI1O", "IRQB",  "MLB",
@@ -34,6 +264,8 @@ class Processor(Component):
             ),
             pinValues, connections
         )
+        self._addressBus = self.bus("A0..A15")
+        self._dataBus = self.bus("D0..D7")
         if registerValues:
             self.setRegisters(slice(None), registerValues)
         if currentClock:
@@ -43,6 +275,14 @@ class Processor(Component):
     def registers(self) -> [str,]:
         return tuple(self._registers.keys())
 
+    @property
+    def addressBus(self) -> Bus:
+        return self._addressBus
+
+    @property
+    def dataBus(self) -> Bus:
+        return self._dataBus
+
     def registerSelect(self, register: str or int) -> str:
         if isinstance(register, int):
             return self.registers[register]
@@ -70,6 +310,7 @@ class Processor(Component):
         if len(value) != len(self._registers[register]):
             raise ValueError(f"{register} is a {len(self._registers[register])}-byte register so cannot be set with a {len(value)}-byte value ({value})")
         self._registers[register] = value
+        self.stimulate()
 
     def getRegisters(self, registers: [int or str,] or slice) -> [bytes,]:
         registers = self.registersSelect(registers)
@@ -97,14 +338,18 @@ class Processor(Component):
             self.setRegisters(slice(None), prevValues)
             raise error
 
-    @property
-    def state(self) -> {str: any}:
-        state = Component.state.__get__(self)
-        state["registers"] = self.getRegisters(slice(None))
+    def internalState(self) -> {str: any}:
+        state = Component.internalState(self)
+        core = self._functionalCore
+        if core is None:
+            state["registers"] = self.getRegisters(slice(None))
+        else:
+            state["registers"] = tuple(getattr(core, register).to_bytes(len(value), "big") if register in FunctionalCore.registerNames else value for register, value in self._registers.items())
+            state["functionalCore"] = core.waiting, core.stopped
         state["currentClock"] = self._currentClock
         return state
 
-    @state.setter
+    @Component.state.setter
     def state(self, state: {str: any}):
         prevState = self.state
         Component.state.__set__(self, state)
@@ -122,6 +367,9 @@ class Processor(Component):
         except Exception as error:
             self.state = prevState
             raise error
+        if self._functionalCore is not None:
+            self._functionalCore.loadRegisters(self)
+            self._functionalCore.waiting, self._functionalCore.stopped = state.get("functionalCore", (False, False))
 
     @state.deleter
     def state(self):
@@ -130,7 +378,50 @@ class Processor(Component):
             self._registers[register] = bytes(len(self._registers[register]))
         self._currentClock = False
 
+    @property
+    def tracer(self) -> TraceRecorder:
+        return self._tracer
+
+    @tracer.setter
+    def tracer(self, tracer: TraceRecorder):
+        if tracer is not None and not isinstance(tracer, TraceRecorder):
+            raise TypeError(f"A processor can only be traced by a TraceRecorder (not {type(tracer).__name__})")
+        self._tracer = tracer
+
+    @tracer.deleter
+    def tracer(self):
+        self._tracer = None
+
+    @property
+    def functionalCore(self) -> FunctionalCore:
+        return self._functionalCore
+
+    def enterFunctionalMode(self, memoryMap: MemoryMap, translate: bool = False) -> FunctionalCore:
+        if self._functionalCore is not None:
+            raise Processor.ExecutionModeError("Processor is already in functional mode")
+        if self._registers["TCU"] != bytes(1):
+            raise Processor.ExecutionModeError("Execution mode can only be changed at an instruction boundary (TCU must be 0)")
+        core = FunctionalCore(self._instructionSet, memoryMap, translate)
+        core.loadRegisters(self)
+        self._functionalCore = core
+        return core
+
+    def exitFunctionalMode(self):
+        if self._functionalCore is None:
+            raise Processor.ExecutionModeError("Processor is not in functional mode")
+        self._functionalCore.storeRegisters(self)
+        self._functionalCore.memoryMap.stimulate()
+        self._functionalCore = None
+        self.setRegister("TCU", bytes(1))
+
+    def executeInstructions(self, instructions: int) -> int:
+        if self._functionalCore is None:
+            raise Processor.ExecutionModeError("Whole instructions can only be executed in functional mode")
+        return self._functionalCore.run(instructions)
+
     def response(self): # TODO (incomplete)
+        if self._functionalCore is not None:
+            return
         high, low, clock = self.getPinsStates(("VDD", "VSS", "PHI2"))
         self.setPinState("PHI2O", clock)
         self.setPinState("PHI1O", (not clock[0], clock[1]))
@@ -138,19 +429,21 @@ class Processor(Component):
             TCU = self.getRegister("TCU")
             incrementTCU = True
             if TCU == bytes(1):
-                address = bytesToTuple(self.getRegister("PC"))
-                for bit in range(16):
-                    self.setPinState(f"A{bit}", (address[bit], True))
+                self._addressBus.drive(int.from_bytes(self.getRegister("PC"), "big"))
                 self.setPinState("RWB", high)
             else:
                 if TCU == bytes([1]):
-                    instruction = 0
-                    for bit in range(8):
-                        instruction += self.getRegister(f"D{bit}") * 2 ** bit
-                    self.setRegister("IR", bytes((instruction,)))
-                self._instructionSet.execute(self, self.getRegister("IR"))
+                    self.setRegister("IR", bytes((self._dataBus.read(),)))
+                self._dispatch[self._registers["IR"][0]](self)
                 if self.getRegister("TCU") == bytes(1):
                     incrementTCU = False
                 if incrementTCU:
                     self.setRegister("TCU", bytes((int.from_bytes(TCU, "little") + 1,)))
-        self._currentClock = clock
+            if self._tracer is not None:
+                registers = self._registers
+                self._tracer.record(
+                    int.from_bytes(registers["PC"], "big"), registers["IR"][0],
+                    registers["A"][0], registers["X"][0], registers["Y"][0], registers["S"][0], registers["P"][0],
+                    self._addressBus.read(), self._dataBus.read(), self.getPin("RWB")
+                )
+        self._currentClock = clock[0]
@@ -1,7 +1,156 @@
+from __future__ import annotations
 from user_interface import UserInterface
 from assembler import Assembler
 from component import Component
+from memory import Memory
+from processor import Processor
+from execution_trace import TraceRecorder
 from general import strToDict
+from collections import deque
+import importlib.util
+import argparse
+import operator
+import json
+import time
+import re
+
+class Scheduler:
+    class UnsettledCircuitError(RuntimeError):
+        pass
+
+    def __init__(self, components: [Component,], maxDeltas: int = 1000):
+        self._components = list()
+        for component in components:
+            if Component.isComponent(component):
+                self._components.append(component)
+        self._components = tuple(self._components)
+        self._maxDeltas = maxDeltas
+        self._nets = tuple()
+        self._componentNets = dict()
+        self._netComponents = dict()
+        self._evaluations = 0
+
+    @property
+    def components(self) -> [Component,]:
+        return self._components
+
+    @property
+    def evaluations(self) -> int:
+        return self._evaluations
+
+    def _compile(self):
+        componentNets = dict()
+        netComponents = dict()
+        for component in self._components:
+            nets = list()
+            for pin in component.pinsSelect(slice(None)):
+                net = pin.net
+                if net not in nets:
+                    nets.append(net)
+                netComponents.setdefault(net, list()).append(component)
+            componentNets[component] = tuple(nets)
+        for net in netComponents:
+            netComponents[net] = tuple(netComponents[net])
+        self._componentNets = componentNets
+        self._netComponents = netComponents
+        self._nets = tuple(netComponents)
+
+    def schedule(self, component: Component):
+        component.stimulate()
+
+    def _evaluate(self, component: Component) -> [Component,]:
+        nets = self._componentNets[component]
+        signatures = list()
+        for net in nets:
+            signatures.append(net.signature)
+        component.respond()
+        self._evaluations += 1
+        triggered = list()
+        for index in range(len(nets)):
+            net = nets[index]
+            if net.signature != signatures[index]:
+                for attachedComponent in self._netComponents[net]:
+                    if attachedComponent is not component or self._netComponents[net].count(component) > 1:
+                        triggered.append(attachedComponent)
+        return triggered
+
+    def compiled(self) -> bool:
+        if not self._nets:
+            return False
+        for net in self._nets:
+            if not net._valid:
+                return False
+        return True
+
+    def settle(self) -> int:
+        if not self.compiled():
+            self._compile()
+        queue = set()
+        for component in self._components:
+            if component.stimulated:
+                queue.add(component)
+        deltas = 0
+        while queue:
+            if deltas >= self._maxDeltas:
+                raise Scheduler.UnsettledCircuitError(f"Circuit did not settle within {self._maxDeltas} delta cycles")
+            nextQueue = set()
+            for component in self._components:
+                if component in queue:
+                    nextQueue.update(self._evaluate(component))
+            queue = nextQueue
+            deltas += 1
+        return deltas
+
+class Condition:
+    class ConditionSyntaxError(ValueError):
+        pass
+
+    pattern = re.compile(r"\s*(?:(?P<component>[^.:\[=!<>]+?)\s*(?P<kind>[.:\[])\s*)?(?P<target>[^.:\[\]=!<>]+?)\s*\]?\s*(?P<operator>==|!=|<=|>=|<|>)\s*(?P<value>\S+)\s*")
+    operators = {"==": operator.eq, "!=": operator.ne, "<=": operator.le, ">=": operator.ge, "<": operator.lt, ">": operator.gt}
+
+    def __init__(self, simulator: Simulator, expression: str):
+        self._expression = str(expression)
+        match = Condition.pattern.fullmatch(self._expression)
+        if match is None:
+            raise Condition.ConditionSyntaxError(f"Conditions take the form 'REGISTER==value', 'component.REGISTER==value', 'component[address]==value' or 'component:pin==value' (not {expression})")
+        try:
+            value = int(match.group("value"), 0)
+        except ValueError:
+            raise Condition.ConditionSyntaxError(f"Condition values must be integers ({match.group('value')} is not)")
+        self._read = Condition.compileTarget(simulator, match.group("component"), match.group("kind"), match.group("target"))
+        self._operator = Condition.operators[match.group("operator")]
+        self._value = value
+
+    @staticmethod
+    def compileTarget(simulator: Simulator, componentName: str or None, kind: str or None, target: str) -> callable:
+        if componentName is None:
+            for component in simulator.components:
+                if target in getattr(component, "registers", tuple()):
+                    return Condition.compileTarget(simulator, simulator.identifyComponent(component), ".", target)
+            raise Condition.ConditionSyntaxError(f"No component has a register called {target}")
+        component = simulator.getComponent(componentName)
+        if kind == ".":
+            if not hasattr(component, "registerSelect"):
+                raise Condition.ConditionSyntaxError(f"{componentName} has no registers")
+            register = component.registerSelect(target)
+            return lambda: int.from_bytes(component.getRegister(register), "big")
+        elif kind == ":":
+            pin = component.pinSelect(int(target) if target.isdecimal() else target)
+            return lambda: pin.value
+        else:
+            if not isinstance(component, Memory):
+                raise Condition.ConditionSyntaxError(f"{componentName} is not a memory component so cannot be indexed")
+            address = component.validateAddress(int(target, 0))
+            data = component.data
+            if isinstance(data, memoryview):
+                return lambda: data[address]
+            return lambda: component.read(address)[0]
+
+    def __call__(self) -> bool:
+        return self._operator(self._read(), self._value)
+
+    def __str__(self) -> str:
+        return self._expression
 
 class Simulator:
     @staticmethod
@@ -20,6 +169,8 @@ class Simulator:
     
     def __init__(self, components: {str: Component} = None, step: callable = lambda components: None, assemblers: {str: Assembler} = None):
         self._components = dict()
+        self._scheduler = None
+        self._history = None
         if isinstance(components, dict):
             for key in components:
                 component = components[key]
@@ -65,9 +216,20 @@ class Simulator:
 
     def addComponent(self, name: str, component: Component):
         self._components[Simulator.validName(name)] = component
+        self._scheduler = None
 
     def removeComponent(self, identifier: Component or str or int):
         self._components.pop(self.identifyComponent(identifier))
+        self._scheduler = None
+
+    @property
+    def scheduler(self) -> Scheduler:
+        if self._scheduler is None:
+            self._scheduler = Scheduler(self.components)
+        return self._scheduler
+
+    def settle(self) -> int:
+        return self.scheduler.settle()
 
     @property
     def assemblerDict(self) -> {str: Assembler}:
@@ -100,8 +262,94 @@ class Simulator:
     def removeAssembler(self, identifier: Assembler or str or int):
         self._assemblers.pop(self.identifyAssembler(identifier))
 
+    def snapshot(self) -> {str: {str: any}}:
+        snapshot = dict()
+        for name, component in self._components.items():
+            snapshot[name] = component.snapshot()
+        return snapshot
+
+    def restore(self, snapshot: {str: {str: any}}):
+        for name, componentSnapshot in snapshot.items():
+            self._components[name].restore(componentSnapshot)
+
+    @property
+    def historyLength(self) -> int:
+        if self._history is None:
+            return 0
+        return self._history.maxlen
+
+    @historyLength.setter
+    def historyLength(self, length: int):
+        if length < 0:
+            raise ValueError(f"History length cannot be negative ({length})")
+        if length == 0:
+            self._history = None
+        else:
+            self._history = deque(tuple() if self._history is None else self._history, length)
+
+    @property
+    def history(self) -> [{str: {str: any}},]:
+        return tuple() if self._history is None else tuple(self._history)
+
+    def stepBack(self, steps: int = 1) -> int:
+        if self._history is None:
+            return 0
+        steps = min(steps, len(self._history))
+        for step in range(steps - 1):
+            self._history.pop()
+        if steps:
+            self.restore(self._history.pop())
+        return steps
+
     def step(self):
-       self._step(self._components.copy())
+        if self._history is not None:
+            self._history.append(self.snapshot())
+        self._step(self._components.copy())
+
+    def run(self, maxSteps: int, conditions: [Condition or str,] = tuple()) -> [int, Condition or None]:
+        compiledConditions = list()
+        for condition in conditions:
+            if not isinstance(condition, Condition):
+                condition = Condition(self, condition)
+            compiledConditions.append(condition)
+        for step in range(maxSteps):
+            for condition in compiledConditions:
+                if condition():
+                    return step, condition
+            self.step()
+        for condition in compiledConditions:
+            if condition():
+                return maxSteps, condition
+        return maxSteps, None
+
+    def report(self) -> {str: any}:
+        report = dict()
+        for name, component in self._components.items():
+            componentReport = {"pins": str().join(str(pin.packedState) for pin in component.pinsSelect(slice(None)))}
+            if hasattr(component, "registers"):
+                registers = dict()
+                for register in component.registers:
+                    registers[register] = int.from_bytes(component.getRegister(register), "big")
+                componentReport["registers"] = registers
+            report[name] = componentReport
+        return report
+
+    @staticmethod
+    def loadBoard(fileName: str, name: str = None) -> Simulator:
+        specification = importlib.util.spec_from_file_location("board", fileName)
+        if specification is None:
+            raise ValueError(f"Cannot load a board from {fileName}")
+        board = importlib.util.module_from_spec(specification)
+        specification.loader.exec_module(board)
+        if name is not None:
+            simulator = getattr(board, name)
+            if not isinstance(simulator, Simulator):
+                raise TypeError(f"{name} in {fileName} is a {type(simulator).__name__} not a Simulator")
+            return simulator
+        for value in vars(board).values():
+            if isinstance(value, Simulator):
+                return value
+        raise ValueError(f"{fileName} does not define a Simulator")
 
     def runSteps(self):
         while True:
@@ -325,3 +573,62 @@ class Simulator:
                 return
             else:
                 UserInterface.output("/!\ UNKNOWN MENU ERROR")
+
+def commandLine(arguments: [str,] = None):
+    parser = argparse.ArgumentParser(prog="python -m simulator", description="Computer System Simulator")
+    commands = parser.add_subparsers(dest="command", required=True)
+    runParser = commands.add_parser("run", help="run a board without the interactive menus")
+    runParser.add_argument("board", help="Python file defining a Simulator (e.g. main.py)")
+    runParser.add_argument("--simulator", help="name of the Simulator in the board file (default: the first one found)")
+    runParser.add_argument("--until", action="append", default=list(), help="stop once a condition holds, e.g. 'PC==0xFFFA', 'HM62256B RAM[0x0200]==1' or '65C02 microprocessor:RWB==0' (repeatable; any one stops the run)")
+    runParser.add_argument("--max-cycles", type=int, default=1000000, help="maximum number of simulator steps")
+    runParser.add_argument("--trace", help="stream an execution trace of every processor to this binary file")
+    assembleParser = commands.add_parser("assemble", help="assemble many source files in parallel")
+    assembleParser.add_argument("board", help="Python file defining a Simulator with an assembler (e.g. main.py)")
+    assembleParser.add_argument("sources", nargs="+", help="source files, directories of .txt sources or glob patterns")
+    assembleParser.add_argument("--simulator", help="name of the Simulator in the board file (default: the first one found)")
+    assembleParser.add_argument("--assembler", help="name of the assembler to use (default: the first one)")
+    assembleParser.add_argument("--output", default="saved_machine_code", help="directory for the assembled .bin files")
+    assembleParser.add_argument("--start-address", type=lambda value: int(value, 0), default=0, help="address the code is assembled for")
+    assembleParser.add_argument("--workers", type=int, help="number of worker processes (default: one per CPU)")
+    arguments = parser.parse_args(arguments)
+    simulator = Simulator.loadBoard(arguments.board, arguments.simulator)
+    if arguments.command == "assemble":
+        if not simulator.assemblers:
+            parser.error(f"{arguments.board} does not define an assembler")
+        try:
+            assembler = simulator.getAssembler(0 if arguments.assembler is None else arguments.assembler)
+        except Exception as error:
+            parser.error(f"invalid --assembler: {error}")
+        results = assembler.assembleBatch(arguments.sources, arguments.output, arguments.start_address, arguments.workers)
+        print(json.dumps(results, indent=2))
+        return 1 if results["failed"] else 0
+    try:
+        conditions = tuple(Condition(simulator, condition) for condition in arguments.until)
+    except Exception as error:
+        parser.error(f"invalid --until condition: {error}")
+    tracer = None
+    if arguments.trace is not None:
+        tracer = TraceRecorder(fileName = arguments.trace)
+        for component in simulator.components:
+            if isinstance(component, Processor):
+                component.tracer = tracer
+    startTime = time.perf_counter()
+    try:
+        cycles, condition = simulator.run(arguments.max_cycles, conditions)
+    finally:
+        if tracer is not None:
+            tracer.close()
+    elapsed = time.perf_counter() - startTime
+    print(json.dumps({
+        "cycles": cycles,
+        "stoppedBy": None if condition is None else str(condition),
+        "seconds": elapsed,
+        "cyclesPerSecond": cycles / elapsed if elapsed > 0 else None,
+        "components": simulator.report()
+    }, indent=2))
+    return 0 if condition is not None or not conditions else 1
+
+if __name__ == "__main__":
+    import simulator
+    raise SystemExit(simulator.commandLine())
@@ -1,17 +1,23 @@
-from simulator import Simulator
+from simulator import Simulator, Scheduler, Condition
 from user_interface import UserInterface
-from instruction_set_65C02.instructions import instructions
+from instruction_set_65C02.instructions import instructions, cycles
 from instruction_set_65C02.operations import Operations
 from instruction_set_65C02.addressing_modes import AddressingModes
-from processor import Processor
-from memory import Memory, SpecificMemory, ReadOnlyMemory as ROM, RandomAccessMemory as RAM
+from processor import Processor, FunctionalCore, StatusFlags
+from memory import Memory, SpecificMemory, ReadOnlyMemory as ROM, RandomAccessMemory as RAM, MemoryMap, PageTable, PagedMemory, MemoryManagementUnit as MMU
 from additional_hardware import PowerSupply, Button, Clock, QuadNANDGate as NAND, Resistor
 from assembler import Assembler
-from instruction_set import InstructionSet, AddressingMode, Operation
-from component import Component, Node, Connection, Pin, Wire
-from general import intToBool, bytesToTuple, sliceToTuple, BinaryElectric as BinElec
+from linker import ObjectFile, Section, Linker
+from disassembler import Disassembler
+from execution_trace import TraceRecorder, TraceReader
+from instruction_set import InstructionSet, AddressingMode, Operation, DynamicAddressingMode, DynamicOperation
+from component import Component, Node, Connection, Pin, Wire, Bus, Net
+from general import intToBool, bytesToTuple, intToTuple, tupleToInt, sliceToTuple, BinaryElectric as BinElec
+import tempfile
 import random
+import pickle
 import unittest
+import os
 
 class RandomData:
     @staticmethod
@@ -134,6 +140,22 @@ class Test_bytesToTuple(unittest.TestCase):
                              RandomData.string(random.randint(0, 1024))):
                 self.assertRaises(TypeError, bytesToTuple, testData)
 
+class Test_tupleToInt(unittest.TestCase):
+    def test_matchesBytesToTuple(self):
+        for test in range(10):
+            testData = random.randbytes(random.randint(1, 16))
+            self.assertEqual(tupleToInt(bytesToTuple(testData)), int.from_bytes(testData, "big"))
+
+    def test_exhaustiveByteData(self):
+        for value in range(256):
+            self.assertEqual(tupleToInt(intToTuple(value)), value)
+
+    def test_unalignedLengths(self):
+        for bits in range(1, 40):
+            value = random.getrandbits(bits)
+            self.assertEqual(len(intToTuple(value, bits)), bits)
+            self.assertEqual(tupleToInt(intToTuple(value, bits)), value)
+
 class Test_BinElec(unittest.TestCase):
     def test_validateState_exhaustiveBooleanData(self):
         for activity in False, True:
@@ -183,6 +205,12 @@ class Test_BinElec(unittest.TestCase):
             for x in returnedValue:
                 self.assertIsInstance(x, bool)
 
+    def test_pack_orderedByPrecedence(self):
+        for A in BinElec.states:
+            self.assertEqual(BinElec.unpack(BinElec.pack(A)), A)
+            for B in BinElec.states:
+                self.assertEqual(BinElec.unpack(max(BinElec.pack(A), BinElec.pack(B))), BinElec.combine(A, B))
+
 
 # component.py
 
@@ -227,6 +255,23 @@ class Test_Pin(unittest.TestCase):
         for test in range(10):
             testPin.connection = RandomData.connection(random.randint(0, 16))
 
+    def test_packedState(self):
+        testPin = Pin("testPin")
+        for activity in False, True:
+            for value in False, True:
+                testPin.state = value, activity
+                self.assertEqual(testPin.packedState, BinElec.pack((value, activity)))
+                self.assertEqual((testPin.value, testPin.activity), (value, activity))
+        testPin.packedState = BinElec.passiveHigh
+        self.assertEqual(testPin.state, (True, False))
+        self.assertRaises(ValueError, setattr, testPin, "packedState", 4)
+
+    def test_noInstanceDictionary(self):
+        testPin1 = Pin("testPin")
+        testPin2 = Pin("testPin", connection=testPin1)
+        for instance in testPin1, testPin1.connection, Wire((testPin2,)):
+            self.assertRaises(AttributeError, setattr, instance, "undeclared", None)
+
     def test_destructor(self):
         testPin1 = Pin("testPin")
         testPin2 = Pin("testPin")
@@ -242,8 +287,985 @@ class Test_Wire(unittest.TestCase):
 class Test_Connection(unittest.TestCase):
     pass
 
+class Test_Net(unittest.TestCase):
+    def test_retrieveState_matchesCombine(self):
+        for test in range(10):
+            pins = list()
+            wire = Wire()
+            for pin in range(random.randint(1, 16)):
+                if random.randint(0, 1) == 0:
+                    wire = Wire((wire,))
+                pins.append(Pin(f"testPin{pin}", RandomData.state()))
+                wire.connect(pins[-1])
+            for pin in random.sample(pins, len(pins)):
+                expectedState = False, False
+                for otherPin in pins:
+                    if otherPin is not pin:
+                        expectedState = BinElec.combine(expectedState, otherPin.state)
+                self.assertEqual(expectedState, pin.retrieveState())
+
+    def test_sharedNet(self):
+        wire = Wire()
+        pins = (Pin("testPin1"), Pin("testPin2"), Pin("testPin3"))
+        for pin in pins:
+            wire.connect(pin)
+        for pin in pins:
+            self.assertIs(wire.net, pin.net)
+        self.assertEqual(3, len(wire.net))
+
+    def test_topologyChange(self):
+        testPin1 = Pin("testPin1", (True, True))
+        testPin2 = Pin("testPin2")
+        wire = Wire((testPin1, testPin2))
+        self.assertEqual((True, True), testPin2.retrieveState())
+        net = testPin2.net
+        wire.disconnect(testPin1)
+        self.assertIsNot(net, testPin2.net)
+        self.assertEqual((False, False), testPin2.retrieveState())
+
+    def test_unrelatedNodes(self):
+        testPin1 = Pin("testPin1", (True, True))
+        testPin2 = Pin("testPin2")
+        wire = Wire((testPin1, testPin2))
+        net = testPin2.net
+        otherPin = Pin("otherPin")
+        Wire((otherPin, Pin("otherPin2")))
+        del otherPin
+        self.assertTrue(net.valid)
+        self.assertIs(net, testPin2.net)
+        wire.connect(Pin("testPin3"))
+        self.assertFalse(net.valid)
+        self.assertEqual(3, len(testPin2.net))
+
+class Test_Bus(unittest.TestCase):
+    def test_driveAndRead(self):
+        bus = Bus(tuple(Pin(f"A{bit}") for bit in range(16)))
+        for test in range(10):
+            value = random.getrandbits(16)
+            bus.drive(value)
+            self.assertEqual(bus.read(), value)
+            self.assertEqual(bus.pins[0].state, (bool(value & 1), True))
+        self.assertRaises(ValueError, bus.drive, 2 ** 16)
+        self.assertRaises(TypeError, Bus, (Pin("A0"), Wire()))
+
+    def test_release(self):
+        bus = Bus((Pin("D0"), Pin("D1")))
+        bus.drive(0b01)
+        bus.release()
+        self.assertEqual((bus.pins[0].state, bus.pins[1].state), ((True, False), (False, False)))
+
+    def test_driveStates(self):
+        bus = Bus((Pin("Y1"), Pin("Y2"), Pin("Y3")))
+        bus.driveStates(0b101, (True, True), (False, False))
+        self.assertEqual(tuple(pin.state for pin in bus.pins), ((True, True), (False, False), (True, True)))
+
+    def test_nandGate(self):
+        nand = NAND()
+        nand.setPinState("VCC", (True, True))
+        nand.setPinState("GND", (False, True))
+        nand.setPinGroup("A1..A4", 0b0011)
+        nand.setPinGroup("B1..B4", 0b0101)
+        nand.response()
+        self.assertEqual(nand.getPinGroup("Y1..Y4"), 0b1110)
+        self.assertEqual(nand.getPinsActivities(("Y1", "Y2", "Y3", "Y4")), (True, True, True, True))
+
 class Test_Component(unittest.TestCase):
-    pass
+    def test_pinIndex(self):
+        component = NullComponent(("A", "B", "A", "C"))
+        self.assertEqual(component.pinIndex("B"), 2)
+        self.assertEqual(component.pinIndex("A"), 1)
+        self.assertEqual(component.pinIndex(4), 4)
+        self.assertRaises(Component.PinNotFoundError, component.pinIndex, "D")
+
+    def test_expandPinGroup(self):
+        self.assertEqual(Component.expandPinGroup("A0..A3"), ("A0", "A1", "A2", "A3"))
+        self.assertEqual(Component.expandPinGroup("D2..0, RWB"), ("D2", "D1", "D0", "RWB"))
+        self.assertEqual(Component.expandPinGroup((3, 1)), (3, 1))
+
+    def test_pinGroup(self):
+        processor = Processor(InstructionSet(instructions))
+        self.assertIs(processor.pinGroup("A0..A15"), processor.pinGroup("A0..A15"))
+        processor.setPinGroup("A0..A15", 0xBEEF)
+        self.assertEqual(processor.getPinGroup("A0..A15"), 0xBEEF)
+        self.assertEqual(processor.getPinState("A0"), (True, True))
+        self.assertEqual(processor.getPinState("A4"), (False, True))
+        processor.setPinGroup("D0..D7", 0x81, False)
+        self.assertEqual(processor.getPinsStates(("D0", "D1", "D7")), ((True, False), (False, False), (True, False)))
+        self.assertRaises(ValueError, processor.setPinGroup, "D0..D7", 256)
+
+    def test_snapshot(self):
+        processor = Processor(InstructionSet(instructions))
+        processor.setPinGroup("A0..A15", 0xBEEF)
+        snapshot = processor.snapshot()
+        self.assertEqual(snapshot["pins"], processor.packedPinStates)
+        self.assertEqual(snapshot["registers"], processor.state["registers"])
+
+
+# memory.py
+
+class Test_SpecificMemory(unittest.TestCase):
+    def test_mappedImages(self):
+        with tempfile.TemporaryDirectory() as directory:
+            romFile = os.path.join(directory, "rom.bin")
+            with open(romFile, "wb") as file:
+                file.write(bytes(range(256)) * 128)
+            rom = ROM(mapFile = romFile)
+            self.assertEqual(rom.mapFile, romFile)
+            self.assertEqual(rom[0x1FF], bytes((0xFF,)))
+            rom[0] = bytes((0x99,))
+            self.assertEqual(rom[0], bytes((0x99,)))
+            with open(romFile, "rb") as file:
+                self.assertEqual(file.read(1), bytes(1))
+            ramFile = os.path.join(directory, "ram.bin")
+            ram = RAM(mapFile = ramFile)
+            ram[0x10:0x12] = bytes((1, 2))
+            ram[0x7FFF] = bytes((3,))
+            ram.flush()
+            self.assertEqual(RAM(mapFile = ramFile)[0x10:0x12], bytes((1, 2)))
+            with open(ramFile, "rb") as file:
+                self.assertEqual(file.read()[0x7FFF], 3)
+            ram.setPinState("Vcc", (False, True))
+            ram.response()
+            self.assertEqual(ram[0x7FFF], bytes((3,)))
+            with self.assertRaises(OSError):
+                ROM(mapFile = os.path.join(directory, "missing.bin"))
+            with open(romFile, "wb") as file:
+                file.write(bytes(10))
+            with self.assertRaises(ValueError):
+                ROM(mapFile = romFile)
+            with self.assertRaises(ValueError):
+                RAM(bytes(4), mapFile = ramFile)
+            del rom, ram
+
+    @staticmethod
+    def selectChip(memory: SpecificMemory, address: int, outputEnable: bool, writeEnable: bool):
+        for pin, state in zip(memory.controlPins, ((True, True), (False, True), (True, True), (outputEnable, True), (writeEnable, True))):
+            memory.setPinState(pin, state)
+        for bit, pin in enumerate(Component.expandPinGroup(memory.addressPins)):
+            memory.setPinState(pin, (bool(address >> bit & 1), True))
+
+    def test_createChip(self):
+        SRAM2K = SpecificMemory.createChip("SRAM2K", (
+            "A7",  "A6",  "A5",  "A4",  "A3",  "A2",  "A1",  "A0",
+            "DQ0", "DQ1", "DQ2", "VSS", "DQ3", "DQ4", "DQ5", "DQ6",
+            "DQ7", "CE",  "A10", "OE",  "WE",  "A9",  "A8",  "VCC"
+        ), "A0..10", "DQ0..7", ("VCC", "VSS", "CE", "OE", "WE"), volatile = True)
+        sram = SRAM2K()
+        self.assertIsInstance(sram, RAM)
+        self.assertEqual(len(sram), 2048)
+        self.assertEqual(len(sram.pageSnapshot()), 8)
+        Test_SpecificMemory.selectChip(sram, 0x5A3, True, False)
+        sram.setPinGroup("DQ0..7", 0x3C)
+        sram.response()
+        self.assertEqual(sram[0x5A3], bytes((0x3C,)))
+        Test_SpecificMemory.selectChip(sram, 0x5A3, False, True)
+        sram.response()
+        self.assertEqual(sram.getPinGroup("DQ0..7"), 0x3C)
+        sram.setPinState("VCC", (False, True))
+        sram.response()
+        self.assertEqual(sram[0x5A3], bytes(1))
+        Flash512K = SpecificMemory.createChip("Flash512K", tuple(f"A{bit}" for bit in range(19)) + tuple(f"I/O{bit}" for bit in range(8)) + ("VCC", "GND", "CEB", "OEB", "WEB"), "A0..18")
+        flash = Flash512K(bytes(range(256)) * 2048)
+        self.assertIsInstance(flash, ROM)
+        self.assertEqual(len(flash), 0x80000)
+        self.assertEqual(flash[0x7FFFF], bytes((0xFF,)))
+        Test_SpecificMemory.selectChip(flash, 0x412C, False, True)
+        flash.response()
+        self.assertEqual(flash.getPinGroup("I/O0..7"), 0x2C)
+        self.assertEqual(MemoryMap(((0x0000, 0x10000, flash, False),)).read(0xFF01), 0x01)
+        with self.assertRaises(ValueError):
+            SpecificMemory.createChip("Narrow", ("A0", "A1", "D0", "VCC", "GND", "CEB", "OEB", "WEB"), "A0..1", "D0")
+        with self.assertRaises(Component.PinNotFoundError):
+            SpecificMemory.createChip("Missing", ROM.pinout, "A0..15")
+
+    def test_responseRead(self):
+        rom = ROM(bytes(range(256)) * 128)
+        Test_SpecificMemory.selectChip(rom, 0x4209, False, True)
+        rom.response()
+        self.assertEqual(rom.getPinsStates(tuple(f"I/O{bit}" for bit in range(8))), tuple((bool(0x09 >> bit & 1), True) for bit in range(8)))
+        self.assertEqual(rom.getPinState("A0"), (True, False))
+        Test_SpecificMemory.selectChip(rom, 0x4209, True, True)
+        rom.response()
+        self.assertEqual(rom.getPinsActivities(tuple(f"I/O{bit}" for bit in range(8))), (False,) * 8)
+
+    def test_responseWrite(self):
+        rom = ROM()
+        Test_SpecificMemory.selectChip(rom, 0x7ABC, True, False)
+        for bit in range(8):
+            rom.setPinState(f"I/O{bit}", (bool(0xA5 >> bit & 1), True))
+        rom.response()
+        self.assertEqual(rom[0x7ABC], bytes((0xA5,)))
+        self.assertEqual(rom.getPinsActivities(tuple(f"I/O{bit}" for bit in range(8))), (False,) * 8)
+
+    def test_writeInPlace(self):
+        ram = RAM()
+        data = ram.data
+        ram[0x1234] = bytes((0xAB,))
+        self.assertEqual(data[0x1234], 0xAB)
+        self.assertEqual(ram[0x1234], bytes((0xAB,)))
+        with self.assertRaises(TypeError):
+            ram[0x1234][0] = 0x55
+        with self.assertRaises(TypeError):
+            data[0x10] = 0x55
+        self.assertEqual(ram.pageSnapshot()[0x00], bytes(SpecificMemory.pageSize))
+
+    def test_sliceReadWrite(self):
+        ram = RAM()
+        ram[0x100:0x104] = bytes((1, 2, 3, 4))
+        self.assertEqual(ram[0x100:0x104], bytes((1, 2, 3, 4)))
+        self.assertEqual(ram[0x100:0x104:2], bytes((1, 3)))
+        self.assertEqual(ram[(0x101, 0x103)], (bytes((2,)), bytes((4,))))
+        self.assertRaises(ValueError, ram.writeAddresses, slice(0x100, 0x104), bytes(2))
+        self.assertRaises(ValueError, ram.readAddresses, slice(0x7FFF, 0x8001))
+
+    def test_pageSnapshot(self):
+        ram = RAM()
+        pages = ram.pageSnapshot()
+        self.assertIs(ram.pageSnapshot(), pages)
+        ram[0x1234] = bytes((1,))
+        newPages = ram.pageSnapshot()
+        self.assertEqual(newPages[0x12][0x34], 1)
+        self.assertEqual([page for page in range(len(pages)) if newPages[page] is not pages[page]], [0x12])
+        ram[0x0100:0x0300] = bytes(range(256)) * 2
+        snapshot = ram.snapshot()
+        del ram.data
+        ram.restore(snapshot)
+        self.assertEqual(ram[0x1234], bytes((1,)))
+        self.assertEqual(ram[0x0100:0x0300], bytes(range(256)) * 2)
+        self.assertIs(ram.pageSnapshot(), snapshot["pages"])
+
+    def test_stateIsSnapshot(self):
+        ram = RAM(bytes((5,)))
+        state = ram.state
+        ram[0] = bytes((6,))
+        self.assertEqual(state["data"][0], 5)
+        ram.state = state
+        self.assertEqual(ram[0], bytes((5,)))
+        del ram.data
+        self.assertEqual(ram.data, bytes(len(ram)))
+
+class Test_PageTable(unittest.TestCase):
+    def test_allocation(self):
+        table = PageTable(0x10000)
+        self.assertEqual(len(table), 0x10000)
+        self.assertEqual(table[0x1234], 0)
+        table[0x1234] = 0
+        self.assertEqual(tuple(table.allocated), ())
+        table[0x01FE:0x0202] = bytes((1, 2, 3, 4))
+        self.assertEqual(sorted(table.allocated), [1, 2])
+        self.assertEqual(table[0x01FD:0x0203], bytes((0, 1, 2, 3, 4, 0)))
+        self.assertEqual(table[-1], 0)
+        table[0x0100:0x0200] = bytes(256)
+        self.assertEqual(tuple(table.allocated), (2,))
+        with self.assertRaises(IndexError):
+            table[0x10000]
+        with self.assertRaises(ValueError):
+            table[0:2] = bytes(3)
+        with self.assertRaises(ValueError):
+            PageTable(1000)
+
+class Test_PagedMemory(unittest.TestCase):
+    Flash16M = SpecificMemory.createChip("Flash16M", tuple(f"A{bit}" for bit in range(24)) + tuple(f"I/O{bit}" for bit in range(8)) + ("VCC", "GND", "CEB", "OEB", "WEB"), "A0..23", sparse = True)
+
+    def test_sparseStorage(self):
+        flash = Test_PagedMemory.Flash16M()
+        self.assertIsInstance(flash, PagedMemory)
+        self.assertIsInstance(flash, ROM)
+        self.assertEqual(len(flash), 0x1000000)
+        self.assertEqual(flash.allocatedPages, ())
+        flash[0xABCDEF] = bytes((0x42,))
+        flash[0x0200:0x0202] = bytes((1, 2))
+        self.assertEqual(flash[0xABCDEF], bytes((0x42,)))
+        self.assertEqual(flash[0x01FF:0x0203], bytes((0, 1, 2, 0)))
+        self.assertEqual(flash.allocatedPages, (0x0002, 0xABCD))
+        self.assertEqual(MemoryMap(((0x0000, 0x10000, flash, False),)).read(0x0201), 2)
+        Test_SpecificMemory.selectChip(flash, 0xABCDEF, False, True)
+        flash.response()
+        self.assertEqual(flash.getPinGroup("I/O0..7"), 0x42)
+        with self.assertRaises(ValueError):
+            Test_PagedMemory.Flash16M(mapFile = "flash.bin")
+
+    def test_snapshots(self):
+        flash = Test_PagedMemory.Flash16M()
+        flash[0x123456] = bytes((7,))
+        snapshot = flash.snapshot()
+        self.assertEqual(tuple(snapshot["pages"]), (0x1234,))
+        version = flash.pageVersion(0x1234)
+        flash[0x123456] = bytes((8,))
+        flash[0x000300] = bytes((9,))
+        self.assertGreater(flash.pageVersion(0x1234), version)
+        flash.restore(snapshot)
+        self.assertEqual(flash[0x123456], bytes((7,)))
+        self.assertEqual(flash.allocatedPages, (0x1234,))
+        self.assertIs(flash.pageSnapshot(), flash.pageSnapshot())
+        state = flash.state
+        del flash.data
+        self.assertEqual(flash.allocatedPages, ())
+        self.assertEqual(flash[0x123456], bytes(1))
+        flash.state = state
+        self.assertEqual(flash[0x123456], bytes((7,)))
+
+    def test_saveAndLoad(self):
+        flash = Test_PagedMemory.Flash16M()
+        flash[0xFFFFFF] = bytes((0x5A,))
+        flash[0x000010] = bytes((0xA5,))
+        with tempfile.TemporaryDirectory() as directory:
+            fileName = os.path.join(directory, "flash.bin")
+            flash.save(fileName)
+            self.assertEqual(os.path.getsize(fileName), 0x1000000)
+            loaded = Test_PagedMemory.Flash16M(fileName)
+            self.assertEqual(loaded.allocatedPages, (0x0000, 0xFFFF))
+            self.assertEqual(loaded[0xFFFFFF], bytes((0x5A,)))
+            self.assertEqual(loaded[0x000010], bytes((0xA5,)))
+
+class Test_MemoryManagementUnit(unittest.TestCase):
+    SRAM128K = SpecificMemory.createChip("SRAM128K", tuple(f"A{bit}" for bit in range(17)) + tuple(f"I/O{bit}" for bit in range(8)) + ("VCC", "GND", "CEB", "OEB", "WEB"), "A0..16", volatile = True)
+
+    @staticmethod
+    def system(program: bytes) -> [MMU, RAM, SpecificMemory, ROM]:
+        ram, banked, rom = RAM(), Test_MemoryManagementUnit.SRAM128K(), ROM()
+        image = bytearray(len(rom))
+        image[:len(program)] = program
+        image[0x7FFC:0x7FFE] = (0x8000).to_bytes(2, "little")
+        rom.data = bytes(image)
+        mmu = MMU(((0x4000, 0x8000, banked, True),), 0x0300)
+        mmu.memoryMap.map(0x0000, 0x0300, ram, True)
+        mmu.memoryMap.map(0x8000, 0x10000, rom, False)
+        return mmu, ram, banked, rom
+
+    def test_bankSwitching(self):
+        mmu, ram, banked, rom = Test_MemoryManagementUnit.system(bytes())
+        memoryMap = mmu.memoryMap
+        self.assertEqual(len(mmu), 1)
+        memoryMap.write(0x4001, 0x11)
+        version = memoryMap.version
+        memoryMap.write(0x0300, 3)
+        self.assertEqual(mmu.banks, (3,))
+        self.assertGreater(memoryMap.version, version)
+        self.assertEqual(memoryMap.read(0x4001), 0)
+        memoryMap.write(0x7FFF, 0x22)
+        self.assertEqual(banked[0xFFFF], bytes((0x22,)))
+        self.assertEqual(memoryMap.locate(0x4000), (banked, 0xC000))
+        self.assertEqual(memoryMap.read(0x03FF), 3)
+        mmu[0] = bytes((8,))
+        self.assertEqual(memoryMap.read(0x4001), 0x11)
+        state = mmu.state
+        mmu[0] = bytes((3,))
+        mmu.state = state
+        self.assertEqual(memoryMap.read(0x4001), 0x11)
+        del mmu.data
+        self.assertEqual(mmu.banks, (0,))
+
+    def test_functionalCore(self):
+        program = bytes((
+            0xA9, 0x01,         # LDA #$01
+            0x8D, 0x00, 0x03,   # STA $0300
+            0xA9, 0xAA,         # LDA #$AA
+            0x8D, 0x00, 0x40,   # STA $4000
+            0xA9, 0x02,         # LDA #$02
+            0x8D, 0x00, 0x03,   # STA $0300
+            0xAD, 0x00, 0x40,   # LDA $4000
+            0x8D, 0x00, 0x02,   # STA $0200
+            0xDB                # STP
+        ))
+        for translate in (False, True):
+            mmu, ram, banked, rom = Test_MemoryManagementUnit.system(program)
+            banked[0x8000] = bytes((0x55,))
+            core = FunctionalCore(InstructionSet(instructions), mmu.memoryMap, translate)
+            core.reset()
+            core.run(100)
+            self.assertTrue(core.stopped)
+            self.assertEqual(banked[0x4000], bytes((0xAA,)))
+            self.assertEqual(ram[0x0200], bytes((0x55,)))
+            self.assertEqual(mmu.banks, (2,))
+
+    def test_translatedBlocksFollowBanks(self):
+        mmu, ram, banked, rom = Test_MemoryManagementUnit.system(bytes((
+            0x20, 0x00, 0x40,   # JSR $4000
+            0xA9, 0x01,         # LDA #$01
+            0x8D, 0x00, 0x03,   # STA $0300
+            0x20, 0x00, 0x40,   # JSR $4000
+            0xDB                # STP
+        )))
+        banked[0x0000:0x0003] = bytes((0xA2, 0x11, 0x60)) # LDX #$11; RTS
+        banked[0x4000:0x4003] = bytes((0xA0, 0x22, 0x60)) # LDY #$22; RTS
+        core = FunctionalCore(InstructionSet(instructions), mmu.memoryMap, True)
+        core.reset()
+        core.run(100)
+        self.assertTrue(core.stopped)
+        self.assertEqual((core.X, core.Y), (0x11, 0x22))
+
+    def test_blockRemapsItself(self):
+        program = bytes((
+            0xA9, 0x01,         # LDA #$01
+            0x8D, 0x00, 0x03,   # STA $0300
+            0xA2, 0x11,         # LDX #$11
+            0xDB                # STP
+        ))
+        results = list()
+        for translate in False, True:
+            mmu, ram, banked, rom = Test_MemoryManagementUnit.system(bytes((0x4C, 0x00, 0x40))) # JMP $4000
+            banked[0x0000:0x0008] = program
+            banked[0x4005:0x4008] = bytes((0xA2, 0x22, 0xDB)) # LDX #$22; STP
+            core = FunctionalCore(InstructionSet(instructions), mmu.memoryMap, translate)
+            core.reset()
+            executed = core.run(100)
+            results.append((executed, core.instructions, core.PC, core.X))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(0x22, results[1][3])
+
+    def test_regions(self):
+        mmu, ram, banked, rom = Test_MemoryManagementUnit.system(bytes())
+        mmu[0] = bytes((3,))
+        self.assertIn((0x4000, 0x8000, banked, True), mmu.memoryMap.regions)
+        Linker.load({"data": (0x7FFE, bytes((1, 2, 3)))}, mmu.memoryMap)
+        self.assertEqual(bytes(banked[0xFFFE:0x10000]), bytes((1, 2)))
+        self.assertEqual(rom[0], bytes((3,)))
+
+    def test_response(self):
+        mmu, ram, banked, rom = Test_MemoryManagementUnit.system(bytes())
+        mmu[0] = bytes((5,))
+        banked[0x14321] = bytes((0x9C,))
+        for pin, state in (("VCC", (True, True)), ("GND", (False, True)), ("PHI2", (True, True)), ("RWB", (True, True))):
+            mmu.setPinState(pin, state)
+        mmu.setPinGroup("A0..15", 0x4321)
+        mmu.response()
+        self.assertEqual(mmu.getPinGroup("D0..7"), 0x9C)
+        mmu.setPinState("RWB", (False, True))
+        mmu.setPinGroup("A0..15", 0x0300)
+        mmu.setPinGroup("D0..7", 6)
+        mmu.response()
+        self.assertEqual(mmu.banks, (6,))
+        self.assertEqual(tuple(pin.activity for pin in mmu.pinGroup("D0..7")), (False,) * 8)
+        for address, clock in ((0x1000, (True, True)), (0x4321, (False, True))):
+            for pin, state in (("VCC", (True, True)), ("GND", (False, True)), ("PHI2", clock), ("RWB", (True, True))):
+                mmu.setPinState(pin, state)
+            mmu.setPinGroup("A0..15", address)
+            mmu.response()
+            self.assertEqual(tuple(pin.activity for pin in mmu.pinGroup("D0..7")), (False,) * 8)
+
+
+# instruction_set.py
+
+class Test_InstructionSet(unittest.TestCase):
+    def test_dispatchTable(self):
+        instructionSet = InstructionSet(instructions, cycles)
+        self.assertEqual(len(instructionSet.dispatch), 256)
+        self.assertEqual(len(instructionSet.metadata), 256)
+        self.assertEqual(instructionSet.getMetadata(0xA9), (2, 2, AddressingModes.Immediate))
+        self.assertEqual(instructionSet.getMetadata(bytes((0x6D,))), (3, 4, AddressingModes.Absolute))
+        self.assertEqual(instructionSet.getLength(0xEA), 1)
+        self.assertEqual(instructionSet.getCycles(0x00), 7)
+        self.assertEqual(instructionSet.getMetadata(0x03), (1, 1, None))
+        self.assertIsNone(InstructionSet(instructions).getCycles(0xA9))
+        with self.assertRaises(InstructionSet.UndefinedOpcodeError):
+            instructionSet.execute(Processor(instructionSet), 0x03)
+
+    def test_lookups(self):
+        instructionSet = InstructionSet(instructions)
+        self.assertIs(instructionSet.getOperationByMnemonic("lda"), Operations.LDA)
+        self.assertIs(instructionSet.getOperationByMnemonic("LDA"), Operations.LDA)
+        self.assertEqual(instructionSet.getOpcode("LdA", AddressingModes.Immediate), 0xA9)
+        self.assertEqual(instructionSet.getOpcode(Operations.STA, AddressingModes.Absolute), 0x8D)
+        self.assertEqual(instructionSet.operationAddressingModes("JMP"), [AddressingModes.Absolute, AddressingModes.AbsoluteIndirect, AddressingModes.AbsoluteIndexedIndirect])
+        with self.assertRaises(ValueError):
+            instructionSet.getOperationByMnemonic("XYZ")
+        with self.assertRaises(ValueError):
+            instructionSet.getOpcode(Operations.STA, AddressingModes.Immediate)
+
+    def test_pickle(self):
+        instructionSet = pickle.loads(pickle.dumps(InstructionSet(instructions, cycles)))
+        self.assertEqual(instructionSet.getMetadata(0xA9), (2, 2, AddressingModes.Immediate))
+        self.assertEqual(len(instructionSet.dispatch), 256)
+
+# assembler.py
+
+class Test_Assembler(unittest.TestCase):
+    def test_symbolSubstitution(self):
+        assembler = Assembler(InstructionSet(instructions), {"Value": "$20"})
+        lines, labels = assembler._preprocessing("Val = $10\nlda Val\nlda Value\nlda ($Val),x\nlda Values\nsta Val,x")
+        self.assertEqual(lines, [("lda", "$10"), ("lda", "$20"), ("lda", "($Val),x"), ("lda", "Values"), ("sta", "$10,x")])
+        lines, labels = assembler._preprocessing("lda Later\nLater = 1\nlda Later")
+        self.assertEqual(lines, [("lda", "Later"), ("lda", "1")])
+
+    def test_chainedSymbols(self):
+        assembler = Assembler(InstructionSet(instructions))
+        lines, labels = assembler._preprocessing("A = B\nB = $05\nlda A\nC = $06\nD = C\nlda D,x\nB = $07\nlda A")
+        self.assertEqual(lines, [("lda", "$05"), ("lda", "$06,x"), ("lda", "$07")])
+        assembler.symbols = {"E": "F", "F": "E"}
+        self.assertRaises(Assembler.AssemblerError, assembler._preprocessing, "lda E")
+
+    def test_assembleBatch(self):
+        assembler = Assembler(InstructionSet(instructions), {"Count": "$03"})
+        with tempfile.TemporaryDirectory() as directory:
+            sources = os.path.join(directory, "sources")
+            os.mkdir(sources)
+            for name, assembly in (("one", "ldx #Count\nloop:\ndex\nbne loop"), ("two", "nop"), ("bad", "lda nowhere")):
+                with open(os.path.join(sources, name + ".txt"), "w") as file:
+                    file.write(assembly)
+            output = os.path.join(directory, "machine_code")
+            results = assembler.assembleBatch(sources, output, workers = 2)
+            self.assertEqual(sorted(results["assembled"]), [os.path.join(sources, "one.txt"), os.path.join(sources, "two.txt")])
+            self.assertEqual(tuple(results["failed"]), (os.path.join(sources, "bad.txt"),))
+            with open(os.path.join(output, "one.bin"), "rb") as file:
+                self.assertEqual(file.read(), bytes((0xA2, 0x03, 0xCA, 0xD0, 0xFD)))
+            with open(os.path.join(sources, "two.txt"), "w") as file:
+                file.write("nop\nnop")
+            results = assembler.assembleBatch(os.path.join(sources, "*.txt"), output)
+            self.assertEqual(results["assembled"], [os.path.join(sources, "two.txt")])
+            self.assertEqual(results["cached"], [os.path.join(sources, "one.txt")])
+
+    def test_assembleBatchLabels(self):
+        assembler = Assembler(InstructionSet(instructions), labels = {"print": 0x9000})
+        with tempfile.TemporaryDirectory() as directory:
+            for folder in "first", "second":
+                os.mkdir(os.path.join(directory, folder))
+                with open(os.path.join(directory, folder, "main.txt"), "w") as file:
+                    file.write("jsr print")
+            output = os.path.join(directory, "machine_code")
+            results = assembler.assembleBatch((os.path.join(directory, "first"), os.path.join(directory, "second")), output)
+            self.assertEqual(results["assembled"], [os.path.join(directory, "first", "main.txt")])
+            self.assertEqual(tuple(results["failed"]), (os.path.join(directory, "second", "main.txt"),))
+            with open(os.path.join(output, "main.bin"), "rb") as file:
+                self.assertEqual(file.read(), bytes((0x20, 0x00, 0x90)))
+            assembler.labels = {"print": 0xA000}
+            results = assembler.assembleBatch(os.path.join(directory, "first"), output)
+            self.assertEqual(results["assembled"], [os.path.join(directory, "first", "main.txt")])
+            with open(os.path.join(output, "main.bin"), "rb") as file:
+                self.assertEqual(file.read(), bytes((0x20, 0x00, 0xA0)))
+            assembler = Assembler(InstructionSet(instructions, cycles), labels = {"print": 0xA000})
+            results = assembler.assembleBatch(os.path.join(directory, "first"), output)
+            self.assertEqual(results["assembled"], [os.path.join(directory, "first", "main.txt")])
+
+    def test_labels(self):
+        assembler = Assembler(InstructionSet(instructions))
+        machineCode = assembler.assemble("start:\nldx #$03\nloop:\ndex\nbne loop\nbbr0 $10,end\njmp start\nend:\nstp", 0x8000)
+        self.assertIsInstance(machineCode, bytes)
+        self.assertEqual(machineCode, bytes((0xA2, 0x03, 0xCA, 0xD0, 0xFD, 0x0F, 0x10, 0x03, 0x4C, 0x00, 0x80, 0xDB)))
+        self.assertEqual(assembler.labels, {"start": 0x8000, "loop": 0x8002, "end": 0x800B})
+        with self.assertRaises(AddressingMode.LabelAddressError):
+            Assembler(InstructionSet(instructions)).assemble("far:\n" + "nop\n" * 200 + "bne far")
+
+    def test_indexRegisters(self):
+        assembler = Assembler(InstructionSet(instructions))
+        self.assertEqual(assembler.assemble("sta $1234,x\nsta $1234,y\nlda ($12,x)\nlda ($12),y"), bytes((0x9D, 0x34, 0x12, 0x99, 0x34, 0x12, 0xA1, 0x12, 0xB1, 0x12)))
+
+# disassembler.py
+
+class Test_Disassembler(unittest.TestCase):
+    assembly = "start:\nldx #$03\nloop:\ndex\nbne loop\nbbr0 $10,end\nlda ($12),y\nsta $1234,x\njmp (start)\nend:\nstp"
+
+    def setUp(self):
+        self.instructionSet = InstructionSet(instructions, cycles)
+        self.machineCode = Assembler(self.instructionSet).assemble(Test_Disassembler.assembly, 0x8000)
+        self.rom = ROM(self.machineCode + bytes(32768 - len(self.machineCode)))
+        self.disassembler = Disassembler(self.instructionSet, MemoryMap(((0x8000, 0x10000, self.rom, False),)))
+
+    def test_listing(self):
+        self.rom.write(0x12, bytes((0x03,)))
+        self.assertEqual(self.disassembler.listing(0x8000, 0x8014).split("\n"), [
+            "8000  A2 03     LDX #$03",
+            "8002  CA        DEX",
+            "8003  D0 FD     BNE $8002",
+            "8005  0F 10 08  BBR0 $10,$8010",
+            "8008  B1 12     LDA ($12),y",
+            "800A  9D 34 12  STA $1234,x",
+            "800D  6C 00 80  JMP ($8000)",
+            "8010  DB        STP",
+            "8011  00        BRK",
+            "8012  03        .byte $03",
+            "8013  00        BRK"
+        ])
+        self.assertEqual(Disassembler(self.instructionSet, self.machineCode, 0x8000).disassemble(0x8000, 0x8011), self.disassembler.disassemble(0x8000, 0x8011))
+
+    def test_window(self):
+        self.assertEqual([instruction[0] for instruction in self.disassembler.window(0x8008, 3, 2)], [0x8002, 0x8003, 0x8005, 0x8008, 0x800A])
+
+    def test_cacheInvalidatedByWrite(self):
+        self.assertEqual(self.disassembler.decode(0x8002)[2], "DEX")
+        self.assertIs(self.disassembler.decode(0x8002), self.disassembler.decode(0x8002))
+        self.rom.write(2, bytes((0xE8,)))
+        self.assertEqual(self.disassembler.decode(0x8002)[2], "INX")
+        self.assertEqual(self.disassembler.decode(0x8000)[2], "LDX")
+        self.rom.write(1, bytes((0x07,)))
+        self.assertEqual(self.disassembler.decode(0x8000)[3], "#$07")
+
+# execution_trace.py
+
+class Test_TraceRecorder(unittest.TestCase):
+    def test_ringBuffer(self):
+        recorder = TraceRecorder(4)
+        for cycle in range(6):
+            recorder.record(0x8000 + cycle, 0xEA, 1, 2, 3, 0xFF, 0x30, 0x8000 + cycle, 0xEA, True)
+        self.assertEqual(len(recorder), 4)
+        self.assertEqual(recorder.count, 6)
+        self.assertEqual([record[0] for record in recorder.records()], [2, 3, 4, 5])
+        self.assertEqual(next(recorder.records()), (2, 0x8002, 0xEA, 1, 2, 3, 0xFF, 0x30, 0x8002, 0xEA, 1))
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fileName = os.path.join(directory, "trace.bin")
+            with TraceRecorder(8, fileName, chunkRecords = 3) as recorder:
+                for cycle in range(20):
+                    recorder.record(0x8000 + cycle, cycle, 0, 0, 0, 0, 0, cycle, cycle, cycle % 2)
+            reader = TraceReader(fileName, chunkRecords = 7)
+            self.assertEqual([record[0] for record in reader], list(range(20)))
+            self.assertEqual([record[0] for record in reader.filter(PC = (0x8004, 0x8010), RWB = 0)], [4, 6, 8, 10, 12, 14])
+            self.assertEqual([record[0] for record in reader.filter(lambda record: record[2] > 17)], [18, 19])
+            with self.assertRaises(ValueError):
+                tuple(reader.filter(Q = 1))
+
+    def test_processor(self):
+        processor = Processor(InstructionSet(instructions))
+        processor.setRegister("PC", bytes((0x12, 0x34)))
+        processor.setRegister("A", bytes((7,)))
+        processor.tracer = TraceRecorder(8)
+        processor.setPinState("VDD", (True, True))
+        processor.setPinState("VSS", (False, True))
+        for clock in (True, False, True):
+            processor.setPinState("PHI2", (clock, True))
+            processor.response()
+        self.assertEqual(list(processor.tracer.records()), [(0, 0x1234, 0, 7, 0, 0, 0, 0, 0x1234, 0, 1), (1, 0x1234, 0, 7, 0, 0, 0, 0, 0x1234, 0, 1)])
+
+# linker.py
+
+class Test_Linker(unittest.TestCase):
+    def objects(self, assembler: Assembler) -> [ObjectFile,]:
+        main = assembler.assembleObject("Count = $05\nstart:\nldx #Count\nloop:\njsr print\ndex\nbne loop\njmp start", externals = ("print",))
+        library = assembler.assembleObject("print:\nnop\nrts")
+        return main, library
+
+    def test_link(self):
+        assembler = Assembler(InstructionSet(instructions))
+        main, library = self.objects(assembler)
+        self.assertEqual(assembler.symbols, {})
+        self.assertEqual(main.sections["code"].exports, {"start": 0, "loop": 2})
+        self.assertEqual(ObjectFile.fromBytes(main.toBytes()).sections["code"].relocations, main.sections["code"].relocations)
+        linker = Linker(InstructionSet(instructions), {"code": (0x8000, 0x10000), "data": (0x0200, 0x8000)})
+        images = linker.link((main, library))
+        self.assertEqual(images, {"code": (0x8000, bytes((0xA2, 0x05, 0x20, 0x0B, 0x80, 0xCA, 0xD0, 0xFA, 0x4C, 0x00, 0x80, 0xEA, 0x60)))})
+        with self.assertRaises(Linker.UnresolvedSymbolError):
+            linker.link((main,))
+        with self.assertRaises(Linker.DuplicateSymbolError):
+            linker.link((main, library, library))
+        rom = ROM()
+        Linker.load(images, MemoryMap(((0x8000, 0x10000, rom, False),)))
+        self.assertEqual(bytes(rom[0:13]), images["code"][1])
+
+    def test_dynamicAddressingMode(self):
+        far = DynamicAddressingMode("Far", lambda operandString, labels: (bytes(3), ((1, operandString.strip()),)), lambda labelAddress, instructionAddress: labelAddress.to_bytes(3, "little"))
+        instructionSet = InstructionSet(instructions[:0x02] + ((DynamicOperation("CALLF", lambda processor, addressingMode: None), far),) + instructions[0x03:])
+        self.assertIn(far, instructionSet.addressingModes)
+        assembler = Assembler(instructionSet)
+        main = ObjectFile.fromBytes(assembler.assembleObject("callf print", externals = ("print",)).toBytes())
+        self.assertEqual(main.sections["code"].relocations, ((1, "print", "Far"),))
+        images = Linker(instructionSet, {"code": (0x8000, 0x10000)}).link((main, assembler.assembleObject("print:\nrts")))
+        self.assertEqual(images, {"code": (0x8000, bytes((0x02, 0x04, 0x80, 0x00, 0x60)))})
+
+    def test_assembleFileCache(self):
+        assembler = Assembler(InstructionSet(instructions))
+        with tempfile.TemporaryDirectory() as directory:
+            fileName = os.path.join(directory, "library.txt")
+            with open(fileName, "w") as file:
+                file.write("print:\nnop\nrts")
+            objectFile = assembler.assembleFile(fileName)
+            self.assertTrue(os.path.exists(os.path.join(directory, "library.o")))
+            self.assertEqual(assembler.assembleFile(fileName).sourceHash, objectFile.sourceHash)
+            assembler.assembleObject = None
+            self.assertEqual(assembler.assembleFile(fileName).sections["code"].data, bytes((0xEA, 0x60)))
+            del assembler.assembleObject
+            with open(fileName, "w") as file:
+                file.write("print:\nrts")
+            self.assertEqual(assembler.assembleFile(fileName).sections["code"].data, bytes((0x60,)))
+
+    def test_presetLabels(self):
+        assembler = Assembler(InstructionSet(instructions), labels = {"print": 0x9000})
+        self.assertRaises(Assembler.AssemblerError, assembler.assembleObject, "jsr print")
+        objectFile = assembler.assembleObject("jsr print", externals = ("print",))
+        self.assertEqual(objectFile.sections["code"].relocations, ((1, "print", "Absolute"),))
+
+# processor.py
+
+class Test_FunctionalCore(unittest.TestCase):
+    @staticmethod
+    def system(program: bytes, resetVector: int = 0x8000) -> [Processor, RAM, ROM, MemoryMap]:
+        rom = ROM()
+        image = bytearray(len(rom))
+        image[:len(program)] = program
+        image[0x7FFC:0x7FFE] = resetVector.to_bytes(2, "little")
+        rom.data = bytes(image)
+        ram = RAM()
+        memoryMap = MemoryMap(((0x0000, 0x8000, ram, True), (0x8000, 0x10000, rom, False)))
+        return Processor(InstructionSet(instructions)), ram, rom, memoryMap
+
+    def test_loopAndStore(self):
+        program = bytes((
+            0xA2, 0x05,         # LDX #$05
+            0xCA,               # DEX
+            0xD0, 0xFD,         # BNE -3
+            0xA9, 0x42,         # LDA #$42
+            0x8D, 0x00, 0x02,   # STA $0200
+            0xDB                # STP
+        ))
+        processor, ram, rom, memoryMap = Test_FunctionalCore.system(program)
+        core = processor.enterFunctionalMode(memoryMap)
+        core.reset()
+        self.assertEqual(0x8000, core.PC)
+        self.assertEqual(14, processor.executeInstructions(100))
+        self.assertTrue(core.stopped)
+        self.assertEqual(bytes((0x42,)), ram.read(0x0200))
+        self.assertEqual(0, core.X)
+
+    def test_subroutineAndStack(self):
+        program = bytes((
+            0x20, 0x05, 0x80,   # JSR $8005
+            0xDB,               # STP
+            0xEA,               # NOP
+            0xA9, 0x80,         # LDA #$80
+            0x48,               # PHA
+            0x68,               # PLA
+            0x60                # RTS
+        ))
+        processor, ram, rom, memoryMap = Test_FunctionalCore.system(program)
+        core = processor.enterFunctionalMode(memoryMap)
+        core.reset()
+        processor.executeInstructions(100)
+        self.assertTrue(core.stopped)
+        self.assertEqual(0x8004, core.PC)
+        self.assertEqual(0xFF, core.S)
+        self.assertTrue(core.P & StatusFlags.negative)
+
+    def test_addWithCarry(self):
+        for test in range(10):
+            A, value, carry = random.randint(0, 255), random.randint(0, 255), random.randint(0, 1)
+            program = bytes((0x18 + 0x20 * carry, 0x69, value, 0xDB)) # CLC/SEC, ADC #value, STP
+            processor, ram, rom, memoryMap = Test_FunctionalCore.system(program)
+            core = processor.enterFunctionalMode(memoryMap)
+            core.reset()
+            core.A = A
+            processor.executeInstructions(3)
+            self.assertEqual((A + value + carry) & 0xFF, core.A)
+            self.assertEqual(A + value + carry > 0xFF, bool(core.P & StatusFlags.carry))
+
+    def test_modeSwitching(self):
+        processor, ram, rom, memoryMap = Test_FunctionalCore.system(bytes((0xA0, 0x07, 0xDB))) # LDY #$07, STP
+        processor.setRegister("PC", bytes((0x80, 0x00)))
+        processor.setRegister("X", bytes((0x33,)))
+        core = processor.enterFunctionalMode(memoryMap)
+        self.assertEqual(0x33, core.X)
+        self.assertRaises(Processor.ExecutionModeError, processor.enterFunctionalMode, memoryMap)
+        processor.executeInstructions(2)
+        processor.exitFunctionalMode()
+        self.assertIsNone(processor.functionalCore)
+        self.assertEqual(bytes((0x07,)), processor.getRegister("Y"))
+        self.assertEqual(bytes((0x80, 0x03)), processor.getRegister("PC"))
+        self.assertRaises(Processor.ExecutionModeError, processor.executeInstructions, 1)
+        processor.setRegister("TCU", bytes((2,)))
+        self.assertRaises(Processor.ExecutionModeError, processor.enterFunctionalMode, memoryMap)
+
+    def test_rawStores(self):
+        processor, ram, rom, memoryMap = Test_FunctionalCore.system(bytes((0xA9, 0x42, 0x8D, 0x00, 0x02, 0xDB))) # LDA #$42, STA $0200, STP
+        core = processor.enterFunctionalMode(memoryMap)
+        core.reset()
+        ram.respond()
+        version = ram.pageVersion(0x02)
+        processor.executeInstructions(3)
+        self.assertEqual(ram[0x0200], bytes((0x42,)))
+        self.assertGreater(ram.pageVersion(0x02), version)
+        self.assertFalse(ram.stimulated)
+        core.write(0x8000, 0xFF)
+        self.assertEqual(rom[0], bytes((0xA9,)))
+        processor.exitFunctionalMode()
+        self.assertTrue(ram.stimulated)
+
+    def test_translatedMatchesInterpreted(self):
+        program = bytes((
+            0xA2, 0x00,         # LDX #$00
+            0xBD, 0x00, 0x81,   # LDA $8100,X
+            0x9D, 0x00, 0x03,   # STA $0300,X
+            0xE8,               # INX
+            0xD0, 0xF7,         # BNE -9
+            0x20, 0x12, 0x80,   # JSR $8012
+            0xDB,               # STP
+            0xEA, 0xEA, 0xEA,   # NOP padding
+            0x69, 0x01,         # ADC #$01
+            0x60                # RTS
+        )) + bytes(0x100 - 21) + bytes(range(255, -1, -1))
+        results = list()
+        for translate in False, True:
+            processor, ram, rom, memoryMap = Test_FunctionalCore.system(program)
+            core = processor.enterFunctionalMode(memoryMap, translate)
+            core.reset()
+            executed = processor.executeInstructions(5000)
+            results.append((executed, core.instructions, core.PC, core.IR, core.A, core.X, core.P, core.S, bytes(ram.data)))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(bytes(range(255, -1, -1)), results[1][-1][0x300:0x400])
+
+    def test_translationInvalidatedByWrite(self):
+        processor, ram, rom, memoryMap = Test_FunctionalCore.system(bytes(), 0x0200)
+        ram[0x0200:0x0206] = bytes((0xA9, 0x01, 0x8D, 0x00, 0x03, 0xDB)) # LDA #$01, STA $0300, STP
+        core = processor.enterFunctionalMode(memoryMap, True)
+        core.reset()
+        self.assertEqual(3, core.run(10))
+        self.assertIn(0x0200, core.blocks)
+        self.assertEqual(bytes((0x01,)), ram[0x0300])
+        core.write(0x0201, 0x07)
+        self.assertNotIn(0x0200, core.blocks)
+        core.PC, core.stopped = 0x0200, False
+        core.run(10)
+        self.assertEqual(bytes((0x07,)), ram[0x0300])
+
+    def test_translationInvalidatedByMemoryWrite(self):
+        processor, ram, rom, memoryMap = Test_FunctionalCore.system(bytes(), 0x0200)
+        ram[0x0200:0x0206] = bytes((0xA9, 0x01, 0x8D, 0x00, 0x03, 0xDB)) # LDA #$01, STA $0300, STP
+        snapshot = ram.snapshot()
+        core = processor.enterFunctionalMode(memoryMap, True)
+        core.reset()
+        core.run(10)
+        ram[0x0201] = bytes((0x07,))
+        core.PC, core.stopped = 0x0200, False
+        core.run(10)
+        self.assertEqual(bytes((0x07,)), ram[0x0300])
+        ram.restore(snapshot)
+        core.PC, core.stopped = 0x0200, False
+        core.run(10)
+        self.assertEqual(bytes((0x01,)), ram[0x0300])
+
+    def test_selfModifyingBlock(self):
+        program = bytes((0xA9, 0x07, 0x8D, 0x06, 0x02, 0xA2, 0x01, 0xDB)) # LDA #$07, STA $0206, LDX #$01, STP
+        results = list()
+        for translate in False, True:
+            processor, ram, rom, memoryMap = Test_FunctionalCore.system(bytes(), 0x0200)
+            ram[0x0200:0x0200 + len(program)] = program
+            core = processor.enterFunctionalMode(memoryMap, translate)
+            core.reset()
+            executed = core.run(10)
+            results.append((executed, core.instructions, core.PC, core.IR, core.A, core.X))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(0x07, results[1][5])
+
+    def test_snapshotKeepsCoreRegisters(self):
+        processor, ram, rom, memoryMap = Test_FunctionalCore.system(bytes((0xA9, 0x42, 0xA2, 0x13, 0xDB))) # LDA #$42, LDX #$13, STP
+        core = processor.enterFunctionalMode(memoryMap)
+        core.reset()
+        processor.executeInstructions(2)
+        registers = processor.getRegisters(slice(None))
+        snapshot = processor.snapshot()
+        self.assertEqual(processor.getRegisters(slice(None)), registers)
+        self.assertEqual((snapshot["registers"][processor.registers.index("A")], snapshot["registers"][processor.registers.index("X")]), (bytes((0x42,)), bytes((0x13,))))
+        processor.executeInstructions(1)
+        self.assertTrue(core.stopped)
+        core.A = core.X = 0
+        processor.restore(snapshot)
+        self.assertEqual((core.A, core.X, core.PC), (0x42, 0x13, 0x8004))
+        self.assertFalse(core.stopped)
+
+
+# simulator.py
+
+class Test_Scheduler(unittest.TestCase):
+    @staticmethod
+    def clockedGate() -> [PowerSupply, Clock, NAND, Resistor]:
+        powerSupply = PowerSupply()
+        clock = Clock(connections = ((powerSupply, (("VCC", "Power"), ("GND", "Ground"))),))
+        nand = NAND(connections = (
+            (powerSupply, (("VCC", "Power"), ("GND", "Ground"), ("B1", "Power"))),
+            (clock, (("A1", "Output"),))
+        ))
+        resistor = Resistor(connections = ((powerSupply, ((1, "Power"),)),))
+        return powerSupply, clock, nand, resistor
+
+    def test_recompilesOnlyOnOwnTopology(self):
+        powerSupply, clock, nand, resistor = Test_Scheduler.clockedGate()
+        scheduler = Scheduler((powerSupply, clock, nand, resistor))
+        scheduler.settle()
+        self.assertTrue(scheduler.compiled())
+        Test_Scheduler.clockedGate()
+        NAND(connections = ((PowerSupply(), (("VCC", "Power"),)),))
+        self.assertTrue(scheduler.compiled())
+        resistor.connectPin(2, nand, "B2")
+        self.assertFalse(scheduler.compiled())
+        scheduler.settle()
+        self.assertTrue(scheduler.compiled())
+
+    def test_settledCircuitIsIdle(self):
+        scheduler = Scheduler(Test_Scheduler.clockedGate())
+        scheduler.settle()
+        evaluations = scheduler.evaluations
+        self.assertEqual(0, scheduler.settle())
+        self.assertEqual(evaluations, scheduler.evaluations)
+
+    def test_onlyAffectedComponentsEvaluated(self):
+        powerSupply, clock, nand, resistor = Test_Scheduler.clockedGate()
+        scheduler = Scheduler((powerSupply, clock, nand, resistor))
+        scheduler.settle()
+        for test in range(4):
+            clock.step()
+            evaluations = scheduler.evaluations
+            scheduler.settle()
+            self.assertLessEqual(scheduler.evaluations - evaluations, 4)
+            self.assertFalse(resistor.stimulated)
+            self.assertEqual(not clock.output, nand.getPin("Y1"))
+
+    def test_stimulatedComponentEvaluated(self):
+        powerSupply, clock, nand, resistor = Test_Scheduler.clockedGate()
+        scheduler = Scheduler((powerSupply, clock, nand, resistor))
+        scheduler.settle()
+        powerSupply.turnOff()
+        self.assertTrue(powerSupply.stimulated)
+        scheduler.settle()
+        self.assertFalse(powerSupply.stimulated)
+        clock.retrievePinStates()
+        self.assertEqual((False, True), clock.getPinState("VCC"))
+
+class Test_Condition(unittest.TestCase):
+    @staticmethod
+    def counter() -> Simulator:
+        def step(components: {str: Component}):
+            processor = components["CPU"]
+            processor.setRegister("A", bytes(((processor.getRegister("A")[0] + 1) % 256,)))
+            components["RAM"][processor.getRegister("A")[0]] = processor.getRegister("A")
+        return Simulator({"CPU": Processor(InstructionSet(instructions)), "RAM": RAM()}, step)
+
+    def test_targets(self):
+        simulator = Test_Condition.counter()
+        simulator.step()
+        self.assertTrue(Condition(simulator, "A==1")())
+        self.assertTrue(Condition(simulator, "CPU.A >= 1")())
+        self.assertTrue(Condition(simulator, "RAM[0x01]==1")())
+        self.assertFalse(Condition(simulator, "CPU:RWB!=0")())
+        for expression in "A=1", "RAM.A==1", "CPU[0]==1", "CPU.A==one":
+            self.assertRaises(Exception, Condition, simulator, expression)
+
+    def test_runUntil(self):
+        simulator = Test_Condition.counter()
+        steps, condition = simulator.run(100, ("A==200", "RAM[5]==5"))
+        self.assertEqual((steps, str(condition)), (5, "RAM[5]==5"))
+        self.assertEqual(simulator.run(3, ("A==200",)), (3, None))
+
+class Test_Snapshot(unittest.TestCase):
+    def test_restore(self):
+        simulator = Test_Condition.counter()
+        simulator.run(3)
+        snapshot = simulator.snapshot()
+        simulator.run(4)
+        simulator.getComponent("CPU").setPinState("RWB", (True, True))
+        simulator.restore(snapshot)
+        self.assertTrue(Condition(simulator, "A==3")())
+        self.assertTrue(Condition(simulator, "RAM[4]==0")())
+        self.assertEqual(simulator.getComponent("CPU").getPinState("RWB"), (False, False))
+
+    def test_stepBack(self):
+        simulator = Test_Condition.counter()
+        self.assertEqual(simulator.stepBack(), 0)
+        simulator.historyLength = 4
+        simulator.run(6)
+        self.assertEqual(len(simulator.history), 4)
+        self.assertEqual(simulator.stepBack(2), 2)
+        self.assertTrue(Condition(simulator, "A==4")())
+        self.assertTrue(Condition(simulator, "RAM[5]==0")())
+        self.assertEqual(simulator.stepBack(5), 2)
+        self.assertTrue(Condition(simulator, "A==2")())
 
 if __name__ == "__main__":
     unittest.main()